@@ -0,0 +1,581 @@
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+import global_number
+import heat_transfer_coefficient
+import ventilation_wall as vw
+import ventilation_wall_parameters as vwp
+import ventilation_wall_simplified as vws
+from dataclasses import replace
+
+
+def get_sample_parameters(sample_size: int = None, seed: int = 0) -> list:
+    """
+    総当たりのパラメータリストから、ベンチマーク用の計算条件パラメータ群のリストを作成する
+
+    :param sample_size: 抽出するケース数（Noneの場合は全ケース）
+    :param seed:        乱数のシード値
+    :return:            計算条件パラメータ群のリスト
+    """
+    grid = vwp.ParameterGrid()
+    if sample_size is None:
+        return [vw.Parameters(*row) for row in grid]
+
+    rng = np.random.default_rng(seed)
+    index = np.sort(rng.choice(len(grid), size=sample_size, replace=False))
+
+    return [vw.Parameters(*grid[i]) for i in index]
+
+
+def get_benchmark_result(parms: list, calc_mode_h_cv: str, calc_mode_h_rv: str, tolerance: float = 1.0e-6,
+                         **kwargs) -> dict:
+    """
+    指定した条件でget_wall_status_valuesを全ケース実行し、計算時間、評価回数、収束しなかったケース数、
+    収束したが熱収支の残差が許容値を超えるケース数を集計する
+
+    :param parms:           計算条件パラメータ群のリスト
+    :param calc_mode_h_cv:  対流熱伝達率の計算モード
+    :param calc_mode_h_rv:  放射熱伝達率の計算モード
+    :param tolerance:       熱収支の残差の許容値, W/m2
+    :param kwargs:          get_wall_status_valuesに渡すその他の引数
+    :return: 集計結果
+    """
+
+    # 固定値の設定
+    h_out = global_number.get_h_out()
+    h_in = global_number.get_h_in()
+
+    start = time.perf_counter()
+    status_list = [vw.get_wall_status_values(parm, calc_mode_h_cv, calc_mode_h_rv, h_out, h_in, **kwargs)
+                   for parm in parms]
+    elapsed_time = time.perf_counter() - start
+
+    return {
+        'calc_mode_h_cv': calc_mode_h_cv,
+        'calc_mode_h_rv': calc_mode_h_rv,
+        'n_case': len(parms),
+        'elapsed_time': elapsed_time,
+        'nfev': sum(status.optimize_nfev for status in status_list),
+        'njev': sum(status.optimize_njev for status in status_list),
+        'n_failure': sum(not status.is_optimize_succeed for status in status_list),
+        'n_residual_over_tolerance': sum(status.is_optimize_succeed and np.max(np.abs(status.matrix_heat_balance)) > tolerance
+                                         for status in status_list)
+    }
+
+
+def benchmark_jacobian(calc_mode_h_cv: str = "detailed", calc_mode_h_rv: str = "detailed",
+                       sample_size: int = None) -> pd.DataFrame:
+    """
+    熱収支式の収束計算について、ヤコビ行列を差分近似で求める場合と解析解を与える場合の
+    計算時間、熱収支式の評価回数、収束しなかったケース数を比較する
+
+    :param calc_mode_h_cv:  対流熱伝達率の計算モード
+    :param calc_mode_h_rv:  放射熱伝達率の計算モード
+    :param sample_size:     計算するケース数（Noneの場合は全ケース）
+    :return: 比較結果のDataFrame
+    """
+
+    parms = get_sample_parameters(sample_size)
+
+    result = []
+    for is_analytic_jacobian in [False, True]:
+        result.append({'jacobian': 'analytic' if is_analytic_jacobian else 'finite_difference',
+                       **get_benchmark_result(parms, calc_mode_h_cv, calc_mode_h_rv,
+                                              is_analytic_jacobian=is_analytic_jacobian)})
+
+    df = pd.DataFrame(result)
+    print(df)
+
+    return df
+
+
+def benchmark_solver_mode(sample_size: int = None) -> pd.DataFrame:
+    """
+    熱収支式の解法（5点の熱収支式、縮約した3点の熱収支式）による計算時間、評価回数、収束しなかったケース数を
+    ventilation_wall_parameters.dump_csv_all_case_resultで使用する計算モードの組み合わせごとに比較する
+
+    :param sample_size:     計算するケース数（Noneの場合は全ケース）
+    :return: 比較結果のDataFrame
+    """
+
+    parms = get_sample_parameters(sample_size)
+
+    calc_modes = [('detailed', 'detailed'), ('detailed', 'simplified_winter'), ('detailed', 'simplified_zero'),
+                  ('simplified_winter', 'detailed'), ('simplified_winter', 'simplified_winter')]
+
+    result = []
+    for calc_mode_h_cv, calc_mode_h_rv in calc_modes:
+        for solver_mode in ['full', 'reduced']:
+            result.append({'solver_mode': solver_mode,
+                           **get_benchmark_result(parms, calc_mode_h_cv, calc_mode_h_rv, solver_mode=solver_mode)})
+
+    df = pd.DataFrame(result)
+    print(df)
+
+    return df
+
+
+def benchmark_warm_start(calc_mode_h_cv: str = "detailed", calc_mode_h_rv: str = "detailed",
+                         n_fixed_parameter: int = 2) -> pd.DataFrame:
+    """
+    総当たりのパラメータリストの順に線形補間の初期値で計算する場合と、パラメータの違いが最小となる順に
+    隣接するケースの計算結果を初期値として計算する場合の計算時間、評価回数、収束しなかったケース数を比較する
+    （隣接するケースの計算結果で収束せず、線形補間の初期値で再計算した場合の評価回数は合算する）
+
+    :param calc_mode_h_cv:      対流熱伝達率の計算モード
+    :param calc_mode_h_rv:      放射熱伝達率の計算モード
+    :param n_fixed_parameter:   先頭から数えて、最初の値に固定するパラメータの数（計算ケース数の削減用）
+    :return: 比較結果のDataFrame
+    """
+
+    # 固定値の設定
+    h_out = global_number.get_h_out()
+    h_in = global_number.get_h_in()
+
+    parameter_values = vwp.get_parameter_values()
+    parameter_values = [values[:1] for values in parameter_values[:n_fixed_parameter]] + parameter_values[n_fixed_parameter:]
+    parameter_list = vwp.get_parameter_list(parameter_values)
+    shape = tuple(len(values) for values in parameter_values)
+
+    result = []
+    for is_warm_start in [False, True]:
+        start = time.perf_counter()
+        if is_warm_start:
+            status_list = vwp.get_wall_status_list_by_warm_start(parameter_list, shape, calc_mode_h_cv, calc_mode_h_rv,
+                                                                 h_out, h_in)
+        else:
+            status_list = [vw.get_wall_status_values(vw.Parameters(*row), calc_mode_h_cv, calc_mode_h_rv, h_out, h_in)
+                           for row in parameter_list]
+        elapsed_time = time.perf_counter() - start
+
+        result.append({
+            'initial_guess': 'warm_start' if is_warm_start else 'linear',
+            'calc_mode_h_cv': calc_mode_h_cv,
+            'calc_mode_h_rv': calc_mode_h_rv,
+            'n_case': len(parameter_list),
+            'elapsed_time': elapsed_time,
+            'nfev': sum(status.optimize_nfev for status in status_list),
+            'njev': sum(status.optimize_njev for status in status_list),
+            'n_failure': sum(not status.is_optimize_succeed for status in status_list)
+        })
+
+    df = pd.DataFrame(result)
+    print(df)
+
+    return df
+
+
+def benchmark_initial_guess(sample_size: int = None) -> pd.DataFrame:
+    """
+    収束計算の初期値の設定方法（外気温度と室内温度の線形補間、簡易計算法案No.1の計算結果）による
+    計算時間、評価回数、収束しなかったケース数を、詳細計算の計算モードの組み合わせごとに比較する
+
+    :param sample_size:     計算するケース数（Noneの場合は全ケース）
+    :return: 比較結果のDataFrame
+    """
+
+    parms = get_sample_parameters(sample_size)
+
+    calc_modes = [('detailed', 'detailed'), ('detailed', 'simplified_winter'), ('simplified_winter', 'detailed')]
+
+    result = []
+    for calc_mode_h_cv, calc_mode_h_rv in calc_modes:
+        for initial_guess in ['linear', 'simplified_no_01']:
+            result.append({'initial_guess': initial_guess,
+                           **get_benchmark_result(parms, calc_mode_h_cv, calc_mode_h_rv, initial_guess=initial_guess)})
+
+    df = pd.DataFrame(result)
+    print(df)
+
+    return df
+
+
+def benchmark_air_properties(n_call: int = 100000, array_size: int = 100000) -> pd.DataFrame:
+    """
+    ヌセルト数の計算に用いる空気の物性値について、物性値ごとの関数を個別に呼び出す場合（変更前の
+    heat_transfer_coefficient.get_nusselt_numberと同じ呼び出し）と、global_number.get_air_propertiesで
+    まとめて計算する場合の1回あたりの計算時間を比較する
+
+    :param n_call:      スカラー版の呼び出し回数
+    :param array_size:  配列版の要素数
+    :return: 比較結果のDataFrame
+    """
+
+    def get_rayleigh_prefactor_separately(t):
+        # プラントル数（未使用）とレーリー数の物性値部分を、物性値ごとの関数で計算する
+        global_number.get_pr_air(t)
+        return (global_number.get_g() * global_number.get_beta_air(t) * (global_number.get_rho_air(t) ** 2)
+                * global_number.get_c_air(t)) / (global_number.get_mu_air(t) * global_number.get_lambda_air(t))
+
+    def get_rayleigh_prefactor_fused(t):
+        return global_number.get_air_properties(t)[5]
+
+    rng = np.random.default_rng(0)
+    temperatures = rng.uniform(-20.0, 80.0, n_call).tolist()
+    temperature_array = rng.uniform(-20.0, 80.0, array_size)
+
+    result = []
+    for method, function in [('separate', get_rayleigh_prefactor_separately), ('fused', get_rayleigh_prefactor_fused)]:
+        start = time.perf_counter()
+        for t in temperatures:
+            function(t)
+        elapsed_time_scalar = time.perf_counter() - start
+
+        # 配列版は10回の平均とする
+        start = time.perf_counter()
+        for _ in range(10):
+            function(temperature_array)
+        elapsed_time_array = (time.perf_counter() - start) / 10
+
+        result.append({
+            'method': method,
+            'time_per_call_scalar_us': elapsed_time_scalar / n_call * 1.0e6,
+            'time_per_element_array_ns': elapsed_time_array / array_size * 1.0e9
+        })
+
+    df = pd.DataFrame(result)
+    print(df)
+
+    return df
+
+
+def benchmark_air_property_table(resolutions: list = None, n_call: int = 100000,
+                                 array_size: int = 100000) -> pd.DataFrame:
+    """
+    空気の物性値を計算式で直接計算する場合と、物性値表（global_number.AirPropertyTable）の線形補間で求める場合の
+    1回あたりの計算時間と、物性値表の刻み幅ごとの相対誤差の最大値を比較する
+
+    :param resolutions: 物性値表の刻み幅のリスト, K（Noneの場合は0.5、0.1、0.05、0.01）
+    :param n_call:      スカラー版の呼び出し回数
+    :param array_size:  配列版の要素数
+    :return: 比較結果のDataFrame
+    """
+
+    if resolutions is None:
+        resolutions = [0.5, 0.1, 0.05, 0.01]
+
+    rng = np.random.default_rng(0)
+    temperatures = rng.uniform(-20.0, 80.0, n_call).tolist()
+    temperature_array = rng.uniform(-20.0, 80.0, array_size)
+
+    def get_elapsed_time(function) -> tuple:
+        start = time.perf_counter()
+        for t in temperatures:
+            function(t)
+        elapsed_time_scalar = time.perf_counter() - start
+
+        # 配列版は10回の平均とする
+        start = time.perf_counter()
+        for _ in range(10):
+            function(temperature_array)
+        elapsed_time_array = (time.perf_counter() - start) / 10
+
+        return elapsed_time_scalar / n_call * 1.0e6, elapsed_time_array / array_size * 1.0e9
+
+    time_scalar, time_array = get_elapsed_time(lambda t: global_number.get_air_properties(t, is_tabulated=False))
+    result = [{'method': 'exact', 'resolution': np.nan, 'n_point': 0,
+               'time_per_call_scalar_us': time_scalar, 'time_per_element_array_ns': time_array}]
+
+    for resolution in resolutions:
+        table = global_number.AirPropertyTable(resolution=resolution)
+        time_scalar, time_array = get_elapsed_time(table.get_air_properties)
+        max_relative_error = table.get_max_relative_error()
+        result.append({'method': 'table', 'resolution': resolution, 'n_point': len(table.temperature),
+                       'time_per_call_scalar_us': time_scalar, 'time_per_element_array_ns': time_array,
+                       **{'max_relative_error_' + name: value for name, value in max_relative_error.items()}})
+
+    df = pd.DataFrame(result)
+    print(df)
+
+    return df
+
+
+def benchmark_convective_calc_mode(sample_size: int = None, calc_mode_h_rv: str = "detailed",
+                                   calc_modes_h_cv: list = None, tolerance: float = 1.0e-6) -> pd.DataFrame:
+    """
+    対流熱伝達率の計算モード（ヌセルト数を計算式で求める"detailed"、区分の切り替えを滑らかにした"detailed_smooth"）による計算時間、評価回数、収束しなかったケース数、
+    収束したが熱収支の残差が許容値を超えるケース数と、"detailed"に対する各部温度の差を比較する
+
+    :param sample_size:     計算するケース数（Noneの場合は全ケース）
+    :param calc_mode_h_rv:  放射熱伝達率の計算モード
+    :param calc_modes_h_cv: 比較する対流熱伝達率の計算モードのリスト（先頭を温度差の基準とする）
+    :param tolerance:       熱収支の残差の許容値, W/m2
+    :return: 比較結果のDataFrame
+    """
+
+    # 固定値の設定
+    h_out = global_number.get_h_out()
+    h_in = global_number.get_h_in()
+
+    if calc_modes_h_cv is None:
+        calc_modes_h_cv = ['detailed', 'detailed_smooth']
+
+    parms = get_sample_parameters(sample_size)
+
+    result = []
+    matrix_temp_detailed = None
+    for calc_mode_h_cv in calc_modes_h_cv:
+        start = time.perf_counter()
+        status_list = [vw.get_wall_status_values(parm, calc_mode_h_cv, calc_mode_h_rv, h_out, h_in) for parm in parms]
+        elapsed_time = time.perf_counter() - start
+
+        matrix_temp = np.array([status.matrix_temp for status in status_list])
+        if matrix_temp_detailed is None:
+            matrix_temp_detailed = matrix_temp
+        temperature_difference = np.max(np.abs(matrix_temp - matrix_temp_detailed), axis=1)
+        nfev = np.array([status.optimize_nfev for status in status_list])
+
+        result.append({
+            'calc_mode_h_cv': calc_mode_h_cv,
+            'calc_mode_h_rv': calc_mode_h_rv,
+            'n_case': len(parms),
+            'elapsed_time': elapsed_time,
+            'nfev': int(np.sum(nfev)),
+            'njev': sum(status.optimize_njev for status in status_list),
+            'max_nfev_per_case': int(np.max(nfev)),
+            'n_failure': sum(not status.is_optimize_succeed for status in status_list),
+            'n_residual_over_tolerance': sum(status.is_optimize_succeed
+                                             and np.max(np.abs(status.matrix_heat_balance)) > tolerance
+                                             for status in status_list),
+            'max_temperature_difference': np.nanmax(temperature_difference),
+            'p999_temperature_difference': np.nanquantile(temperature_difference, 0.999)
+        })
+
+    df = pd.DataFrame(result)
+    print(df)
+
+    return df
+
+
+def benchmark_smooth_nusselt_number(n_sample_rayleigh: int = 20000) -> pd.DataFrame:
+    """
+    区分の切り替えを滑らかにしたヌセルト数（"detailed_smooth"）の、文献の計算式（"detailed"）に対する差を傾斜角ごとに集計する
+    （傾斜角0°<γ≤60°の1708≤Ra・cosγ<5830の区分は、"detailed"の式に「1 +」が無いため別に集計する）
+
+    :param n_sample_rayleigh:   レーリー数の点数（10^-2～10^10の対数等間隔）
+    :return: 集計結果のDataFrame
+    """
+
+    rayleigh_number = np.logspace(-2.0, 10.0, n_sample_rayleigh)
+    grid = vwp.ParameterGrid()
+    parameter_values = dict(zip(grid.parameter_name, grid.parameter_values))
+
+    result = []
+    for angle in parameter_values['angle'].tolist():
+        relative_difference = []
+        band_difference = [0.0]
+        for l_h in parameter_values['l_h'].tolist():
+            for l_d in parameter_values['l_d'].tolist():
+                nu_exact = heat_transfer_coefficient.get_nusselt_number_by_rayleigh_array(rayleigh_number, angle, l_h, l_d)
+                nu_smooth, _ = heat_transfer_coefficient._get_nusselt_number_smooth_by_rayleigh(rayleigh_number, angle,
+                                                                                                 l_h, l_d)
+                buff = rayleigh_number * np.cos(np.radians(angle))
+                is_band = (0.0 < angle <= 60.0) & (buff >= 1708.0) & (buff < 5830.0)
+                relative_difference.append(np.abs(nu_smooth - nu_exact)[~is_band] / nu_exact[~is_band])
+                band_difference.append(np.max(np.abs(nu_smooth - nu_exact)[is_band], initial=0.0))
+        result.append({
+            'angle': angle,
+            'max_relative_difference': np.max(np.concatenate(relative_difference)),
+            'max_difference_1708_5830': max(band_difference)
+        })
+
+    df = pd.DataFrame(result)
+    print(df)
+
+    return df
+
+
+def benchmark_batch_memory(n_case: int = None) -> pd.DataFrame:
+    """
+    総当たりのパラメータ、計算結果を、ケースごとのdataclass（Parameters、WallStatusValues）のリストで保持する場合と、
+    配列（ParameterBatch、WallStatusBatch）で保持する場合のメモリ使用量を比較する
+    ケースごとの計算結果は、1ケースの計算結果の配列を複写して作成する（終了メッセージの文字列は共有する）
+
+    :param n_case:  ケース数（Noneの場合は総当たりのパラメータの全ケース）
+    :return: 比較結果のDataFrame
+    """
+
+    # 固定値の設定
+    h_out = global_number.get_h_out()
+    h_in = global_number.get_h_in()
+
+    grid = vwp.ParameterGrid()
+    if n_case is not None:
+        grid = grid[:n_case]
+    status = vw.get_wall_status_values(vw.Parameters(*grid[0]), "detailed", "detailed", h_out, h_in)
+
+    # ケースごとのdataclassのリスト
+    tracemalloc.start()
+    parms = [vw.Parameters(*row) for row in grid]
+    status_list = [vw.WallStatusValues(matrix_temp=status.matrix_temp.copy(),
+                                       matrix_heat_balance=status.matrix_heat_balance.copy(), h_cv=status.h_cv,
+                                       h_rv=status.h_rv, is_optimize_succeed=status.is_optimize_succeed,
+                                       optimize_status=status.optimize_status, optimize_message=status.optimize_message,
+                                       optimize_nfev=status.optimize_nfev, optimize_njev=status.optimize_njev)
+                   for _ in range(len(parms))]
+    memory_list, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del parms
+
+    # 配列（状態値はdataclassのリストから変換する）
+    tracemalloc.start()
+    parm_batch = vwp.get_parameter_batch_from_data_frame(grid.get_data_frame())
+    status_batch = vw.get_wall_status_batch(status_list)
+    memory_batch, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = [{'container': 'Parameters + WallStatusValues', 'n_case': len(grid), 'memory_mb': memory_list / 1e6},
+              {'container': 'ParameterBatch + WallStatusBatch', 'n_case': len(grid), 'memory_mb': memory_batch / 1e6}]
+    del status_list, parm_batch, status_batch
+
+    df = pd.DataFrame(result)
+    df['bytes_per_case'] = df['memory_mb'] * 1e6 / df['n_case']
+    print(df)
+
+    return df
+
+
+def get_synthetic_climate(n_hour: int = 8760, theta_e_resolution: float = 0.1) -> tuple:
+    """
+    時系列計算のベンチマーク用に、外気温度、日射量の日変化、年変化を正弦波で与えた合成の気象データを作成する
+    （外気温度は気象データと同じく所定の刻みに丸め、夜間の日射量はゼロとする）
+
+    :param n_hour:              時刻数
+    :param theta_e_resolution:  外気温度の刻み, K
+    :return: 外気温度 (T,), degC、外気側表面に入射する日射量 (T,), W/m2
+    """
+
+    hour = np.arange(n_hour)
+    day = hour / 24.0
+
+    # 外気温度（年平均15degC、年較差±10K、日較差±5K）
+    theta_e = 15.0 - 10.0 * np.cos(2.0 * np.pi * (day - 15.0) / 365.0) \
+        + 5.0 * np.sin(2.0 * np.pi * (hour % 24 - 9.0) / 24.0)
+    theta_e = np.round(theta_e / theta_e_resolution) * theta_e_resolution
+
+    # 日射量（6時から18時まで、正午に最大）
+    j_surf = np.round(np.maximum(0.0, 600.0 * np.sin(np.pi * (hour % 24 - 6.0) / 12.0)))
+
+    return theta_e, j_surf
+
+
+def benchmark_time_series(calc_mode_h_cv: str = "detailed", calc_mode_h_rv: str = "detailed",
+                          n_hour: int = 8760, theta_e_resolution: float = 0.1) -> pd.DataFrame:
+    """
+    合成の気象データ（get_synthetic_climateを参照）による時系列計算について、各時刻を線形補間の初期値で計算する場合と、
+    直前の時刻の計算結果を初期値とし、境界条件が変わらない時刻の収束計算を省略する場合の計算時間、評価回数、
+    収束しなかった時刻数、熱収支が数値とならない時刻数、各部温度の最大差を比較する
+    （各部温度の最大差は、線形補間の初期値による計算結果との差で、双方の熱収支が数値となる時刻のみを対象とする。
+    外気温度と室内温度が等しい時刻は、線形補間の初期値では各部温度が一様となり対流熱伝達率がゼロとなるため、
+    熱収支が数値とならない場合がある）
+
+    :param calc_mode_h_cv:      対流熱伝達率の計算モード
+    :param calc_mode_h_rv:      放射熱伝達率の計算モード
+    :param n_hour:              時刻数
+    :param theta_e_resolution:  外気温度の刻み, K
+    :return: 比較結果のDataFrame
+    """
+
+    # 固定値の設定
+    h_out = global_number.get_h_out()
+    h_in = global_number.get_h_in()
+
+    theta_e, j_surf = get_synthetic_climate(n_hour, theta_e_resolution)
+    theta_r = np.full(n_hour, 20.0)
+    v_a = np.full(n_hour, 0.5)
+    parm = vw.Parameters(theta_e=0.0, theta_r=20.0, J_surf=0.0, a_surf=0.8, C_1=6.0, C_2=2.55, l_h=3.0, l_w=0.5,
+                         l_d=0.05, angle=90.0, v_a=0.5, l_s=0.45, emissivity_1=0.9, emissivity_2=0.9)
+
+    result = []
+    matrix_temp_reference = None
+    for is_warm_start, is_skip_unchanged in [(False, False), (True, False), (True, True)]:
+        start = time.perf_counter()
+        status_batch = vw.get_wall_status_time_series(parm, theta_e, theta_r, j_surf, v_a, calc_mode_h_cv,
+                                                      calc_mode_h_rv, h_out, h_in, is_warm_start=is_warm_start,
+                                                      is_skip_unchanged=is_skip_unchanged)
+        elapsed_time = time.perf_counter() - start
+        is_finite = np.isfinite(status_batch.matrix_heat_balance).all(axis=1)
+        if matrix_temp_reference is None:
+            matrix_temp_reference = status_batch.matrix_temp
+            is_finite_reference = is_finite
+
+        result.append({
+            'is_warm_start': is_warm_start,
+            'is_skip_unchanged': is_skip_unchanged,
+            'n_hour': n_hour,
+            'elapsed_time': elapsed_time,
+            'nfev': int(status_batch.optimize_iteration.sum()),
+            'n_skipped': int((status_batch.optimize_iteration == 0).sum()),
+            'n_failure': int((~status_batch.is_optimize_succeed).sum()),
+            'n_nonfinite': int((~is_finite).sum()),
+            'max_temp_difference': float(np.abs(status_batch.matrix_temp - matrix_temp_reference)
+                                         [is_finite & is_finite_reference].max())
+        })
+
+    df = pd.DataFrame(result)
+    print(df)
+
+    return df
+
+
+def benchmark_wall_response(calc_method: str = "no_03", n_hour: int = 8760, n_sample: int = 200) -> pd.DataFrame:
+    """
+    合成の気象データ（get_synthetic_climateを参照）による時系列の室内表面熱流について、時刻ごとに簡易計算を行う場合と、
+    壁体の応答係数（ventilation_wall_simplified.get_wall_response）から一括で求める場合の計算時間、誤差を比較する
+    （誤差は時刻ごとの簡易計算との差と、抽出した時刻の詳細計算との差）
+
+    :param calc_method: 簡易計算の計算方法（"no_03" or "no_04"）
+    :param n_hour:      時刻数
+    :param n_sample:    詳細計算と比較する時刻数
+    :return: 比較結果のDataFrame
+    """
+
+    # 固定値の設定
+    h_out = global_number.get_h_out()
+    h_in = global_number.get_h_in()
+
+    # 室内温度は5～10月を夏期、それ以外を冬期とし、通気層の平均風速は0.1m/s刻みの乱数とする
+    theta_e, j_surf = get_synthetic_climate(n_hour)
+    day = np.arange(n_hour) // 24
+    theta_r = np.where((day >= 120) & (day < 304), 27.0, 20.0)
+    v_a = np.round(np.random.default_rng(0).uniform(0.0, 1.0, n_hour), 1)
+    v_a_values = np.round(np.arange(0.0, 1.05, 0.1), 1)
+    parm = vw.Parameters(theta_e=10.0, theta_r=20.0, J_surf=0.0, a_surf=0.8, C_1=6.0, C_2=2.55, l_h=3.0, l_w=0.5,
+                         l_d=0.05, angle=90.0, v_a=0.5, l_s=0.45, emissivity_1=0.9, emissivity_2=0.9)
+    calc_function = vws.get_vent_wall_performance_factor_by_simplified_calculation_no_03 if calc_method == "no_03" \
+        else vws.get_vent_wall_performance_factor_by_simplified_calculation_no_04
+
+    # 時刻ごとの簡易計算
+    start = time.perf_counter()
+    q_hourly = np.array([calc_function(replace(parm, theta_e=theta_e[i], theta_r=theta_r[i], J_surf=j_surf[i],
+                                               v_a=v_a[i]), h_out)[4] for i in range(n_hour)])
+    elapsed_time_hourly = time.perf_counter() - start
+
+    # 壁体の応答係数による一括計算（応答係数の計算を含む）
+    vws._get_wall_response.cache_clear()
+    start = time.perf_counter()
+    response = vws.get_wall_response(parm, h_out, v_a_values=v_a_values, calc_method=calc_method)
+    q_response = vws.get_room_side_heat_flow_by_wall_response(response, theta_e, theta_r, j_surf, v_a)
+    elapsed_time_response = time.perf_counter() - start
+
+    # 抽出した時刻の詳細計算との比較
+    index, q_sample, q_detailed, is_optimize_succeed = vws.get_wall_response_error(
+        response, parm, theta_e, theta_r, j_surf, v_a, "detailed", "detailed", h_out, h_in, n_sample=n_sample)
+
+    df = pd.DataFrame([
+        {'method': 'hourly', 'n_hour': n_hour, 'elapsed_time': elapsed_time_hourly,
+         'max_abs_error_hourly': 0.0,
+         'max_abs_error_detailed': float(np.abs(q_hourly[index] - q_detailed)[is_optimize_succeed].max())},
+        {'method': 'wall_response', 'n_hour': n_hour, 'elapsed_time': elapsed_time_response,
+         'max_abs_error_hourly': float(np.abs(q_response - q_hourly).max()),
+         'max_abs_error_detailed': float(np.abs(q_sample - q_detailed)[is_optimize_succeed].max())}
+    ])
+    print(df)
+
+    return df
+
+
+if __name__ == '__main__':
+
+    benchmark_jacobian()
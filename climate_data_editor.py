@@ -1,14 +1,15 @@
+import numpy as np
 import pandas as pd
 import solar_radiation
 
 
-def add_inclined_solar_radiation_to_csv(directory_name: str, csv_file_name: str):
+def read_climate_data_csv(directory_name: str, csv_file_name: str) -> pd.DataFrame:
     """
-    気象データCSVファイルを読み込み、傾斜面日射量を追加して別名のCSファイルで保存する
+    気象データCSVファイルを読み込み、不要な列の削除と列名の変更を行う
 
     :param directory_name:  ディレクトリ名
     :param csv_file_name:   CSVファイル名
-    :return:
+    :return: 気象データのDataFrame
     """
 
     # CSVファイルを読み込む
@@ -24,48 +25,76 @@ def add_inclined_solar_radiation_to_csv(directory_name: str, csv_file_name: str)
                  '水平面夜間放射量 [W/m2]': '水平面夜間放射量_W_m2', '太陽高度角[度]': '太陽高度角_度',
                  '太陽方位角[度]': '太陽方位角_度'})
 
-    # 計算結果格納用配列を用意
-    inclined_solar_radiations_0 = []  # 傾斜面日射量（傾斜角0°）, W/m2
-    inclined_solar_radiations_30 = []  # 傾斜面日射量（傾斜角30°）, W/m2
-    inclined_solar_radiations_90 = []  # 傾斜面日射量（傾斜角90°）, W/m2
-
-    # 気象データの行ループ
-    for row in df.itertuples():
-
-        # Note: 傾斜面の方位よらない円柱面の傾斜面日射量とするため、太陽方位角と傾斜面方位角には同じ値を与える
-        # 傾斜面日射量（傾斜角0°）を計算
-        inclined_solar_radiation_0 = solar_radiation.get_solar_radiation_on_inclined_surfaces(
-            normal_surface_direct_radiation=row.法線面直達日射量_W_m2,
-            horizontal_surface_sky_radiation=row.水平面天空日射量_W_m2,
-            solar_altitude=row.太陽高度角_度, solar_azimuth=row.太陽方位角_度,
-            surface_tilt_angle=0.0, surface_azimuth=row.太陽方位角_度
-        )
-
-        # 傾斜面日射量（傾斜角30°）を計算
-        inclined_solar_radiation_30 = solar_radiation.get_solar_radiation_on_inclined_surfaces(
-            normal_surface_direct_radiation=row.法線面直達日射量_W_m2,
-            horizontal_surface_sky_radiation=row.水平面天空日射量_W_m2,
-            solar_altitude=row.太陽高度角_度, solar_azimuth=row.太陽方位角_度,
-            surface_tilt_angle=30.0, surface_azimuth=row.太陽方位角_度
-        )
-
-        # 傾斜面日射量（傾斜角90°）を計算
-        inclined_solar_radiation_90 = solar_radiation.get_solar_radiation_on_inclined_surfaces(
-            normal_surface_direct_radiation=row.法線面直達日射量_W_m2,
-            horizontal_surface_sky_radiation=row.水平面天空日射量_W_m2,
-            solar_altitude=row.太陽高度角_度, solar_azimuth=row.太陽方位角_度,
-            surface_tilt_angle=90.0, surface_azimuth=row.太陽方位角_度
-        )
-
-        # 計算結果を配列に格納
-        inclined_solar_radiations_0.append(inclined_solar_radiation_0)
-        inclined_solar_radiations_30.append(inclined_solar_radiation_30)
-        inclined_solar_radiations_90.append(inclined_solar_radiation_90)
+    return df
+
+
+def add_inclined_solar_radiation_to_csv(directory_name: str, csv_file_name: str):
+    """
+    気象データCSVファイルを読み込み、傾斜面日射量を追加して別名のCSファイルで保存する
+
+    :param directory_name:  ディレクトリ名
+    :param csv_file_name:   CSVファイル名
+    :return:
+    """
+
+    # CSVファイルを読み込む
+    df = read_climate_data_csv(directory_name=directory_name, csv_file_name=csv_file_name)
+
+    # 傾斜面傾斜角, degree
+    surface_tilt_angles = np.array([0.0, 30.0, 90.0])
+
+    # 全時刻、全傾斜角の傾斜面日射量を一括で計算（時刻の値を (T,1)、傾斜角を (3,) の形で与えて (T,3) の配列とする）
+    # Note: 傾斜面の方位よらない円柱面の傾斜面日射量とするため、太陽方位角と傾斜面方位角には同じ値を与える
+    solar_azimuth = df['太陽方位角_度'].to_numpy(dtype=float)[:, np.newaxis]
+    inclined_solar_radiations = solar_radiation.get_solar_radiation_on_inclined_surfaces(
+        normal_surface_direct_radiation=df['法線面直達日射量_W_m2'].to_numpy(dtype=float)[:, np.newaxis],
+        horizontal_surface_sky_radiation=df['水平面天空日射量_W_m2'].to_numpy(dtype=float)[:, np.newaxis],
+        solar_altitude=df['太陽高度角_度'].to_numpy(dtype=float)[:, np.newaxis], solar_azimuth=solar_azimuth,
+        surface_tilt_angle=surface_tilt_angles, surface_azimuth=solar_azimuth
+    )
+
+    # 計算結果をDataFrameに追加
+    df['傾斜面日射量_0度_W_m2'] = inclined_solar_radiations[:, 0]
+    df['傾斜面日射量_30度_W_m2'] = inclined_solar_radiations[:, 1]
+    df['傾斜面日射量_90度_W_m2'] = inclined_solar_radiations[:, 2]
+
+    # CSVファイル出力
+    df.to_csv(directory_name + '/rev_' + csv_file_name, encoding="shift-jis")
+
+
+def add_surface_solar_radiation_to_csv(directory_name: str, csv_file_name: str, surfaces: list,
+                                       chunk_size: int = 744):
+    """
+    気象データCSVファイルを読み込み、指定した傾斜面（外壁の各方位、屋根の各勾配など）の傾斜面日射量を追加して
+    別名のCSVファイルで保存する
+    （列名は"傾斜面日射量_傾斜{傾斜角}度_方位{方位角}度_W_m2"。太陽が傾斜面の裏側にある時刻の直達日射量はゼロとする）
+
+    :param directory_name:  ディレクトリ名
+    :param csv_file_name:   CSVファイル名
+    :param surfaces:        傾斜面の（傾斜面傾斜角, degree、傾斜面方位角, degree）のリスト（傾斜面方位角は太陽方位角と同じ基準）
+    :param chunk_size:      まとめて計算する時刻数
+    :return:
+    """
+
+    # CSVファイルを読み込む
+    df = read_climate_data_csv(directory_name=directory_name, csv_file_name=csv_file_name)
+
+    # 傾斜面ごとの定数を求め、全時刻、全傾斜面の傾斜面日射量 (T,S) を計算
+    surface_constants = solar_radiation.get_surface_constants(surfaces)
+    inclined_solar_radiations = solar_radiation.get_solar_radiation_on_surfaces(
+        normal_surface_direct_radiation=df['法線面直達日射量_W_m2'].to_numpy(dtype=float),
+        horizontal_surface_sky_radiation=df['水平面天空日射量_W_m2'].to_numpy(dtype=float),
+        solar_altitude=df['太陽高度角_度'].to_numpy(dtype=float),
+        solar_azimuth=df['太陽方位角_度'].to_numpy(dtype=float),
+        surfaces=surface_constants, chunk_size=chunk_size)
 
     # 計算結果をDataFrameに追加
-    df['傾斜面日射量_0度_W_m2'] = inclined_solar_radiations_0
-    df['傾斜面日射量_30度_W_m2'] = inclined_solar_radiations_30
-    df['傾斜面日射量_90度_W_m2'] = inclined_solar_radiations_90
+    df_surfaces = pd.DataFrame(
+        inclined_solar_radiations, index=df.index, copy=False,
+        columns=['傾斜面日射量_傾斜' + format(tilt_angle, 'g') + '度_方位' + format(azimuth, 'g') + '度_W_m2'
+                 for tilt_angle, azimuth in zip(surface_constants.surface_tilt_angles,
+                                                surface_constants.surface_azimuths)])
+    df = pd.concat([df, df_surfaces], axis=1)
 
     # CSVファイル出力
     df.to_csv(directory_name + '/rev_' + csv_file_name, encoding="shift-jis")
@@ -1,3 +1,7 @@
+import math
+import functools
+import numpy as np
+
 
 def get_c_air(T: float) -> float:
     """
@@ -17,6 +21,15 @@ def get_rho_air(t: float) -> float:
     return 1.293 / (1.0 + t / get_abs_temp())
 
 
+def get_rho_air_derivative(t: float) -> float:
+    """
+    Returns:
+        空気の密度の温度微分, kg/(m3・K)
+    """
+
+    return -get_rho_air(t) / (t + get_abs_temp())
+
+
 def get_g() -> float:
     """
     Returns:
@@ -34,6 +47,14 @@ def get_lambda_air(t: float) -> float:
     return 0.0241 + 7.7e-5 * t
 
 
+def get_lambda_air_derivative(t: float) -> float:
+    """
+    Returns:
+        空気の熱伝導率の温度微分, W/(m・K2)
+    """
+    return 7.7e-5
+
+
 def get_beta_air(t: float) -> float:
     """
     Returns:
@@ -42,6 +63,14 @@ def get_beta_air(t: float) -> float:
     return 1.0 / (t + get_abs_temp())
 
 
+def get_beta_air_derivative(t: float) -> float:
+    """
+    Returns:
+        空気の体膨張率の温度微分, 1/K2
+    """
+    return -1.0 / (t + get_abs_temp()) ** 2
+
+
 def get_mu_air(t: float) -> float:
     """
     Returns:
@@ -50,6 +79,14 @@ def get_mu_air(t: float) -> float:
     return (0.0074237 / (t + 390.15)) * ((t + get_abs_temp()) / 293.15) ** 1.5
 
 
+def get_mu_air_derivative(t: float) -> float:
+    """
+    Returns:
+        空気の粘性率の温度微分, Pa・s/K
+    """
+    return get_mu_air(t) * (1.5 / (t + get_abs_temp()) - 1.0 / (t + 390.15))
+
+
 def get_new_air(t: float) -> float:
     """
     :param t: 空気温度
@@ -86,6 +123,204 @@ def get_gr_air(tw: float, tf: float, d: float) -> float:
     return get_g() * get_beta_air(tf) * abs(tw - tf) * d ** 3.0 / get_new_air(t_ave) ** 2.0
 
 
+def get_air_properties(t: float, is_tabulated: bool = None) -> tuple:
+    """
+    空気の物性値とレーリー数の物性値部分をまとめて計算する（温度は配列でもよい）
+    （各物性値はget_rho_air、get_c_air、get_lambda_air、get_mu_air、get_beta_air、get_pr_airと同じ計算式）
+
+    :param t:               空気温度, degC
+    :param is_tabulated:    物性値表の補間値を使用するかどうか
+                            （Noneの場合はset_air_property_tableによる設定に従う。
+                            Trueで物性値表が未設定の場合は、既定の範囲、刻み幅の物性値表を使用する。
+                            この場合もset_air_property_tableによる設定は変更しない）
+    :return: 空気の密度, kg/m3
+             空気の定圧比熱, J/(kg・K)
+             空気の熱伝導率, W/(m・K)
+             空気の粘性率, Pa・s
+             空気の体膨張率, 1/K
+             レーリー数の物性値部分 g・β・ρ^2・c / (μ・λ), 1/(K・m3)
+             プラントル数, -
+    """
+
+    if is_tabulated is None:
+        is_tabulated = _air_property_table is not None
+    if is_tabulated:
+        table = _air_property_table
+        if table is None:
+            table = _get_default_air_property_table()
+        return table.get_air_properties(t)
+
+    # 絶対温度は1回だけ計算する
+    abs_temp = get_abs_temp()
+    t_abs = t + abs_temp
+
+    rho = 1.293 / (1.0 + t / abs_temp)
+    c = get_c_air(t)
+    lambda_air = 0.0241 + 7.7e-5 * t
+    mu = (0.0074237 / (t + 390.15)) * (t_abs / 293.15) ** 1.5
+    beta = 1.0 / t_abs
+
+    # レーリー数のうち、温度差と代表長さ以外の部分
+    rayleigh_prefactor = get_g() * beta * rho ** 2 * c / (mu * lambda_air)
+
+    # プラントル数（動粘性係数 / 熱拡散率）
+    pr = (mu / rho) / (lambda_air / c / rho)
+
+    return rho, c, lambda_air, mu, beta, rayleigh_prefactor, pr
+
+
+class AirPropertyTable:
+    """
+    空気の物性値表（get_air_propertiesの戻り値を等間隔の温度で事前に計算し、線形補間で求める）
+
+    補間の誤差は刻み幅の2乗に比例する（get_max_relative_errorで確認できる）。
+    表の範囲外の温度は、物性値の計算式で直接計算する。
+    """
+
+    def __init__(self, t_min: float = -30.0, t_max: float = 90.0, resolution: float = 0.05):
+        """
+        :param t_min:       表の下限温度, degC
+        :param t_max:       表の上限温度, degC
+        :param resolution:  表の温度の刻み幅, K
+        """
+
+        if not t_min < t_max or not resolution > 0.0:
+            raise ValueError("物性値表の範囲または刻み幅が正しくありません")
+
+        n_interval = int(math.ceil((t_max - t_min) / resolution - 1.0e-9))
+        self.t_min = t_min
+        self.resolution = resolution
+        self.t_max = t_min + n_interval * resolution
+        self.temperature = t_min + resolution * np.arange(n_interval + 1)
+
+        # 各温度の物性値 (n,7)と、次の温度との差分（補間用）
+        self.values = np.column_stack(np.broadcast_arrays(*get_air_properties(self.temperature, is_tabulated=False)))
+        self.slopes = np.diff(self.values, axis=0)
+        self.n_interval = n_interval
+
+        # 配列版の補間用（物性値ごとに連続した配列で保持する）
+        self._value_columns = [np.ascontiguousarray(column) for column in self.values[:-1].T]
+        self._slope_columns = [np.ascontiguousarray(column) for column in self.slopes.T]
+
+        # スカラー版の補間用（numpyのスカラー演算を避けるため、Pythonのリストで保持する）
+        self._value_rows = self.values[:-1].tolist()
+        self._slope_rows = self.slopes.tolist()
+        self._inverse_resolution = 1.0 / resolution
+
+    def get_air_properties(self, t: float) -> tuple:
+        """
+        物性値表の線形補間により、空気の物性値とレーリー数の物性値部分を求める（温度は配列でもよい）
+
+        :param t:   空気温度, degC
+        :return:    get_air_propertiesと同じ
+        """
+
+        if isinstance(t, float):
+            x = (t - self.t_min) * self._inverse_resolution
+            if 0.0 <= x < self.n_interval:
+                index = int(x)
+                w = x - index
+                v = self._value_rows[index]
+                d = self._slope_rows[index]
+                return (v[0] + w * d[0], v[1] + w * d[1], v[2] + w * d[2], v[3] + w * d[3],
+                        v[4] + w * d[4], v[5] + w * d[5], v[6] + w * d[6])
+            elif x == self.n_interval:
+                # 上限温度ちょうどの場合は表の値
+                return tuple(self.values[-1].tolist())
+            else:
+                # 表の範囲外の温度は計算式で直接計算する
+                return get_air_properties(t, is_tabulated=False)
+
+        t = np.asarray(t, dtype=float)
+        if t.ndim == 0:
+            return tuple(np.asarray(value) for value in self.get_air_properties(float(t)))
+
+        x = (t - self.t_min) * self._inverse_resolution
+        is_in_range = (x >= 0.0) & (x <= self.n_interval)
+        if not np.all(is_in_range):
+            x = np.where(is_in_range, x, 0.0)
+        index = np.minimum(x.astype(np.intp), self.n_interval - 1)
+        w = x - index
+        values = [np.take(v, index) + w * np.take(d, index) for v, d in zip(self._value_columns, self._slope_columns)]
+
+        # 表の範囲外の温度は計算式で直接計算する
+        if not np.all(is_in_range):
+            t_out = t[~is_in_range]
+            for value, exact in zip(values, get_air_properties(t_out, is_tabulated=False)):
+                value[~is_in_range] = exact
+
+        return tuple(values)
+
+    def get_max_relative_error(self) -> dict:
+        """
+        物性値表の線形補間による相対誤差の最大値を、各区間の中点（線形補間の誤差が最大となる点）で求める
+
+        :return: 物性値ごとの相対誤差の最大値, -
+        """
+
+        t = self.temperature[:-1] + self.resolution / 2.0
+        exact = get_air_properties(t, is_tabulated=False)
+        tabulated = self.get_air_properties(t)
+        names = ['rho', 'c', 'lambda', 'mu', 'beta', 'rayleigh_prefactor', 'pr']
+
+        return {name: float(np.max(np.abs(b / a - 1.0))) for name, a, b in zip(names, exact, tabulated)}
+
+
+# get_air_propertiesで使用する物性値表（Noneの場合は物性値の計算式で直接計算する）
+_air_property_table = None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_default_air_property_table() -> AirPropertyTable:
+    """
+    get_air_propertiesで物性値表が未設定のままis_tabulated=Trueとした場合に使用する既定の物性値表を取得する
+    （初回のみ作成する。set_air_property_tableによる設定とは別に保持する）
+
+    :return: 既定の範囲、刻み幅の物性値表
+    """
+
+    return AirPropertyTable()
+
+
+def set_air_property_table(t_min: float = -30.0, t_max: float = 90.0, resolution: float = 0.05) -> AirPropertyTable:
+    """
+    空気の物性値表を作成し、get_air_propertiesで物性値表の補間値を使用するように設定する
+    （熱収支計算では、対流熱伝達率のレーリー数と通気層内空気の密度、比熱に補間値を使用する。
+    解析的ヤコビ行列の物性値の温度微分は、計算式による値のまま）
+
+    :param t_min:       表の下限温度, degC
+    :param t_max:       表の上限温度, degC
+    :param resolution:  表の温度の刻み幅, K
+    :return:            作成した物性値表
+    """
+
+    global _air_property_table
+    _air_property_table = AirPropertyTable(t_min, t_max, resolution)
+
+    return _air_property_table
+
+
+def clear_air_property_table():
+    """
+    空気の物性値表の使用を解除し、get_air_propertiesで物性値を計算式で直接計算するように戻す
+
+    :return: なし
+    """
+
+    global _air_property_table
+    _air_property_table = None
+
+
+def get_air_property_table() -> AirPropertyTable:
+    """
+    get_air_propertiesで使用している空気の物性値表を取得する
+
+    :return: 物性値表（使用していない場合はNone）
+    """
+
+    return _air_property_table
+
+
 def get_sgm() -> float:
     """
     Returns:
@@ -1,5 +1,8 @@
+import functools
 import math
-from global_number import get_abs_temp, get_sgm, get_g, get_lambda_air, get_beta_air, get_mu_air, get_pr_air, get_c_air, get_rho_air
+import numpy as np
+from global_number import get_abs_temp, get_sgm, get_air_properties, \
+    get_lambda_air_derivative, get_beta_air_derivative, get_mu_air_derivative, get_rho_air_derivative
 
 
 def effective_emissivity_parallel(emissivity_1: float, emissivity_2: float) -> float:
@@ -30,6 +33,46 @@ def effective_emissivity_two_dimension(emissivity_1: float, emissivity_2: float,
     return effective_emissivity
 
 
+def is_temperature_dependent_calc_mode(calc_mode: str) -> bool:
+    """
+    計算モードが、熱伝達率が通気層内の表面温度に依存する計算モードかどうかを判定する
+
+    :param calc_mode:   計算モード（対流熱伝達率または放射熱伝達率）
+    :return:            表面温度に依存する計算モードの場合はTrue
+    """
+    return calc_mode not in ("simplified_winter", "simplified_summer", "simplified_all_season", "simplified_zero")
+
+
+def get_radiative_heat_transfer_coefficient_functions(calc_mode: str) -> tuple:
+    """
+    表面温度に依存する計算モードについて、放射熱伝達率とその表面温度による微分の計算関数を返す
+    （収束計算の中で計算モードの判定を繰り返さないために使用する）
+
+    :param calc_mode:   計算モード
+    :return:            放射熱伝達率の計算関数, 放射熱伝達率の面1（または面2）の表面温度による微分の計算関数
+    """
+    if calc_mode == "detailed":
+        return radiative_heat_transfer_coefficient_detailed, radiative_heat_transfer_coefficient_detailed_derivative
+    else:
+        raise ValueError("指定された計算モードは対象外です")
+
+
+def get_convective_heat_transfer_coefficient_functions(calc_mode: str) -> tuple:
+    """
+    表面温度に依存する計算モードについて、対流熱伝達率とその表面温度による偏微分の計算関数を返す
+    （収束計算の中で計算モードの判定を繰り返さないために使用する）
+
+    :param calc_mode:   計算モード
+    :return:            対流熱伝達率の計算関数, 対流熱伝達率の面1、面2の表面温度による偏微分の計算関数
+    """
+    if calc_mode == "detailed":
+        return convective_heat_transfer_coefficient_detailed, convective_heat_transfer_coefficient_detailed_derivative
+    elif calc_mode == "detailed_smooth":
+        return convective_heat_transfer_coefficient_detailed_smooth, convective_heat_transfer_coefficient_detailed_smooth_derivative
+    else:
+        raise ValueError("指定された計算モードは対象外です")
+
+
 def get_radiative_heat_transfer_coefficient(calc_mode: str, theta_1: float, theta_2: float, effective_emissivity: float) -> float:
     """
     計算モードに応じた放射熱伝達率を計算する
@@ -115,6 +158,8 @@ def get_convective_heat_transfer_coefficient(calc_mode: str, v_a: float, theta_1
     """
     if calc_mode == "detailed":
         h_cv = convective_heat_transfer_coefficient_detailed(v_a, theta_1, theta_2, angle, l_h, l_d)
+    elif calc_mode == "detailed_smooth":
+        h_cv = convective_heat_transfer_coefficient_detailed_smooth(v_a, theta_1, theta_2, angle, l_h, l_d)
     elif calc_mode == "simplified_winter":
         h_cv = convective_heat_transfer_coefficient_simplified_winter(v_a)
     elif calc_mode == "simplified_summer":
@@ -176,11 +221,15 @@ def convective_heat_transfer_coefficient_detailed(v_a: float, theta_1: float, th
         # 両表面の温度（theta_1とtheta_2）が同じ値のときはh_c = 0.0とする
         h_cv = 0.0
     else:
+        # 空気の物性値（熱伝導率、レーリー数の物性値部分）をまとめて計算
+        _, _, lambda_air, _, _, rayleigh_prefactor, _ = get_air_properties(theta_ave)
+
         # ヌセルト数を計算
-        nusselt_number = get_nusselt_number(theta_1, theta_2, angle, l_h, l_d)
+        rayleigh_number = rayleigh_prefactor * abs(theta_1 - theta_2) * (l_d ** 3)
+        nusselt_number = get_nusselt_number_by_rayleigh(rayleigh_number, angle, l_h, l_d)
 
         # 密閉空気層の自然対流熱伝達率を計算
-        h_base = nusselt_number * get_lambda_air(theta_ave) / l_d
+        h_base = nusselt_number * lambda_air / l_d
 
         # 通気層の対流熱伝達率の計算
         h_cv = 2 * h_base + 4 * v_a
@@ -201,20 +250,25 @@ def get_nusselt_number(theta_1: float, theta_2: float, angle: float, l_h: float,
     :return:            ヌセルト数
     """
 
-    # 表面温度の平均値
-    theta_ave = (theta_1 + theta_2) / 2.0
+    # レーリー数の計算
+    rayleigh_number = get_rayleigh_number(theta_1, theta_2, l_d)
 
-    # プラントル数の計算
-    pr = get_pr_air(theta_ave)
+    return get_nusselt_number_by_rayleigh(rayleigh_number, angle, l_h, l_d)
 
-    # レーリー数の計算
-    rayleigh_number = (get_g() * get_beta_air(theta_ave) * abs(theta_1 - theta_2) * (l_d ** 3) * (get_rho_air(theta_ave) ** 2) * get_c_air(theta_ave)) / (get_mu_air(theta_ave) * get_lambda_air(theta_ave))
+
+def get_nusselt_number_by_rayleigh(rayleigh_number: float, angle: float, l_h: float, l_d: float) -> float:
+    """
+    レーリー数からヌセルト数を計算する
+
+    :param rayleigh_number: レーリー数
+    :param angle:           通気層の傾斜角, degree
+    :param l_h:             通気層の長さ, m
+    :param l_d:             通気層の厚さ, m
+    :return:                ヌセルト数
+    """
 
     # ヌセルト数の計算
     nusselt_number = 0
-    nu_ct = (1.0 + ((0.104 * rayleigh_number ** 0.293) / (1.0 + (6310.0 / rayleigh_number) ** 1.36)) ** 3) ** (1 / 3)
-    nu_u1 = 0.242 * (rayleigh_number * l_d / l_h) ** 0.273
-    nu_ut = 0.0605 * rayleigh_number ** (1 / 3)
 
     # 傾斜角が0°（水平）のとき
     if angle == 0.0:
@@ -227,15 +281,16 @@ def get_nusselt_number(theta_1: float, theta_2: float, angle: float, l_h: float,
 
     # 傾斜角が90°（鉛直）のとき
     elif angle == 90.0:
-        nusselt_number = max(nu_ct, nu_u1, nu_ut)
+        nusselt_number = _get_nusselt_number_vertical(rayleigh_number, l_h, l_d)
 
     # 傾斜角が0°<γ≤60°のとき
     elif 0.0 < angle <= 60.0:
-        buff = rayleigh_number * math.cos(math.radians(angle))
+        cos_angle, sin_term = _get_tilted_angle_constants(angle)
+        buff = rayleigh_number * cos_angle
         if buff >= 5830.0:
-            nusselt_number = 1.44 * (1.0 - 1708.0/buff) * (1.0 - (1708.0 * (math.sin(1.8 * math.radians(angle)) ** 1.6))/buff) + (buff/5830.0) ** (1/3)
+            nusselt_number = 1.44 * (1.0 - 1708.0/buff) * (1.0 - sin_term/buff) + (buff/5830.0) ** (1/3)
         elif 1708.0 <= buff < 5830.0:
-            nusselt_number = 1.44 * (1.0 - 1708.0/buff) * (1.0 - (1708.0 * (math.sin(1.8 * math.radians(angle)) ** 1.6))/buff)
+            nusselt_number = 1.44 * (1.0 - 1708.0/buff) * (1.0 - sin_term/buff)
         elif buff < 1708.0:
             nusselt_number = 1.0
 
@@ -245,10 +300,752 @@ def get_nusselt_number(theta_1: float, theta_2: float, angle: float, l_h: float,
         nu_60_1 = (1.0 + ((0.0936 * rayleigh_number ** 0.314) ** 7) / (1.0 + buff_g)) ** (1 / 7)
         nu_60_2 = (0.1044 + 0.1759 * l_d/l_h) * rayleigh_number ** 0.283
         nu_60 = max(nu_60_1, nu_60_2)
-        nu_v = max(nu_ct, nu_u1, nu_ut)
+        nu_v = _get_nusselt_number_vertical(rayleigh_number, l_h, l_d)
         nusselt_number = nu_60 * (90.0 - angle)/30.0 + nu_v * (angle - 60.0)/30.0
        
     else:
         raise ValueError("指定された傾斜角は計算対象外です")
 
     return nusselt_number
+
+
+@functools.lru_cache(maxsize=None)
+def _get_tilted_angle_constants(angle: float) -> tuple:
+    """
+    傾斜角が0°<γ≤60°のときのヌセルト数の計算に用いる、傾斜角のみで決まる定数を計算する
+    （総当たりのパラメータの傾斜角は数種類のため、傾斜角ごとに1回だけ計算する）
+
+    :param angle:   通気層の傾斜角, degree
+    :return:        cos(γ), 1708・sin(1.8γ)^1.6
+    """
+    return math.cos(math.radians(angle)), 1708.0 * (math.sin(1.8 * math.radians(angle)) ** 1.6)
+
+
+def _get_nusselt_number_vertical(rayleigh_number: float, l_h: float, l_d: float) -> float:
+    """
+    傾斜角90°（鉛直）のヌセルト数 max(nu_ct, nu_u1, nu_ut) の計算
+
+    :param rayleigh_number: レーリー数
+    :param l_h:             通気層の長さ, m
+    :param l_d:             通気層の厚さ, m
+    :return:                ヌセルト数
+    """
+
+    nu_ct = (1.0 + ((0.104 * rayleigh_number ** 0.293) / (1.0 + (6310.0 / rayleigh_number) ** 1.36)) ** 3) ** (1 / 3)
+    nu_u1 = 0.242 * (rayleigh_number * l_d / l_h) ** 0.273
+    nu_ut = 0.0605 * rayleigh_number ** (1 / 3)
+
+    return max(nu_ct, nu_u1, nu_ut)
+
+
+def get_rayleigh_number(theta_1: float, theta_2: float, l_d: float) -> float:
+    """
+    レーリー数の計算
+
+    :param theta_1:     通気層に面する面1の表面温度, degC
+    :param theta_2:     通気層に面する面2の表面温度, degC
+    :param l_d:         通気層の厚さ, m
+    :return:            レーリー数
+    """
+
+    # 表面温度の平均値
+    theta_ave = (theta_1 + theta_2) / 2.0
+
+    # 物性値部分 g・β・ρ^2・c / (μ・λ) はまとめて計算する
+    rayleigh_prefactor = get_air_properties(theta_ave)[5]
+
+    return rayleigh_prefactor * abs(theta_1 - theta_2) * (l_d ** 3)
+
+
+def get_radiative_heat_transfer_coefficient_derivative(calc_mode: str, theta_1: float, theta_2: float, effective_emissivity: float) -> float:
+    """
+    計算モードに応じた放射熱伝達率の表面温度による偏微分を計算する
+    （放射熱伝達率は両表面温度の平均値の関数のため、面1、面2の表面温度による偏微分は同じ値となる）
+
+    :param calc_mode:   計算モード
+    :param theta_1:     通気層に面する面1の表面温度, degC
+    :param theta_2:     通気層に面する面2の表面温度, degC
+    :param effective_emissivity: 有効放射率, -
+    :return:            放射熱伝達率の面1（または面2）の表面温度による偏微分, W/(m2・K2)
+    """
+    if calc_mode == "detailed":
+        return radiative_heat_transfer_coefficient_detailed_derivative(theta_1, theta_2, effective_emissivity)
+    elif calc_mode in ("simplified_winter", "simplified_summer", "simplified_all_season", "simplified_zero"):
+        return 0.0
+    else:
+        raise ValueError("指定された計算モードは対象外です")
+
+
+def radiative_heat_transfer_coefficient_detailed_derivative(theta_1: float, theta_2: float, effective_emissivity: float) -> float:
+    """
+    放射熱伝達率（詳細計算）の面1（または面2）の表面温度による偏微分
+
+    :param theta_1:     通気層に面する面1の表面温度, degC
+    :param theta_2:     通気層に面する面2の表面温度, degC
+    :param effective_emissivity: 有効放射率, -
+    :return:            放射熱伝達率の表面温度による偏微分, W/(m2・K2)
+    """
+    t_m = (theta_1 + get_abs_temp() + theta_2 + get_abs_temp()) / 2
+    return 6 * get_sgm() * effective_emissivity * (t_m ** 2)
+
+
+def get_convective_heat_transfer_coefficient_derivative(calc_mode: str, v_a: float, theta_1: float, theta_2: float, angle: float, l_h: float, l_d: float) -> tuple:
+    """
+    計算モードに応じた対流熱伝達率の表面温度による偏微分を計算する
+
+    :param calc_mode:   計算モード
+    :param v_a:         通気層の平均風速, m/s
+    :param theta_1:     通気層に面する面1の表面温度, degC
+    :param theta_2:     通気層に面する面2の表面温度, degC
+    :param angle:       通気層の傾斜角, degree
+    :param l_h:         通気層の長さ, m
+    :param l_d:         通気層の厚さ, m
+    :return:            対流熱伝達率の面1の表面温度による偏微分, 面2の表面温度による偏微分, W/(m2・K2)
+    """
+    if calc_mode == "detailed":
+        return convective_heat_transfer_coefficient_detailed_derivative(v_a, theta_1, theta_2, angle, l_h, l_d)
+    elif calc_mode == "detailed_smooth":
+        return convective_heat_transfer_coefficient_detailed_smooth_derivative(v_a, theta_1, theta_2, angle, l_h, l_d)
+    elif calc_mode in ("simplified_winter", "simplified_summer", "simplified_all_season"):
+        return 0.0, 0.0
+    else:
+        raise ValueError("指定された計算モードは対象外です")
+
+
+def convective_heat_transfer_coefficient_detailed_derivative(v_a: float, theta_1: float, theta_2: float, angle: float, l_h: float, l_d: float) -> tuple:
+    """
+    対流熱伝達率（詳細計算）の表面温度による偏微分
+
+    :param v_a:     通気層の平均風速, m/s
+    :param theta_1: 通気層に面する面1の表面温度, degC
+    :param theta_2: 通気層に面する面2の表面温度, degC
+    :param angle:   通気層の傾斜角, degree
+    :param l_h:     通気層の長さ, m
+    :param l_d:     通気層の厚さ, m
+    :return:        対流熱伝達率の面1の表面温度による偏微分, 面2の表面温度による偏微分, W/(m2・K2)
+    """
+
+    if theta_1 == theta_2:
+        # 両表面の温度が同じ値のときはh_c = 0.0としているため、偏微分もゼロとする
+        return 0.0, 0.0
+
+    theta_ave = (theta_1 + theta_2) / 2.0
+
+    # 空気の物性値をまとめて計算し、レーリー数を求める
+    air_properties = get_air_properties(theta_ave)
+    lambda_air = air_properties[2]
+    rayleigh_number = air_properties[5] * abs(theta_1 - theta_2) * (l_d ** 3)
+
+    # ヌセルト数と、その表面温度による偏微分を計算
+    nusselt_number = get_nusselt_number_by_rayleigh(rayleigh_number, angle, l_h, l_d)
+    d_ra_d_theta_1, d_ra_d_theta_2 = _get_rayleigh_number_derivative(theta_1, theta_2, rayleigh_number, air_properties)
+    d_nu_d_ra = get_nusselt_number_derivative_by_rayleigh(rayleigh_number, angle, l_h, l_d)
+    d_nu_d_theta_1, d_nu_d_theta_2 = d_nu_d_ra * d_ra_d_theta_1, d_nu_d_ra * d_ra_d_theta_2
+
+    # h_cv = 2 * Nu * λ(θave) / l_d + 4 * v_a の偏微分
+    d_lambda = get_lambda_air_derivative(theta_ave) / 2.0
+    d_h_cv_d_theta_1 = 2.0 * (d_nu_d_theta_1 * lambda_air + nusselt_number * d_lambda) / l_d
+    d_h_cv_d_theta_2 = 2.0 * (d_nu_d_theta_2 * lambda_air + nusselt_number * d_lambda) / l_d
+
+    return d_h_cv_d_theta_1, d_h_cv_d_theta_2
+
+
+def get_nusselt_number_derivative(theta_1: float, theta_2: float, angle: float, l_h: float, l_d: float) -> tuple:
+    """
+    ヌセルト数の表面温度による偏微分
+
+    :param theta_1:     通気層に面する面1の表面温度, degC
+    :param theta_2:     通気層に面する面2の表面温度, degC
+    :param angle:       通気層の傾斜角, degree
+    :param l_h:         通気層の長さ, m
+    :param l_d:         通気層の厚さ, m
+    :return:            ヌセルト数の面1の表面温度による偏微分, 面2の表面温度による偏微分, 1/K
+    """
+
+    # 表面温度の平均値
+    theta_ave = (theta_1 + theta_2) / 2.0
+
+    # レーリー数の計算
+    air_properties = get_air_properties(theta_ave)
+    rayleigh_number = air_properties[5] * abs(theta_1 - theta_2) * (l_d ** 3)
+
+    # レーリー数の表面温度による偏微分
+    d_ra_d_theta_1, d_ra_d_theta_2 = _get_rayleigh_number_derivative(theta_1, theta_2, rayleigh_number, air_properties)
+
+    d_nu_d_ra = get_nusselt_number_derivative_by_rayleigh(rayleigh_number, angle, l_h, l_d)
+
+    return d_nu_d_ra * d_ra_d_theta_1, d_nu_d_ra * d_ra_d_theta_2
+
+
+def _get_rayleigh_number_derivative(theta_1: float, theta_2: float, rayleigh_number: float,
+                                    air_properties: tuple, temperature_difference_square: float = None) -> tuple:
+    """
+    レーリー数の表面温度による偏微分
+
+    :param theta_1:         通気層に面する面1の表面温度, degC
+    :param theta_2:         通気層に面する面2の表面温度, degC
+    :param rayleigh_number: レーリー数
+    :param air_properties:  表面温度の平均値における空気の物性値（global_number.get_air_propertiesの戻り値）
+    :param temperature_difference_square:   温度差の絶対値を滑らかな近似値とする場合の、近似値の2乗, K2
+                                            （Noneの場合は温度差の絶対値 |θ1 - θ2| とする）
+    :return:                レーリー数の面1の表面温度による偏微分, 面2の表面温度による偏微分, 1/K
+    """
+
+    # 表面温度の平均値
+    theta_ave = (theta_1 + theta_2) / 2.0
+    rho, _, lambda_air, mu, beta, _, _ = air_properties
+
+    # レーリー数の物性値部分の対数微分（Ra ∝ β・ρ^2・c / (μ・λ)、比熱は定数）
+    d_ln_property = get_beta_air_derivative(theta_ave) / beta \
+        + 2.0 * get_rho_air_derivative(theta_ave) / rho \
+        - get_mu_air_derivative(theta_ave) / mu \
+        - get_lambda_air_derivative(theta_ave) / lambda_air
+
+    # 温度差の絶対値の対数微分
+    if temperature_difference_square is None:
+        d_ln_temperature_difference = 1.0 / (theta_1 - theta_2)
+    else:
+        d_ln_temperature_difference = (theta_1 - theta_2) / temperature_difference_square
+
+    # レーリー数の表面温度による偏微分（Ra ∝ |θ1 - θ2|）
+    d_ra_d_theta_1 = rayleigh_number * (d_ln_property / 2.0 + d_ln_temperature_difference)
+    d_ra_d_theta_2 = rayleigh_number * (d_ln_property / 2.0 - d_ln_temperature_difference)
+
+    return d_ra_d_theta_1, d_ra_d_theta_2
+
+
+def get_nusselt_number_derivative_by_rayleigh(rayleigh_number: float, angle: float, l_h: float, l_d: float) -> float:
+    """
+    ヌセルト数のレーリー数による微分（get_nusselt_numberと同じ場合分けで計算する）
+
+    :param rayleigh_number: レーリー数
+    :param angle:           通気層の傾斜角, degree
+    :param l_h:             通気層の長さ, m
+    :param l_d:             通気層の厚さ, m
+    :return:                ヌセルト数のレーリー数による微分
+    """
+
+    ra = rayleigh_number
+
+    # 傾斜角が0°（水平）のとき
+    if angle == 0.0:
+        if ra > 5830.0:
+            return 1.44 * 1708.0 / ra ** 2 + (ra / 5830.0) ** (1 / 3) / (3.0 * ra)
+        elif 1708.0 < ra <= 5830.0:
+            return 1.44 * 1708.0 / ra ** 2
+        else:
+            return 0.0
+
+    # 傾斜角が90°（鉛直）のとき
+    elif angle == 90.0:
+        return _get_nusselt_number_vertical_derivative_by_rayleigh(ra, l_h, l_d)
+
+    # 傾斜角が0°<γ≤60°のとき
+    elif 0.0 < angle <= 60.0:
+        cos_angle, s = _get_tilted_angle_constants(angle)
+        buff = ra * cos_angle
+        d_tilt = 1.44 * (1708.0 / buff ** 2 * (1.0 - s / buff) + (1.0 - 1708.0 / buff) * s / buff ** 2)
+        if buff >= 5830.0:
+            return (d_tilt + (buff / 5830.0) ** (1 / 3) / (3.0 * buff)) * cos_angle
+        elif 1708.0 <= buff < 5830.0:
+            return d_tilt * cos_angle
+        else:
+            return 0.0
+
+    # 傾斜角が60°<γ<90°のとき
+    elif 60.0 < angle < 90.0:
+        x = (ra / 3165.0) ** 20.6
+        buff_g = 0.5 / (1.0 + x) ** 0.1
+        # x が大きい場合の桁あふれを避けるため、x / (1 + x) = 1 / (1 + 1 / x) として計算する
+        d_buff_g = 0.0 if math.isinf(x) or x == 0.0 else -0.1 * 20.6 * buff_g / (1.0 + 1.0 / x) / ra
+        y = (0.0936 * ra ** 0.314) ** 7
+        nu_60_1 = (1.0 + y / (1.0 + buff_g)) ** (1 / 7)
+        d_nu_60_1 = nu_60_1 / (7.0 * (1.0 + y / (1.0 + buff_g))) \
+            * (2.198 * y / ra / (1.0 + buff_g) - y * d_buff_g / (1.0 + buff_g) ** 2)
+        nu_60_2 = (0.1044 + 0.1759 * l_d / l_h) * ra ** 0.283
+        d_nu_60_2 = 0.283 * nu_60_2 / ra
+        d_nu_60 = d_nu_60_1 if nu_60_1 >= nu_60_2 else d_nu_60_2
+        d_nu_v = _get_nusselt_number_vertical_derivative_by_rayleigh(ra, l_h, l_d)
+        return d_nu_60 * (90.0 - angle) / 30.0 + d_nu_v * (angle - 60.0) / 30.0
+
+    else:
+        raise ValueError("指定された傾斜角は計算対象外です")
+
+
+def _get_nusselt_number_vertical_derivative_by_rayleigh(rayleigh_number: float, l_h: float, l_d: float) -> float:
+    """
+    傾斜角90°（鉛直）のヌセルト数 max(nu_ct, nu_u1, nu_ut) のレーリー数による微分
+
+    :param rayleigh_number: レーリー数
+    :param l_h:             通気層の長さ, m
+    :param l_d:             通気層の厚さ, m
+    :return:                ヌセルト数のレーリー数による微分
+    """
+
+    ra = rayleigh_number
+
+    # nu_ct = (1 + X^3)^(1/3), X = 0.104 Ra^0.293 / (1 + (6310 / Ra)^1.36)
+    numerator = 0.104 * ra ** 0.293
+    denominator = 1.0 + (6310.0 / ra) ** 1.36
+    x = numerator / denominator
+    d_x = (0.293 * numerator / ra * denominator + numerator * 1.36 * (6310.0 / ra) ** 1.36 / ra) / denominator ** 2
+    nu_ct = (1.0 + x ** 3) ** (1 / 3)
+    d_nu_ct = x ** 2 * d_x / nu_ct ** 2
+
+    nu_u1 = 0.242 * (ra * l_d / l_h) ** 0.273
+    nu_ut = 0.0605 * ra ** (1 / 3)
+
+    # max関数で選択される式の微分を返す（同値の場合はmax関数と同じく先頭の式を採用する）
+    if nu_ct >= nu_u1 and nu_ct >= nu_ut:
+        return d_nu_ct
+    elif nu_u1 >= nu_ut:
+        return 0.273 * nu_u1 / ra
+    else:
+        return nu_ut / (3.0 * ra)
+
+
+def convective_heat_transfer_coefficient_detailed_smooth(v_a: float, theta_1: float, theta_2: float, angle: float, l_h: float, l_d: float) -> float:
+    """
+    対流熱伝達率[W/(m2・K)]の計算（詳細計算、ヌセルト数の区分の切り替えを滑らかにした式）
+
+    収束計算用に、表面温度について1階微分まで連続となるようにした式（_get_nusselt_number_smooth_by_rayleighを参照）。
+    両表面の温度が同じ値の場合もh_c = 0.0とはせず、温度差の絶対値を sqrt(Δθ^2 + 0.01^2) で置き換えて計算する。
+
+    :param v_a:     通気層の平均風速, m/s
+    :param theta_1: 通気層に面する面1の表面温度, degC
+    :param theta_2: 通気層に面する面2の表面温度, degC
+    :param angle:   通気層の傾斜角, degree
+    :param l_h:     通気層の長さ, m
+    :param l_d:     通気層の厚さ, m
+    :return:        対流熱伝達率, W/(m2・K)
+    """
+
+    theta_ave = (theta_1 + theta_2) / 2.0
+    _, _, lambda_air, _, _, rayleigh_prefactor, _ = get_air_properties(theta_ave)
+
+    # ヌセルト数を計算（温度差の絶対値は滑らかな近似値とする）
+    temperature_difference = ((theta_1 - theta_2) ** 2 + 0.01 ** 2) ** 0.5
+    rayleigh_number = rayleigh_prefactor * temperature_difference * (l_d ** 3)
+    nusselt_number, _ = _get_nusselt_number_smooth_by_rayleigh(rayleigh_number, angle, l_h, l_d)
+
+    # 通気層の対流熱伝達率の計算
+    return 2 * (nusselt_number * lambda_air / l_d) + 4 * v_a
+
+
+def convective_heat_transfer_coefficient_detailed_smooth_derivative(v_a: float, theta_1: float, theta_2: float, angle: float, l_h: float, l_d: float) -> tuple:
+    """
+    対流熱伝達率（詳細計算、ヌセルト数の区分の切り替えを滑らかにした式）の表面温度による偏微分
+
+    :param v_a:     通気層の平均風速, m/s
+    :param theta_1: 通気層に面する面1の表面温度, degC
+    :param theta_2: 通気層に面する面2の表面温度, degC
+    :param angle:   通気層の傾斜角, degree
+    :param l_h:     通気層の長さ, m
+    :param l_d:     通気層の厚さ, m
+    :return:        対流熱伝達率の面1の表面温度による偏微分, 面2の表面温度による偏微分, W/(m2・K2)
+    """
+
+    theta_ave = (theta_1 + theta_2) / 2.0
+    air_properties = get_air_properties(theta_ave)
+    lambda_air = air_properties[2]
+    temperature_difference_square = (theta_1 - theta_2) ** 2 + 0.01 ** 2
+    rayleigh_number = air_properties[5] * temperature_difference_square ** 0.5 * (l_d ** 3)
+
+    # ヌセルト数と、そのレーリー数による微分
+    nusselt_number, d_nu_d_ra = _get_nusselt_number_smooth_by_rayleigh(rayleigh_number, angle, l_h, l_d)
+
+    # レーリー数の表面温度による偏微分（Ra ∝ sqrt(Δθ^2 + 0.01^2)）
+    d_ra_d_theta_1, d_ra_d_theta_2 = _get_rayleigh_number_derivative(
+        theta_1, theta_2, rayleigh_number, air_properties, temperature_difference_square)
+
+    # h_cv = 2 * Nu * λ(θave) / l_d + 4 * v_a の偏微分
+    d_lambda = get_lambda_air_derivative(theta_ave) / 2.0
+    d_h_cv_d_theta_1 = 2.0 * (d_nu_d_ra * d_ra_d_theta_1 * lambda_air + nusselt_number * d_lambda) / l_d
+    d_h_cv_d_theta_2 = 2.0 * (d_nu_d_ra * d_ra_d_theta_2 * lambda_air + nusselt_number * d_lambda) / l_d
+
+    return d_h_cv_d_theta_1, d_h_cv_d_theta_2
+
+
+def _get_nusselt_number_smooth_by_rayleigh(rayleigh_number: float, angle: float, l_h: float, l_d: float) -> tuple:
+    """
+    ヌセルト数と、そのレーリー数による微分の計算（区分の切り替えを滑らかにした式）
+
+    get_nusselt_number_by_rayleighの区分の切り替えを、次のとおり1階微分まで連続な式に置き換える。
+    傾斜角は収束計算の変数ではないため、傾斜角による区分はget_nusselt_number_by_rayleighと同じとする。
+    ・0°≤γ≤60°: Hollandsらの式 Nu = 1 + 1.44[1 - 1708/Ra']+ (1 - 1708 sin(1.8γ)^1.6 / Ra') + [(Ra'/5830)^(1/3) - 1]+
+      （Ra' = Ra cosγ）の [x]+ = max(x, 0) を (x + sqrt(x^2 + 0.02^2)) / 2 で置き換える（差は0.01以下）。
+      水平（γ = 0°）の場合はget_nusselt_number_by_rayleighと同じ式となる。
+      傾斜の場合、get_nusselt_number_by_rayleighの1708 ≤ Ra' < 5830の区分の式には先頭の「1 +」が無いが、
+      ここでは文献の式のとおり「1 +」を含める（この区分ではヌセルト数が1.0大きくなる）。
+    ・60°<γ≤90°: max(a, b) を (a + b + sqrt((a - b)^2 + (0.02 (a + b) / 2)^2)) / 2 で置き換える（差は1%以下）。
+    レーリー数は配列でもよい（傾斜角はスカラー）。
+
+    :param rayleigh_number: レーリー数
+    :param angle:           通気層の傾斜角, degree
+    :param l_h:             通気層の長さ, m
+    :param l_d:             通気層の厚さ, m
+    :return:                ヌセルト数, ヌセルト数のレーリー数による微分
+    """
+
+    ra = rayleigh_number
+
+    # 傾斜角が0°≤γ≤60°のとき（水平を含む）
+    if 0.0 <= angle <= 60.0:
+        cos_angle, sin_term = _get_tilted_angle_constants(angle)
+        buff = ra * cos_angle
+        p_1, d_p_1 = _smooth_positive(1.0 - 1708.0 / buff, 1708.0 / buff ** 2)
+        g = 1.0 - sin_term / buff
+        c = (buff / 5830.0) ** (1 / 3)
+        p_2, d_p_2 = _smooth_positive(c - 1.0, c / (3.0 * buff))
+        nusselt_number = 1.0 + 1.44 * p_1 * g + p_2
+        d_nu_d_buff = 1.44 * (d_p_1 * g + p_1 * sin_term / buff ** 2) + d_p_2
+        return nusselt_number, d_nu_d_buff * cos_angle
+
+    # 傾斜角が90°（鉛直）のとき
+    elif angle == 90.0:
+        return _get_nusselt_number_vertical_smooth(ra, l_h, l_d)
+
+    # 傾斜角が60°<γ<90°のとき
+    elif 60.0 < angle < 90.0:
+        x = (ra / 3165.0) ** 20.6
+        buff_g = 0.5 / (1.0 + x) ** 0.1
+        d_buff_g = -0.1 * 20.6 * buff_g * (x / (1.0 + x)) / ra
+        y = (0.0936 * ra ** 0.314) ** 7
+        nu_60_1 = (1.0 + y / (1.0 + buff_g)) ** (1 / 7)
+        d_nu_60_1 = nu_60_1 / (7.0 * (1.0 + y / (1.0 + buff_g))) \
+            * (2.198 * y / ra / (1.0 + buff_g) - y * d_buff_g / (1.0 + buff_g) ** 2)
+        nu_60_2 = (0.1044 + 0.1759 * l_d / l_h) * ra ** 0.283
+        d_nu_60_2 = 0.283 * nu_60_2 / ra
+        nu_60, d_nu_60 = _smooth_max(nu_60_1, d_nu_60_1, nu_60_2, d_nu_60_2)
+        nu_v, d_nu_v = _get_nusselt_number_vertical_smooth(ra, l_h, l_d)
+        return nu_60 * (90.0 - angle) / 30.0 + nu_v * (angle - 60.0) / 30.0, \
+            d_nu_60 * (90.0 - angle) / 30.0 + d_nu_v * (angle - 60.0) / 30.0
+
+    else:
+        raise ValueError("指定された傾斜角は計算対象外です")
+
+
+def _get_nusselt_number_vertical_smooth(rayleigh_number: float, l_h: float, l_d: float) -> tuple:
+    """
+    傾斜角90°（鉛直）のヌセルト数 max(nu_ct, nu_u1, nu_ut) を滑らかにした式と、そのレーリー数による微分
+
+    :param rayleigh_number: レーリー数
+    :param l_h:             通気層の長さ, m
+    :param l_d:             通気層の厚さ, m
+    :return:                ヌセルト数, ヌセルト数のレーリー数による微分
+    """
+
+    ra = rayleigh_number
+
+    # nu_ct = (1 + X^3)^(1/3), X = 0.104 Ra^0.293 / (1 + (6310 / Ra)^1.36)
+    numerator = 0.104 * ra ** 0.293
+    denominator = 1.0 + (6310.0 / ra) ** 1.36
+    x = numerator / denominator
+    d_x = (0.293 * numerator / ra * denominator + numerator * 1.36 * (6310.0 / ra) ** 1.36 / ra) / denominator ** 2
+    nu_ct = (1.0 + x ** 3) ** (1 / 3)
+    d_nu_ct = x ** 2 * d_x / nu_ct ** 2
+
+    nu_u1 = 0.242 * (ra * l_d / l_h) ** 0.273
+    nu_ut = 0.0605 * ra ** (1 / 3)
+
+    nu, d_nu = _smooth_max(nu_ct, d_nu_ct, nu_u1, 0.273 * nu_u1 / ra)
+    return _smooth_max(nu, d_nu, nu_ut, nu_ut / (3.0 * ra))
+
+
+def _smooth_positive(x: float, d_x: float, width: float = 0.02) -> tuple:
+    """
+    max(x, 0) を滑らかにした関数 (x + sqrt(x^2 + width^2)) / 2 と、その微分（差は最大でwidth / 2）
+
+    :param x:       引数
+    :param d_x:     引数の微分
+    :param width:   滑らかにする幅
+    :return:        関数の値, 関数の微分
+    """
+    abs_x = abs(x)
+    r = (x * x + width * width) ** 0.5
+    # x < 0 で x + r の桁落ちが生じないよう、(x + r) / 2 = (x + |x|) / 2 + width^2 / (2 (r + |x|)) として計算する
+    value = (x + abs_x) / 2.0 + width * width / (2.0 * (r + abs_x))
+    return value, value / r * d_x
+
+
+def _smooth_max(a: float, d_a: float, b: float, d_b: float, relative_width: float = 0.02) -> tuple:
+    """
+    max(a, b) を滑らかにした関数 (a + b + sqrt((a - b)^2 + δ^2)) / 2, δ = relative_width・(a + b) / 2 と、その微分
+    （差は最大で (a + b) / 2 の relative_width / 2 倍）
+
+    :param a:               引数1
+    :param d_a:             引数1の微分
+    :param b:               引数2
+    :param d_b:             引数2の微分
+    :param relative_width:  滑らかにする幅（平均値に対する比）
+    :return:                関数の値, 関数の微分
+    """
+    m = (a + b) / 2.0
+    d_m = (d_a + d_b) / 2.0
+    diff = a - b
+    delta = relative_width * m
+    r = (diff * diff + delta * delta) ** 0.5
+    return m + r / 2.0, d_m + (diff * (d_a - d_b) + delta * relative_width * d_m) / (2.0 * r)
+
+
+def get_radiative_heat_transfer_coefficient_array(calc_mode: str, theta_1: np.ndarray, theta_2: np.ndarray,
+                                                  effective_emissivity: np.ndarray) -> np.ndarray:
+    """
+    計算モードに応じた放射熱伝達率を計算する（配列版）
+
+    :param calc_mode:   計算モード
+    :param theta_1:     通気層に面する面1の表面温度 (N,), degC
+    :param theta_2:     通気層に面する面2の表面温度 (N,), degC
+    :param effective_emissivity: 有効放射率 (N,), -
+    :return:            放射熱伝達率 (N,), W/(m2・K)
+    """
+    effective_emissivity = np.broadcast_to(effective_emissivity, np.shape(theta_1))
+
+    if calc_mode == "simplified_zero":
+        h_rv = np.zeros(np.shape(theta_1))
+    else:
+        # 放射熱伝達率の各計算式は四則演算のみのため、スカラー版の関数をそのまま配列に適用する
+        h_rv = get_radiative_heat_transfer_coefficient(calc_mode, theta_1, theta_2, effective_emissivity)
+
+    return np.asarray(h_rv, dtype=float)
+
+
+def get_convective_heat_transfer_coefficient_array(calc_mode: str, v_a: np.ndarray, theta_1: np.ndarray,
+                                                   theta_2: np.ndarray, angle: np.ndarray, l_h: np.ndarray,
+                                                   l_d: np.ndarray) -> np.ndarray:
+    """
+    計算モードに応じた対流熱伝達率を計算する（配列版）
+
+    :param calc_mode:   計算モード
+    :param v_a:         通気層の平均風速 (N,), m/s
+    :param theta_1:     通気層に面する面1の表面温度 (N,), degC
+    :param theta_2:     通気層に面する面2の表面温度 (N,), degC
+    :param angle:       通気層の傾斜角 (N,), degree
+    :param l_h:         通気層の長さ (N,), m
+    :param l_d:         通気層の厚さ (N,), m
+    :return:            対流熱伝達率 (N,), W/(m2・K)
+    """
+    if calc_mode == "detailed":
+        h_cv = convective_heat_transfer_coefficient_detailed_array(v_a, theta_1, theta_2, angle, l_h, l_d)
+    elif calc_mode == "detailed_smooth":
+        h_cv = convective_heat_transfer_coefficient_detailed_smooth_array(v_a, theta_1, theta_2, angle, l_h, l_d)
+    else:
+        # 簡易計算の各計算式は風速の一次式のため、スカラー版の関数をそのまま配列に適用する
+        h_cv = get_convective_heat_transfer_coefficient(calc_mode, v_a, theta_1, theta_2, angle, l_h, l_d)
+
+    return np.broadcast_to(np.asarray(h_cv, dtype=float), np.shape(theta_1))
+
+
+def convective_heat_transfer_coefficient_detailed_array(v_a: np.ndarray, theta_1: np.ndarray, theta_2: np.ndarray,
+                                                        angle: np.ndarray, l_h: np.ndarray, l_d: np.ndarray) -> np.ndarray:
+    """
+    対流熱伝達率[W/(m2・K)]の計算（詳細計算、配列版）
+
+    :param v_a:     通気層の平均風速 (N,), m/s
+    :param theta_1: 通気層に面する面1の表面温度 (N,), degC
+    :param theta_2: 通気層に面する面2の表面温度 (N,), degC
+    :param angle:   通気層の傾斜角 (N,), degree
+    :param l_h:     通気層の長さ (N,), m
+    :param l_d:     通気層の厚さ (N,), m
+    :return:        対流熱伝達率 (N,), W/(m2・K)
+    """
+
+    v_a, theta_1, theta_2, angle, l_h, l_d = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in
+                                                                   (v_a, theta_1, theta_2, angle, l_h, l_d)))
+
+    # 両表面の温度（theta_1とtheta_2）が同じ値の要素はh_c = 0.0とし、それ以外の要素のみ計算する
+    h_cv = np.zeros(theta_1.shape)
+    m = theta_1 != theta_2
+    if not np.any(m):
+        return h_cv
+    theta_1, theta_2, l_d = theta_1[m], theta_2[m], l_d[m]
+    theta_ave = (theta_1 + theta_2) / 2.0
+
+    # 空気の物性値（熱伝導率、レーリー数の物性値部分）をまとめて計算
+    _, _, lambda_air, _, _, rayleigh_prefactor, _ = get_air_properties(theta_ave)
+
+    # ヌセルト数を計算
+    rayleigh_number = rayleigh_prefactor * np.abs(theta_1 - theta_2) * (l_d ** 3)
+    nusselt_number = get_nusselt_number_by_rayleigh_array(rayleigh_number, angle[m], l_h[m], l_d)
+
+    # 密閉空気層の自然対流熱伝達率を計算
+    h_base = nusselt_number * lambda_air / l_d
+
+    # 通気層の対流熱伝達率の計算
+    h_cv[m] = 2 * h_base + 4 * v_a[m]
+
+    return h_cv
+
+
+def get_nusselt_number_array(theta_1: np.ndarray, theta_2: np.ndarray, angle: np.ndarray, l_h: np.ndarray,
+                             l_d: np.ndarray) -> np.ndarray:
+    """
+    ヌセルト数の計算（配列版）
+
+    傾斜角とレーリー数の区分ごとに該当する要素のみを取り出して計算する（get_nusselt_numberと同じ計算式、計算順序）。
+    両表面の温度が同じ値の要素（レーリー数ゼロ）は、熱伝導のみとしてヌセルト数を1.0とする。
+
+    :param theta_1:     通気層に面する面1の表面温度 (N,), degC
+    :param theta_2:     通気層に面する面2の表面温度 (N,), degC
+    :param angle:       通気層の傾斜角 (N,), degree
+    :param l_h:         通気層の長さ (N,), m
+    :param l_d:         通気層の厚さ (N,), m
+    :return:            ヌセルト数 (N,)
+    """
+
+    theta_1, theta_2, angle, l_h, l_d = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in
+                                                              (theta_1, theta_2, angle, l_h, l_d)))
+
+    # レーリー数の計算
+    rayleigh_number = get_rayleigh_number(theta_1, theta_2, l_d)
+
+    return get_nusselt_number_by_rayleigh_array(rayleigh_number, angle, l_h, l_d)
+
+
+def get_nusselt_number_by_rayleigh_array(rayleigh_number: np.ndarray, angle: np.ndarray, l_h: np.ndarray,
+                                         l_d: np.ndarray) -> np.ndarray:
+    """
+    レーリー数からヌセルト数を計算する（配列版、get_nusselt_number_arrayを参照）
+
+    :param rayleigh_number: レーリー数 (N,)
+    :param angle:           通気層の傾斜角 (N,), degree
+    :param l_h:             通気層の長さ (N,), m
+    :param l_d:             通気層の厚さ (N,), m
+    :return:                ヌセルト数 (N,)
+    """
+
+    rayleigh_number, angle, l_h, l_d = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in
+                                                             (rayleigh_number, angle, l_h, l_d)))
+    if np.any((angle < 0.0) | (angle > 90.0)):
+        raise ValueError("指定された傾斜角は計算対象外です")
+
+    nusselt_number = np.ones(rayleigh_number.shape)
+    is_convective = rayleigh_number > 0.0
+
+    # 傾斜角が0°（水平）のとき
+    m = is_convective & (angle == 0.0)
+    if np.any(m):
+        ra = rayleigh_number[m]
+        nu = np.ones(ra.shape)
+        k = ra > 5830.0
+        nu[k] = 1.44 * (1.0 - 1708.0/ra[k]) + (ra[k]/5830.0) ** (1/3)
+        k = (1708.0 < ra) & (ra <= 5830.0)
+        nu[k] = 1.0 + 1.44 * (1.0 - 1708.0/ra[k])
+        nusselt_number[m] = nu
+
+    # 傾斜角が90°（鉛直）のとき
+    m = is_convective & (angle == 90.0)
+    if np.any(m):
+        nusselt_number[m] = _get_nusselt_number_vertical_array(rayleigh_number[m], l_h[m], l_d[m])
+
+    # 傾斜角が0°<γ≤60°のとき
+    m = is_convective & (0.0 < angle) & (angle <= 60.0)
+    if np.any(m):
+        # 傾斜角のみで決まる定数は、傾斜角の種類ごとに1回だけ計算する
+        unique_angle, angle_code = np.unique(angle[m], return_inverse=True)
+        tilted_angle_constants = np.array([_get_tilted_angle_constants(value) for value in unique_angle.tolist()])
+        cos_angle = tilted_angle_constants[angle_code, 0]
+        sin_term = tilted_angle_constants[angle_code, 1]
+        buff = rayleigh_number[m] * cos_angle
+        nu = np.ones(buff.shape)
+        k = buff >= 1708.0
+        nu[k] = 1.44 * (1.0 - 1708.0/buff[k]) * (1.0 - sin_term[k]/buff[k])
+        k = buff >= 5830.0
+        nu[k] = nu[k] + (buff[k]/5830.0) ** (1/3)
+        nusselt_number[m] = nu
+
+    # 傾斜角が60°<γ<90°のとき
+    m = is_convective & (60.0 < angle) & (angle < 90.0)
+    if np.any(m):
+        ra, angle_m, l_h_m, l_d_m = rayleigh_number[m], angle[m], l_h[m], l_d[m]
+        # 桁あふれする要素（スカラー版では例外となる極端なレーリー数）は、極限値のbuff_g = 0.0とする
+        with np.errstate(over='ignore'):
+            buff_g = 0.5 / (1.0 + (ra/3165.0) ** 20.6) ** 0.1
+        nu_60_1 = (1.0 + ((0.0936 * ra ** 0.314) ** 7) / (1.0 + buff_g)) ** (1 / 7)
+        nu_60_2 = (0.1044 + 0.1759 * l_d_m/l_h_m) * ra ** 0.283
+        nu_60 = np.maximum(nu_60_1, nu_60_2)
+        nu_v = _get_nusselt_number_vertical_array(ra, l_h_m, l_d_m)
+        nusselt_number[m] = nu_60 * (90.0 - angle_m)/30.0 + nu_v * (angle_m - 60.0)/30.0
+
+    return nusselt_number
+
+
+def _get_nusselt_number_vertical_array(rayleigh_number: np.ndarray, l_h: np.ndarray, l_d: np.ndarray) -> np.ndarray:
+    """
+    傾斜角90°（鉛直）のヌセルト数 max(nu_ct, nu_u1, nu_ut) の計算（配列版、レーリー数は正の値のみ）
+
+    :param rayleigh_number: レーリー数 (N,)
+    :param l_h:             通気層の長さ (N,), m
+    :param l_d:             通気層の厚さ (N,), m
+    :return:                ヌセルト数 (N,)
+    """
+
+    ra = rayleigh_number
+    nu_ct = (1.0 + ((0.104 * ra ** 0.293) / (1.0 + (6310.0 / ra) ** 1.36)) ** 3) ** (1 / 3)
+    nu_u1 = 0.242 * (ra * l_d / l_h) ** 0.273
+    nu_ut = 0.0605 * ra ** (1 / 3)
+
+    return np.maximum(np.maximum(nu_ct, nu_u1), nu_ut)
+
+
+def effective_emissivity_parallel_array(emissivity_1: np.ndarray, emissivity_2: np.ndarray) -> np.ndarray:
+    """
+    有効放射率の計算（無限の平行面の場合、配列版）
+
+    :param emissivity_1:    面1の放射率 (N,), -
+    :param emissivity_2:    面2の放射率 (N,), -
+    :return:                有効放射率 (N,), -
+    """
+
+    # 四則演算のみのため、スカラー版の関数をそのまま配列に適用する
+    return effective_emissivity_parallel(np.asarray(emissivity_1, dtype=float), np.asarray(emissivity_2, dtype=float))
+
+
+def effective_emissivity_two_dimension_array(emissivity_1: np.ndarray, emissivity_2: np.ndarray, l_d: np.ndarray,
+                                             l_s: np.ndarray) -> np.ndarray:
+    """
+    有効放射率の計算（二次元空間の場合、配列版）
+
+    :param emissivity_1:    面1の放射率 (N,), -
+    :param emissivity_2:    面2の放射率 (N,), -
+    :param l_d:             通気層の厚さ (N,), m
+    :param l_s:             通気胴縁または垂木の間隔 (N,), m
+    :return:                有効放射率 (N,), -
+    """
+    emissivity_1, emissivity_2, l_d, l_s = (np.asarray(value, dtype=float) for value in (emissivity_1, emissivity_2, l_d, l_s))
+    effective_emissivity = 1.0 / (1.0 / emissivity_1 + 1.0 / emissivity_2 - 2.0 + 1.0 /
+                                  (1.0 / 2.0 * (1.0 + np.sqrt(1.0 + l_d ** 2.0 / l_s ** 2.0) - l_d / l_s)))
+    return effective_emissivity
+
+
+def convective_heat_transfer_coefficient_detailed_smooth_array(v_a: np.ndarray, theta_1: np.ndarray, theta_2: np.ndarray,
+                                                               angle: np.ndarray, l_h: np.ndarray, l_d: np.ndarray) -> np.ndarray:
+    """
+    対流熱伝達率[W/(m2・K)]の計算（詳細計算、ヌセルト数の区分の切り替えを滑らかにした式、配列版）
+
+    :param v_a:     通気層の平均風速 (N,), m/s
+    :param theta_1: 通気層に面する面1の表面温度 (N,), degC
+    :param theta_2: 通気層に面する面2の表面温度 (N,), degC
+    :param angle:   通気層の傾斜角 (N,), degree
+    :param l_h:     通気層の長さ (N,), m
+    :param l_d:     通気層の厚さ (N,), m
+    :return:        対流熱伝達率 (N,), W/(m2・K)
+    """
+
+    v_a, theta_1, theta_2, angle, l_h, l_d = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in
+                                                                   (v_a, theta_1, theta_2, angle, l_h, l_d)))
+
+    theta_ave = (theta_1 + theta_2) / 2.0
+    _, _, lambda_air, _, _, rayleigh_prefactor, _ = get_air_properties(theta_ave)
+    temperature_difference = ((theta_1 - theta_2) ** 2 + 0.01 ** 2) ** 0.5
+    rayleigh_number = rayleigh_prefactor * temperature_difference * (l_d ** 3)
+
+    # 傾斜角ごとにヌセルト数を計算（大きなレーリー数で桁あふれする項は、極限値となるため警告を抑制する）
+    nusselt_number = np.empty(theta_1.shape)
+    with np.errstate(over='ignore', invalid='ignore'):
+        for angle_i in np.unique(angle).tolist():
+            k = angle == angle_i
+            nusselt_number[k], _ = _get_nusselt_number_smooth_by_rayleigh(rayleigh_number[k], angle_i, l_h[k], l_d[k])
+
+    # 通気層の対流熱伝達率の計算
+    return 2 * (nusselt_number * lambda_air / l_d) + 4 * v_a
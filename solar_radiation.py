@@ -1,5 +1,6 @@
-import math
+import numpy as np
 import global_number
+from dataclasses import dataclass
 
 
 def get_solar_radiation_on_inclined_surfaces(
@@ -7,6 +8,9 @@ def get_solar_radiation_on_inclined_surfaces(
         solar_azimuth: float, surface_tilt_angle: float, surface_azimuth: float) -> float:
     """
     傾斜面日射量を求める関数
+    引数は配列でもよく、numpyのブロードキャストの規則に従って計算する
+    （例えば、時刻の値を (T,1,1)、傾斜角を (1,P,1)、方位角を (1,1,Q) の形で与えると (T,P,Q) の配列を返す）
+
     :param normal_surface_direct_radiation:     法線面直達日射量, W/m2
     :param horizontal_surface_sky_radiation:    水平面天空日射量, W/m2
     :param solar_altitude:                      太陽高度角, degree
@@ -16,20 +20,256 @@ def get_solar_radiation_on_inclined_surfaces(
     :return: 傾斜面日射量, W/m2
     """
 
+    # 太陽位置、傾斜面の三角関数の値は、それぞれの配列の形のまま1回ずつ計算する
+    sun_trigonometric_values = get_sun_trigonometric_values(solar_altitude, solar_azimuth)
+    surface_trigonometric_values = get_surface_trigonometric_values(surface_tilt_angle, surface_azimuth)
+
+    return get_solar_radiation_on_inclined_surfaces_by_trigonometric_values(
+        normal_surface_direct_radiation, horizontal_surface_sky_radiation,
+        sun_trigonometric_values, surface_trigonometric_values)
+
+
+def get_solar_radiation_on_inclined_surfaces_grid(
+        normal_surface_direct_radiation: np.ndarray, horizontal_surface_sky_radiation: np.ndarray,
+        solar_altitude: np.ndarray, solar_azimuth: np.ndarray, surface_tilt_angles: np.ndarray,
+        surface_azimuths: np.ndarray) -> np.ndarray:
+    """
+    時刻、傾斜面傾斜角、傾斜面方位角の全組み合わせの傾斜面日射量を一括で求める関数
+
+    :param normal_surface_direct_radiation:     法線面直達日射量 (T,), W/m2
+    :param horizontal_surface_sky_radiation:    水平面天空日射量 (T,), W/m2
+    :param solar_altitude:                      太陽高度角 (T,), degree
+    :param solar_azimuth:                       太陽方位角 (T,), degree
+    :param surface_tilt_angles:                 傾斜面傾斜角 (P,), degree
+    :param surface_azimuths:                    傾斜面方位角 (Q,), degree
+    :return: 傾斜面日射量 (T,P,Q), W/m2
+    """
+
+    # 時刻の値を (T,1,1)、傾斜角を (1,P,1)、方位角を (1,1,Q) の形に揃える
+    by_hour = [np.asarray(values, dtype=float)[:, np.newaxis, np.newaxis]
+               for values in (normal_surface_direct_radiation, horizontal_surface_sky_radiation,
+                              solar_altitude, solar_azimuth)]
+    surface_tilt_angles = np.asarray(surface_tilt_angles, dtype=float)[np.newaxis, :, np.newaxis]
+    surface_azimuths = np.asarray(surface_azimuths, dtype=float)[np.newaxis, np.newaxis, :]
+
+    return get_solar_radiation_on_inclined_surfaces(*by_hour, surface_tilt_angles, surface_azimuths)
+
+
+@dataclass(frozen=True)
+class SurfaceConstants:
+    """
+    傾斜面ごとの定数（複数の傾斜面分。時刻によらないため、傾斜面日射量の計算の前に1回だけ求める）
+    """
+
+    # 傾斜面傾斜角 (S,), degree
+    surface_tilt_angles: np.ndarray
+
+    # 傾斜面方位角 (S,), degree
+    surface_azimuths: np.ndarray
+
+    # 傾斜面の三角関数の値（get_surface_trigonometric_valuesの戻り値。各要素は (S,)）
+    surface_trigonometric_values: tuple
+
+    # 傾斜面の天空に対する形態係数 (S,)
+    shape_factor_to_sky: np.ndarray
+
+    # 傾斜面の地面に対する形態係数 (S,)
+    shape_factor_to_ground: np.ndarray
+
+
+def get_surface_constants(surfaces: list) -> SurfaceConstants:
+    """
+    傾斜面ごとの定数を求める関数
+
+    :param surfaces:    傾斜面の（傾斜面傾斜角, degree、傾斜面方位角, degree）のリスト（傾斜面方位角は太陽方位角と同じ基準）
+    :return: 傾斜面ごとの定数
+    """
+
+    surfaces = np.array(surfaces, dtype=float).reshape(-1, 2)
+    surface_tilt_angles = surfaces[:, 0]
+    surface_azimuths = surfaces[:, 1]
+
+    surface_trigonometric_values = get_surface_trigonometric_values(surface_tilt_angles, surface_azimuths)
+    shape_factor_to_sky = get_shape_factor_of_surface_to_sky_by_cosine(surface_trigonometric_values[1])
+
+    return SurfaceConstants(
+        surface_tilt_angles=surface_tilt_angles, surface_azimuths=surface_azimuths,
+        surface_trigonometric_values=surface_trigonometric_values,
+        shape_factor_to_sky=shape_factor_to_sky, shape_factor_to_ground=1.0 - shape_factor_to_sky)
+
+
+def iter_solar_radiation_on_surfaces(
+        normal_surface_direct_radiation: np.ndarray, horizontal_surface_sky_radiation: np.ndarray,
+        solar_altitude: np.ndarray, solar_azimuth: np.ndarray, surfaces, chunk_size: int = 744,
+        is_negative_incidence_clipped: bool = True):
+    """
+    複数の傾斜面の傾斜面日射量を、指定した時刻数ごとに (時刻数,S) の配列で順に返すジェネレータ
+    作業用の配列の大きさは chunk_size × 傾斜面の数 に比例し、全時刻数によらない
+
+    :param normal_surface_direct_radiation:     法線面直達日射量 (T,), W/m2
+    :param horizontal_surface_sky_radiation:    水平面天空日射量 (T,), W/m2
+    :param solar_altitude:                      太陽高度角 (T,), degree
+    :param solar_azimuth:                       太陽方位角 (T,), degree
+    :param surfaces:                            傾斜面の（傾斜面傾斜角, 傾斜面方位角）のリスト、
+                                                またはget_surface_constantsで求めた傾斜面ごとの定数
+    :param chunk_size:                          まとめて計算する時刻数
+    :param is_negative_incidence_clipped:       太陽が傾斜面の裏側にある時刻の直達日射量をゼロとするかどうか
+                                                （Falseの場合はget_solar_radiation_on_inclined_surfacesと同じく負の値となる）
+    :return: 傾斜面日射量 (chunk_size,S), W/m2（最後のみ残りの時刻数）を時刻順に返すジェネレータ
+    """
+
+    if not isinstance(surfaces, SurfaceConstants):
+        surfaces = get_surface_constants(surfaces)
+
+    normal_surface_direct_radiation, horizontal_surface_sky_radiation, solar_altitude, solar_azimuth \
+        = (np.asarray(values, dtype=float) for values in (normal_surface_direct_radiation,
+                                                          horizontal_surface_sky_radiation, solar_altitude,
+                                                          solar_azimuth))
+
+    for start in range(0, len(solar_altitude), chunk_size):
+        chunk = slice(start, start + chunk_size)
+
+        # 時刻の値は (時刻数,1) の形とし、傾斜面ごとの定数 (S,) とのブロードキャストで (時刻数,S) とする
+        normal_direct = normal_surface_direct_radiation[chunk, np.newaxis]
+        horizontal_sky = horizontal_surface_sky_radiation[chunk, np.newaxis]
+        sun_trigonometric_values = get_sun_trigonometric_values(solar_altitude[chunk, np.newaxis],
+                                                                solar_azimuth[chunk, np.newaxis])
+
+        # 傾斜面に対する太陽光線の入射角の余弦
+        sunlight_incidence_angle = get_sunlight_incidence_angle(sun_trigonometric_values,
+                                                                surfaces.surface_trigonometric_values)
+        if is_negative_incidence_clipped:
+            np.maximum(sunlight_incidence_angle, 0.0, out=sunlight_incidence_angle)
+
+        # 水平面全天日射量
+        horizontal_surface_global_radiation = get_horizontal_surface_global_radiation_by_sine(
+            normal_direct, horizontal_sky, sun_trigonometric_values[0])
+
+        # 傾斜面直達日射量 + 傾斜面天空日射量 + 傾斜面反射日射量
+        yield get_direct_radiation_by_incidence_angle(normal_direct, sunlight_incidence_angle) \
+            + get_diffuse_radiation_by_shape_factor(horizontal_sky, surfaces.shape_factor_to_sky) \
+            + get_reflected_radiation_by_shape_factor(horizontal_surface_global_radiation,
+                                                      surfaces.shape_factor_to_ground)
+
+
+def get_solar_radiation_on_surfaces(
+        normal_surface_direct_radiation: np.ndarray, horizontal_surface_sky_radiation: np.ndarray,
+        solar_altitude: np.ndarray, solar_azimuth: np.ndarray, surfaces, chunk_size: int = 744,
+        is_negative_incidence_clipped: bool = True) -> np.ndarray:
+    """
+    複数の傾斜面の傾斜面日射量を求め、時刻×傾斜面の配列で返す関数（iter_solar_radiation_on_surfacesを参照）
+
+    :param normal_surface_direct_radiation:     法線面直達日射量 (T,), W/m2
+    :param horizontal_surface_sky_radiation:    水平面天空日射量 (T,), W/m2
+    :param solar_altitude:                      太陽高度角 (T,), degree
+    :param solar_azimuth:                       太陽方位角 (T,), degree
+    :param surfaces:                            傾斜面の（傾斜面傾斜角, 傾斜面方位角）のリスト、
+                                                またはget_surface_constantsで求めた傾斜面ごとの定数
+    :param chunk_size:                          まとめて計算する時刻数
+    :param is_negative_incidence_clipped:       太陽が傾斜面の裏側にある時刻の直達日射量をゼロとするかどうか
+    :return: 傾斜面日射量 (T,S), W/m2
+    """
+
+    if not isinstance(surfaces, SurfaceConstants):
+        surfaces = get_surface_constants(surfaces)
+
+    solar_radiation = np.empty(shape=(len(solar_altitude), len(surfaces.surface_tilt_angles)))
+    start = 0
+    for solar_radiation_chunk in iter_solar_radiation_on_surfaces(
+            normal_surface_direct_radiation, horizontal_surface_sky_radiation, solar_altitude, solar_azimuth,
+            surfaces, chunk_size, is_negative_incidence_clipped):
+        solar_radiation[start:start + len(solar_radiation_chunk)] = solar_radiation_chunk
+        start += len(solar_radiation_chunk)
+
+    return solar_radiation
+
+
+def get_sun_trigonometric_values(solar_altitude: float, solar_azimuth: float) -> tuple:
+    """
+    太陽高度角、太陽方位角の三角関数の値を求める関数（時刻ごとに1回計算し、全ての傾斜面で共有する）
+
+    :param solar_altitude:  太陽高度角, degree
+    :param solar_azimuth:   太陽方位角, degree
+    :return: 太陽高度角の正弦, 太陽高度角の余弦, 太陽方位角の正弦, 太陽方位角の余弦
+    """
+
+    solar_altitude = np.radians(solar_altitude)
+    solar_azimuth = np.radians(solar_azimuth)
+
+    return np.sin(solar_altitude), np.cos(solar_altitude), np.sin(solar_azimuth), np.cos(solar_azimuth)
+
+
+def get_surface_trigonometric_values(surface_tilt_angle: float, surface_azimuth: float) -> tuple:
+    """
+    傾斜面傾斜角、傾斜面方位角の三角関数の値を求める関数（傾斜面ごとに1回計算し、全ての時刻で共有する）
+
+    :param surface_tilt_angle:  傾斜面傾斜角, degree
+    :param surface_azimuth:     傾斜面方位角, degree
+    :return: 傾斜面傾斜角の正弦, 傾斜面傾斜角の余弦, 傾斜面方位角の正弦, 傾斜面方位角の余弦
+    """
+
+    surface_tilt_angle = np.radians(surface_tilt_angle)
+    surface_azimuth = np.radians(surface_azimuth)
+
+    return np.sin(surface_tilt_angle), np.cos(surface_tilt_angle), np.sin(surface_azimuth), np.cos(surface_azimuth)
+
+
+def get_solar_radiation_on_inclined_surfaces_by_trigonometric_values(
+        normal_surface_direct_radiation: float, horizontal_surface_sky_radiation: float,
+        sun_trigonometric_values: tuple, surface_trigonometric_values: tuple) -> float:
+    """
+    太陽位置、傾斜面の三角関数の値から傾斜面日射量を求める関数
+
+    :param normal_surface_direct_radiation:     法線面直達日射量, W/m2
+    :param horizontal_surface_sky_radiation:    水平面天空日射量, W/m2
+    :param sun_trigonometric_values:            太陽位置の三角関数の値（get_sun_trigonometric_valuesの戻り値）
+    :param surface_trigonometric_values:        傾斜面の三角関数の値（get_surface_trigonometric_valuesの戻り値）
+    :return: 傾斜面日射量, W/m2
+    """
+
+    sin_solar_altitude = sun_trigonometric_values[0]
+    cos_surface_tilt_angle = surface_trigonometric_values[1]
+
     # 傾斜面直達日射量
-    direct_radiation = get_direct_radiation(normal_surface_direct_radiation, solar_altitude, solar_azimuth,
-                                            surface_tilt_angle, surface_azimuth)
+    direct_radiation = get_direct_radiation_by_incidence_angle(
+        normal_surface_direct_radiation,
+        get_sunlight_incidence_angle(sun_trigonometric_values, surface_trigonometric_values))
+
+    # 傾斜面の天空に対する形態係数
+    shape_factor_to_sky = get_shape_factor_of_surface_to_sky_by_cosine(cos_surface_tilt_angle)
 
     # 傾斜面天空日射量
-    diffuse_radiation = get_diffuse_radiation(horizontal_surface_sky_radiation, surface_tilt_angle)
+    diffuse_radiation = get_diffuse_radiation_by_shape_factor(horizontal_surface_sky_radiation, shape_factor_to_sky)
 
     # 傾斜面反射日射量
-    reflected_radiation = get_reflected_radiation(normal_surface_direct_radiation, horizontal_surface_sky_radiation,
-                                                  solar_altitude, surface_tilt_angle)
+    horizontal_surface_global_radiation = get_horizontal_surface_global_radiation_by_sine(
+        normal_surface_direct_radiation, horizontal_surface_sky_radiation, sin_solar_altitude)
+    reflected_radiation = get_reflected_radiation_by_shape_factor(horizontal_surface_global_radiation,
+                                                                  1.0 - shape_factor_to_sky)
 
     return direct_radiation + diffuse_radiation + reflected_radiation
 
 
+def get_sunlight_incidence_angle(sun_trigonometric_values: tuple, surface_trigonometric_values: tuple) -> float:
+    """
+    傾斜面に対する太陽光線の入射角の余弦を求める関数
+    （太陽方位角と傾斜面方位角の差の余弦は、加法定理により太陽位置の値と傾斜面の値から求める）
+
+    :param sun_trigonometric_values:        太陽位置の三角関数の値（get_sun_trigonometric_valuesの戻り値）
+    :param surface_trigonometric_values:    傾斜面の三角関数の値（get_surface_trigonometric_valuesの戻り値）
+    :return: 入射角の余弦, -
+    """
+
+    sin_solar_altitude, cos_solar_altitude, sin_solar_azimuth, cos_solar_azimuth = sun_trigonometric_values
+    sin_surface_tilt_angle, cos_surface_tilt_angle, sin_surface_azimuth, cos_surface_azimuth \
+        = surface_trigonometric_values
+
+    cos_azimuth_difference = cos_solar_azimuth * cos_surface_azimuth + sin_solar_azimuth * sin_surface_azimuth
+
+    return sin_solar_altitude * cos_surface_tilt_angle \
+        + cos_solar_altitude * sin_surface_tilt_angle * cos_azimuth_difference
+
+
 def get_direct_radiation(normal_surface_direct_radiation: float, solar_altitude: float, solar_azimuth: float,
                          surface_tilt_angle: float, surface_azimuth: float) -> float:
     """
@@ -43,11 +283,23 @@ def get_direct_radiation(normal_surface_direct_radiation: float, solar_altitude:
     :return: 傾斜面直達日射量, W/m2
     """
 
-    # 傾斜面に対する太陽光線の入射角, degree
-    sunlight_incidence_angle\
-        = math.sin(math.radians(solar_altitude)) * math.cos(math.radians(surface_tilt_angle))\
-          + math.cos(math.radians(solar_altitude)) * math.sin(math.radians(surface_tilt_angle))\
-          * math.cos(math.radians(solar_azimuth - surface_azimuth))
+    # 傾斜面に対する太陽光線の入射角の余弦
+    sunlight_incidence_angle = get_sunlight_incidence_angle(
+        get_sun_trigonometric_values(solar_altitude, solar_azimuth),
+        get_surface_trigonometric_values(surface_tilt_angle, surface_azimuth))
+
+    return get_direct_radiation_by_incidence_angle(normal_surface_direct_radiation, sunlight_incidence_angle)
+
+
+def get_direct_radiation_by_incidence_angle(normal_surface_direct_radiation: float,
+                                            sunlight_incidence_angle: float) -> float:
+    """
+    入射角の余弦から傾斜面の直達日射量を求める関数
+
+    :param normal_surface_direct_radiation: 法線面直達日射量, W/m2
+    :param sunlight_incidence_angle:        傾斜面に対する太陽光線の入射角の余弦, -
+    :return: 傾斜面直達日射量, W/m2
+    """
 
     return normal_surface_direct_radiation * sunlight_incidence_angle
 
@@ -62,7 +314,19 @@ def get_diffuse_radiation(horizontal_surface_sky_radiation: float, surface_tilt_
     """
     # 傾斜面の天空に対する形態係数
     shape_factor_of_surface = get_shape_factor_of_surface_to_sky(surface_tilt_angle)
-    return horizontal_surface_sky_radiation * shape_factor_of_surface
+    return get_diffuse_radiation_by_shape_factor(horizontal_surface_sky_radiation, shape_factor_of_surface)
+
+
+def get_diffuse_radiation_by_shape_factor(horizontal_surface_sky_radiation: float,
+                                          shape_factor_to_sky: float) -> float:
+    """
+    天空に対する形態係数から傾斜面の天空日射量を求める関数
+
+    :param horizontal_surface_sky_radiation:    水平面天空日射量, W/m2
+    :param shape_factor_to_sky:                 傾斜面の天空に対する形態係数, -
+    :return: 傾斜面天空日射量, W/m2
+    """
+    return horizontal_surface_sky_radiation * shape_factor_to_sky
 
 
 def get_reflected_radiation(normal_surface_direct_radiation: float, horizontal_surface_sky_radiation: float,
@@ -76,14 +340,27 @@ def get_reflected_radiation(normal_surface_direct_radiation: float, horizontal_s
     :param surface_tilt_angle:                  傾斜面傾斜角, degree
     :return: 傾斜面の反射日射量, W/m2
     """
-    # 地面の日射に対する反射率（アルベド）
-    surface_albedo = global_number.get_surface_albedo()
     # 傾斜面の地面に対する形態係数
     shape_factor_to_ground = 1.0 - get_shape_factor_of_surface_to_sky(surface_tilt_angle)
     # 水平面全天日射量
     horizontal_surface_global_radiation = get_horizontal_surface_global_radiation(
         normal_surface_direct_radiation, horizontal_surface_sky_radiation, solar_altitude)
 
+    return get_reflected_radiation_by_shape_factor(horizontal_surface_global_radiation, shape_factor_to_ground)
+
+
+def get_reflected_radiation_by_shape_factor(horizontal_surface_global_radiation: float,
+                                            shape_factor_to_ground: float) -> float:
+    """
+    地面に対する形態係数から傾斜面の反射日射量を求める関数
+
+    :param horizontal_surface_global_radiation: 水平面全天日射量, W/m2
+    :param shape_factor_to_ground:              傾斜面の地面に対する形態係数, -
+    :return: 傾斜面の反射日射量, W/m2
+    """
+    # 地面の日射に対する反射率（アルベド）
+    surface_albedo = global_number.get_surface_albedo()
+
     return surface_albedo * shape_factor_to_ground * horizontal_surface_global_radiation
 
 
@@ -96,7 +373,21 @@ def get_horizontal_surface_global_radiation(normal_surface_direct_radiation: flo
     :param solar_altitude:                      太陽高度角, degree
     :return: 水平面全天日射量, W/m2
     """
-    return normal_surface_direct_radiation * math.sin(math.radians(solar_altitude)) + horizontal_surface_sky_radiation
+    return get_horizontal_surface_global_radiation_by_sine(
+        normal_surface_direct_radiation, horizontal_surface_sky_radiation, np.sin(np.radians(solar_altitude)))
+
+
+def get_horizontal_surface_global_radiation_by_sine(normal_surface_direct_radiation: float,
+                                                    horizontal_surface_sky_radiation: float,
+                                                    sin_solar_altitude: float) -> float:
+    """
+    太陽高度角の正弦から水平面全天日射量を求める関数
+    :param normal_surface_direct_radiation:     法線面直達日射量, W/m2
+    :param horizontal_surface_sky_radiation:    水平面天空日射量, W/m2
+    :param sin_solar_altitude:                  太陽高度角の正弦, -
+    :return: 水平面全天日射量, W/m2
+    """
+    return normal_surface_direct_radiation * sin_solar_altitude + horizontal_surface_sky_radiation
 
 
 def get_shape_factor_of_surface_to_sky(surface_tilt_angle: float) -> float:
@@ -105,4 +396,13 @@ def get_shape_factor_of_surface_to_sky(surface_tilt_angle: float) -> float:
     :param surface_tilt_angle: 傾斜面傾斜角, degree
     :return: 傾斜面の天空に対する形態係数
     """
-    return (1.0 + math.cos(math.radians(surface_tilt_angle))) / 2.0
+    return get_shape_factor_of_surface_to_sky_by_cosine(np.cos(np.radians(surface_tilt_angle)))
+
+
+def get_shape_factor_of_surface_to_sky_by_cosine(cos_surface_tilt_angle: float) -> float:
+    """
+    傾斜面傾斜角の余弦から傾斜面の天空に対する形態係数を求める関数
+    :param cos_surface_tilt_angle: 傾斜面傾斜角の余弦, -
+    :return: 傾斜面の天空に対する形態係数
+    """
+    return (1.0 + cos_surface_tilt_angle) / 2.0
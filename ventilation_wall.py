@@ -2,12 +2,16 @@ import math
 from scipy import optimize
 import numpy as np
 import heat_transfer_coefficient
-from dataclasses import dataclass
-from global_number import get_c_air, get_rho_air
+import wall_status_cache
+from dataclasses import dataclass, fields, replace
+from global_number import get_rho_air_derivative, get_air_properties, get_air_property_table
 
 
-@dataclass
+@dataclass(frozen=True)
 class Parameters:
+    """
+    計算条件パラメータ群（変更不可、ハッシュ可能。値を変える場合はdataclasses.replaceで作成し直す）
+    """
 
     # 外気温度, degree C
     theta_e: float
@@ -53,8 +57,11 @@ class Parameters:
     emissivity_2: float
 
 
-@dataclass
+@dataclass(frozen=True)
 class WallStatusValues:
+    """
+    通気層の状態値（変更不可。計算結果のメモ、キャッシュで共有するため、配列も読み取り専用とする）
+    """
 
     # 通気層内の各点の温度, degree C
     matrix_temp: np.zeros(shape=(5, 1))
@@ -77,6 +84,305 @@ class WallStatusValues:
     # 最適化の終了メッセージ
     optimize_message: str
 
+    # 熱収支式の評価回数
+    optimize_nfev: int = 0
+
+    # ヤコビ行列の評価回数
+    optimize_njev: int = 0
+
+    def __post_init__(self):
+        for name in ('matrix_temp', 'matrix_heat_balance'):
+            values = np.asarray(getattr(self, name), dtype=float)
+            values.flags.writeable = False
+            object.__setattr__(self, name, values)
+
+
+class HeatBalanceCase:
+    """
+    1ケース分の熱収支式
+
+    計算条件パラメータ群のみから決まる値（相当外気温度、有効放射率、通気風量、係数行列の定数要素）と、
+    計算モードに応じた熱伝達率の計算関数を生成時に一度だけ求めておき、
+    収束計算中は温度に依存する要素のみを更新する。
+    熱収支、ヤコビ行列の計算結果は内部の配列に上書きして返すため、保持する場合はコピーすること。
+    """
+
+    def __init__(self, parm: Parameters, calc_mode_h_cv: str, calc_mode_h_rv: str, h_out: float, h_in: float):
+        """
+        :param parm:        計算条件パラメータ群
+        :param calc_mode_h_cv:   対流熱伝達率の計算モード
+        :param calc_mode_h_rv:   放射熱伝達率の計算モード
+        :param h_out:       室外側総合熱伝達率, W/(m2・K)
+        :param h_in:        室内側総合熱伝達率, W/(m2・K)
+        """
+
+        self.parm = parm
+        self.calc_mode_h_cv = calc_mode_h_cv
+        self.calc_mode_h_rv = calc_mode_h_rv
+        self.h_out = h_out
+        self.h_in = h_in
+
+        # 相当外気温度を計算
+        self.theta_SAT = parm.theta_e + (parm.a_surf * parm.J_surf) / h_out
+
+        # 有効放射率の計算
+        self.effective_emissivity = heat_transfer_coefficient.effective_emissivity_parallel(parm.emissivity_1, parm.emissivity_2)
+
+        # 通気風量の計算
+        self.v_vent = parm.v_a * parm.l_d * parm.l_w
+
+        # 室外側から面1まで、室内側から面2までの熱貫流率
+        self.u_o = h_out * parm.C_1 / (h_out + parm.C_1)
+        self.u_i = h_in * parm.C_2 / (h_in + parm.C_2)
+
+        # 対流熱伝達率の計算関数（表面温度に依存しない計算モードの場合は、ここで値を求めておく）
+        self.is_h_cv_temperature_dependent = heat_transfer_coefficient.is_temperature_dependent_calc_mode(calc_mode_h_cv)
+        if self.is_h_cv_temperature_dependent:
+            self._h_cv_function, self._d_h_cv_function = heat_transfer_coefficient.get_convective_heat_transfer_coefficient_functions(calc_mode_h_cv)
+        else:
+            self._h_cv = heat_transfer_coefficient.get_convective_heat_transfer_coefficient(calc_mode_h_cv, parm.v_a, parm.theta_e, parm.theta_r, parm.angle, parm.l_h, parm.l_d)
+
+        # 放射熱伝達率の計算関数（表面温度に依存しない計算モードの場合は、ここで値を求めておく）
+        self.is_h_rv_temperature_dependent = heat_transfer_coefficient.is_temperature_dependent_calc_mode(calc_mode_h_rv)
+        if self.is_h_rv_temperature_dependent:
+            self._h_rv_function, self._d_h_rv_function = heat_transfer_coefficient.get_radiative_heat_transfer_coefficient_functions(calc_mode_h_rv)
+        else:
+            self._h_rv = heat_transfer_coefficient.get_radiative_heat_transfer_coefficient(calc_mode_h_rv, parm.theta_e, parm.theta_r, self.effective_emissivity)
+
+        # 熱伝達率が温度に依存しない（betaの温度依存性を除いて線形な）熱収支式かどうか
+        self.is_linear = not (self.is_h_cv_temperature_dependent or self.is_h_rv_temperature_dependent)
+
+        # 係数行列、定数項の初期化と、温度に依存しない要素の設定
+        self.matrix_coeff = np.zeros(shape=(5, 5))
+        self.matrix_const = np.zeros(5)
+        self.matrix_coeff[0][0] = h_out + parm.C_1
+        self.matrix_coeff[0][1] = -parm.C_1
+        self.matrix_coeff[1][0] = parm.C_1
+        self.matrix_coeff[2][3] = parm.C_2
+        self.matrix_coeff[3][2] = parm.C_2
+        self.matrix_coeff[3][3] = -(h_in + parm.C_2)
+        self.matrix_coeff[4][4] = -1.0
+        self.matrix_const[0] = h_out * self.theta_SAT
+        self.matrix_const[3] = -h_in * parm.theta_r
+
+        # 計算結果の格納用配列
+        self._q_balance = np.zeros(5)
+        self._jacobian = np.zeros(shape=(5, 5))
+        self._q_balance_core = np.zeros(3)
+        self._jacobian_core = np.zeros(shape=(3, 3))
+
+    def get_heat_balance_coefficients(self, theta_1: float, theta_2: float, theta_as: float) -> tuple:
+        """
+        熱収支式のうち、温度に依存する係数を計算する
+
+        :param theta_1:     通気層に面する面1の表面温度, degC
+        :param theta_2:     通気層に面する面2の表面温度, degC
+        :param theta_as:    通気層の平均空気温度, degC
+        :return: 　         対流熱伝達率, 放射熱伝達率, beta, 通気層の平均空気温度の計算用の値（epc_s、通気がない場合はゼロ）
+        """
+
+        parm = self.parm
+
+        # 対流熱伝達率の計算
+        if self.is_h_cv_temperature_dependent:
+            h_cv = self._h_cv_function(parm.v_a, theta_1, theta_2, parm.angle, parm.l_h, parm.l_d)
+        else:
+            h_cv = self._h_cv
+
+        # 放射熱伝達率の計算
+        if self.is_h_rv_temperature_dependent:
+            h_rv = self._h_rv_function(theta_1, theta_2, self.effective_emissivity)
+        else:
+            h_rv = self._h_rv
+
+        # 通気層の平均空気温度の計算用の値を設定
+        beta = 0.0
+        epc_s = 0.0
+        if parm.v_a > 0.0:
+            # 密度、比熱はh_cvのレーリー数と同じく、物性値表の設定に従う
+            rho_air, c_air = get_air_properties(theta_as)[:2]
+            beta = (2 * h_cv * parm.l_w) / (c_air * rho_air * self.v_vent)
+            epc_s = 1.0 / parm.l_h * 1.0 / beta * (math.exp(-beta * parm.l_h) - 1)
+
+        return h_cv, h_rv, beta, epc_s
+
+    def get_heat_balance_coefficient_derivatives(self, theta_1: float, theta_2: float, theta_as: float, beta: float) -> tuple:
+        """
+        熱収支式のうち、温度に依存する係数の温度による偏微分を計算する
+
+        :param theta_1:     通気層に面する面1の表面温度, degC
+        :param theta_2:     通気層に面する面2の表面温度, degC
+        :param theta_as:    通気層の平均空気温度, degC
+        :param beta:        通気層の平均空気温度の計算用の値（get_heat_balance_coefficientsの戻り値）
+        :return: 　         対流熱伝達率の面1、面2の表面温度による偏微分,
+                            放射熱伝達率の面1（または面2）の表面温度による偏微分,
+                            epc_sの面1、面2、通気層内空気の温度による偏微分
+        """
+
+        parm = self.parm
+
+        # 対流熱伝達率、放射熱伝達率の面1、面2の表面温度による偏微分
+        d_h_cv = (0.0, 0.0)
+        if self.is_h_cv_temperature_dependent:
+            d_h_cv = self._d_h_cv_function(parm.v_a, theta_1, theta_2, parm.angle, parm.l_h, parm.l_d)
+        d_h_rv = 0.0
+        if self.is_h_rv_temperature_dependent:
+            d_h_rv = self._d_h_rv_function(theta_1, theta_2, self.effective_emissivity)
+
+        d_epc_s = (0.0, 0.0, 0.0)
+        if parm.v_a > 0.0:
+            # epc_sのbetaによる微分
+            d_epc_s_d_beta = (1.0 - (1.0 + beta * parm.l_h) * math.exp(-beta * parm.l_h)) / (parm.l_h * beta ** 2)
+
+            # betaの各部温度による偏微分（比熱は定数）
+            # （物性値表を使用する場合も、密度の温度微分は計算式による値とする）
+            rho_air, c_air = get_air_properties(theta_as)[:2]
+            d_beta_d_h_cv = (2 * parm.l_w) / (c_air * rho_air * self.v_vent)
+            d_beta_d_theta_as = -beta * get_rho_air_derivative(theta_as) / rho_air
+
+            d_epc_s = (d_epc_s_d_beta * d_beta_d_h_cv * d_h_cv[0],
+                       d_epc_s_d_beta * d_beta_d_h_cv * d_h_cv[1],
+                       d_epc_s_d_beta * d_beta_d_theta_as)
+
+        return d_h_cv, d_h_rv, d_epc_s
+
+    def update_heat_balance_matrix(self, matrix_temp: np.zeros(5)) -> tuple:
+        """
+        係数行列、定数項のうち、温度に依存する要素を更新する
+
+        :param matrix_temp: 各部温度 (5,), degC
+        :return: 　         対流熱伝達率, 放射熱伝達率, beta
+        """
+
+        h_cv, h_rv, beta, epc_s = self.get_heat_balance_coefficients(matrix_temp[1], matrix_temp[2], matrix_temp[4])
+
+        matrix_coeff = self.matrix_coeff
+        matrix_coeff[1][1] = -(h_cv + h_rv + self.parm.C_1)
+        matrix_coeff[1][2] = h_rv
+        matrix_coeff[1][4] = h_cv
+        matrix_coeff[2][1] = h_rv
+        matrix_coeff[2][2] = -(h_cv + h_rv + self.parm.C_2)
+        matrix_coeff[2][4] = h_cv
+        matrix_coeff[4][1] = (1.0 + epc_s) / 2
+        matrix_coeff[4][2] = (1.0 + epc_s) / 2
+        self.matrix_const[4] = epc_s * self.parm.theta_e
+
+        return h_cv, h_rv, beta
+
+    def get_heat_balance(self, matrix_temp: np.zeros(5)) -> np.zeros(5):
+        """
+        各層の熱収支を計算する
+
+        :param matrix_temp: 各部温度 (5,), degC
+        :return: 　         各層の熱収支 (5,), W/m2
+        """
+
+        self.update_heat_balance_matrix(matrix_temp)
+
+        np.matmul(self.matrix_coeff, matrix_temp, out=self._q_balance)
+        self._q_balance -= self.matrix_const
+
+        return self._q_balance
+
+    def get_heat_balance_jacobian(self, matrix_temp: np.zeros(5)) -> np.zeros((5, 5)):
+        """
+        熱収支式のヤコビ行列を計算する
+        係数行列に加えて、対流熱伝達率、放射熱伝達率（面1、面2の表面温度に依存）と
+        beta（通気層の平均空気温度の空気密度に依存）の温度依存性による項を考慮する
+
+        :param matrix_temp: 各部温度 (5,), degC
+        :return: 　         各層の熱収支の各部温度による偏微分 (5,5), W/(m2・K)
+        """
+
+        _, _, beta = self.update_heat_balance_matrix(matrix_temp)
+
+        theta_1 = matrix_temp[1]
+        theta_2 = matrix_temp[2]
+        theta_as = matrix_temp[4]
+
+        d_h_cv, d_h_rv, d_epc_s = self.get_heat_balance_coefficient_derivatives(theta_1, theta_2, theta_as, beta)
+
+        jacobian = self._jacobian
+        jacobian[:] = self.matrix_coeff
+
+        # 面1、面2の熱収支式のうち、熱伝達率の温度依存性による項
+        for k in range(2):
+            jacobian[1][1 + k] += d_h_cv[k] * (theta_as - theta_1) + d_h_rv * (theta_2 - theta_1)
+            jacobian[2][1 + k] += d_h_cv[k] * (theta_as - theta_2) + d_h_rv * (theta_1 - theta_2)
+
+        # 通気層内空気の熱収支式のうち、betaの温度依存性による項
+        for k, j in enumerate([1, 2, 4]):
+            jacobian[4][j] += d_epc_s[k] * ((theta_1 + theta_2) / 2.0 - self.parm.theta_e)
+
+        return jacobian
+
+    def get_heat_balance_reduced(self, matrix_temp_core: np.zeros(3)) -> np.zeros(3):
+        """
+        面1、面2、通気層内空気の3点の熱収支を計算する（外気側表面、室内側表面の温度は消去する）
+
+        :param matrix_temp_core: 面1、面2、通気層内空気の温度 (3,), degC
+        :return: 　         面1、面2、通気層内空気の熱収支 (3,), W/m2
+        """
+
+        theta_1, theta_2, theta_as = matrix_temp_core
+        h_cv, h_rv, _, epc_s = self.get_heat_balance_coefficients(theta_1, theta_2, theta_as)
+
+        q_balance = self._q_balance_core
+        q_balance[0] = self.u_o * (self.theta_SAT - theta_1) + h_rv * (theta_2 - theta_1) + h_cv * (theta_as - theta_1)
+        q_balance[1] = self.u_i * (self.parm.theta_r - theta_2) + h_rv * (theta_1 - theta_2) + h_cv * (theta_as - theta_2)
+        q_balance[2] = (1.0 + epc_s) / 2 * (theta_1 + theta_2) - theta_as - epc_s * self.parm.theta_e
+
+        return q_balance
+
+    def get_heat_balance_reduced_jacobian(self, matrix_temp_core: np.zeros(3)) -> np.zeros((3, 3)):
+        """
+        面1、面2、通気層内空気の3点の熱収支式のヤコビ行列（5点のヤコビ行列のシューア補元に相当する）を計算する
+
+        :param matrix_temp_core: 面1、面2、通気層内空気の温度 (3,), degC
+        :return: 　         面1、面2、通気層内空気の熱収支の温度による偏微分 (3,3), W/(m2・K)
+        """
+
+        theta_1, theta_2, theta_as = matrix_temp_core
+        h_cv, h_rv, beta, epc_s = self.get_heat_balance_coefficients(theta_1, theta_2, theta_as)
+        d_h_cv, d_h_rv, d_epc_s = self.get_heat_balance_coefficient_derivatives(theta_1, theta_2, theta_as, beta)
+
+        jacobian = self._jacobian_core
+        jacobian[0][0] = -(self.u_o + h_rv + h_cv)
+        jacobian[0][1] = h_rv
+        jacobian[0][2] = h_cv
+        jacobian[1][0] = h_rv
+        jacobian[1][1] = -(self.u_i + h_rv + h_cv)
+        jacobian[1][2] = h_cv
+        jacobian[2][0] = (1.0 + epc_s) / 2
+        jacobian[2][1] = (1.0 + epc_s) / 2
+        jacobian[2][2] = -1.0
+
+        # 熱伝達率、epc_sの温度依存性による項
+        for k in range(2):
+            jacobian[0][k] += d_h_cv[k] * (theta_as - theta_1) + d_h_rv * (theta_2 - theta_1)
+            jacobian[1][k] += d_h_cv[k] * (theta_as - theta_2) + d_h_rv * (theta_1 - theta_2)
+        for k in range(3):
+            jacobian[2][k] += d_epc_s[k] * ((theta_1 + theta_2) / 2.0 - self.parm.theta_e)
+
+        return jacobian
+
+    def get_matrix_temp_from_core(self, matrix_temp_core: np.zeros(3)) -> np.zeros(5):
+        """
+        面1、面2、通気層内空気の温度から、外気側表面、室内側表面の温度を後退代入で求め、各部温度を返す
+
+        :param matrix_temp_core: 面1、面2、通気層内空気の温度 (3,), degC
+        :return: 　         各部温度 (5,), degC
+        """
+
+        matrix_temp = np.zeros(5)
+        matrix_temp[0] = (self.h_out * self.theta_SAT + self.parm.C_1 * matrix_temp_core[0]) / (self.h_out + self.parm.C_1)
+        matrix_temp[1] = matrix_temp_core[0]
+        matrix_temp[2] = matrix_temp_core[1]
+        matrix_temp[3] = (self.parm.C_2 * matrix_temp_core[1] + self.h_in * self.parm.theta_r) / (self.h_in + self.parm.C_2)
+        matrix_temp[4] = matrix_temp_core[2]
+
+        return matrix_temp
+
 
 def get_heat_balance(matrix_temp: np.zeros(5), parm: Parameters, calc_mode_h_cv: str, calc_mode_h_rv: str,
                      h_out: float, h_in: float) -> np.zeros(5):
@@ -92,68 +398,217 @@ def get_heat_balance(matrix_temp: np.zeros(5), parm: Parameters, calc_mode_h_cv:
     :return: 　         各層の熱収支, W/m2
     """
 
-    # 相当外気温度を計算
-    theta_SAT = parm.theta_e + (parm.a_surf * parm.J_surf) / h_out
+    return HeatBalanceCase(parm, calc_mode_h_cv, calc_mode_h_rv, h_out, h_in).get_heat_balance(matrix_temp)
 
-    # 行列の初期化
-    matrix_coeff = np.zeros(shape=(5, 5))
-    matrix_const = np.zeros(5)
 
-    # 通気層内の表面温度を設定
-    theta_1 = matrix_temp[1]
-    theta_2 = matrix_temp[2]
+def get_heat_balance_matrix(matrix_temp: np.zeros(5), parm: Parameters, calc_mode_h_cv: str, calc_mode_h_rv: str,
+                            h_out: float, h_in: float) -> tuple:
+    """
+    熱収支式の係数行列と定数項を作成する関数
 
-    # 対流熱伝達率の計算
-    h_cv = heat_transfer_coefficient.get_convective_heat_transfer_coefficient(calc_mode_h_cv, parm.v_a, theta_1, theta_2, parm.angle, parm.l_h, parm.l_d)
+    :param matrix_temp: 各部温度計算結果 (5,1), degC
+    :param parm:        計算条件パラメータ群
+    :param calc_mode_h_cv:   対流熱伝達率の計算モード
+    :param calc_mode_h_rv:   放射熱伝達率の計算モード
+    :param h_out:       室外側総合熱伝達率, W/(m2・K)
+    :param h_in:        室内側総合熱伝達率, W/(m2・K)
+    :return: 　         係数行列 (5,5), 定数項 (5,), 対流熱伝達率, 放射熱伝達率, 通気層の平均空気温度の計算用の値（beta）
+    """
 
-    # 有効放射率の計算
-    effective_emissivity = heat_transfer_coefficient.effective_emissivity_parallel(parm.emissivity_1, parm.emissivity_2)
+    case = HeatBalanceCase(parm, calc_mode_h_cv, calc_mode_h_rv, h_out, h_in)
+    h_cv, h_rv, beta = case.update_heat_balance_matrix(matrix_temp)
 
-    # 放射熱伝達率の計算
-    h_rv = heat_transfer_coefficient.get_radiative_heat_transfer_coefficient(calc_mode_h_rv, theta_1, theta_2, effective_emissivity)
+    return case.matrix_coeff, case.matrix_const, h_cv, h_rv, beta
 
-    # 通気風量の計算
-    v_vent = parm.v_a * parm.l_d * parm.l_w
 
-    # 通気層の平均空気温度の計算用の値を設定
-    beta = 0.0
-    if parm.v_a > 0.0:
-        beta = (2 * h_cv * parm.l_w) / (get_c_air(matrix_temp[4]) * get_rho_air(matrix_temp[4]) * v_vent)
+def get_heat_balance_jacobian(matrix_temp: np.zeros(5), parm: Parameters, calc_mode_h_cv: str, calc_mode_h_rv: str,
+                              h_out: float, h_in: float) -> np.zeros((5, 5)):
+    """
+    熱収支式のヤコビ行列を計算する関数
 
-    # 行列に値を設定
-    matrix_coeff[0][0] = h_out + parm.C_1
-    matrix_coeff[0][1] = -parm.C_1
-    matrix_coeff[1][0] = parm.C_1
-    matrix_coeff[1][1] = -(h_cv + h_rv + parm.C_1)
-    matrix_coeff[1][2] = h_rv
-    matrix_coeff[1][4] = h_cv
-    matrix_coeff[2][1] = h_rv
-    matrix_coeff[2][2] = -(h_cv + h_rv + parm.C_2)
-    matrix_coeff[2][3] = parm.C_2
-    matrix_coeff[2][4] = h_cv
-    matrix_coeff[3][2] = parm.C_2
-    matrix_coeff[3][3] = -(h_in + parm.C_2)
-    matrix_coeff[4][4] = -1.0
-    matrix_const[0] = h_out * theta_SAT
-    matrix_const[3] = -h_in * parm.theta_r
-
-    if parm.v_a > 0.0:
-        matrix_coeff[4][1] = (1.0 + 1.0 / parm.l_h * 1.0 / beta * (math.exp(-beta * parm.l_h) - 1)) / 2
-        matrix_coeff[4][2] = (1.0 + 1.0 / parm.l_h * 1.0 / beta * (math.exp(-beta * parm.l_h) - 1)) / 2
-        matrix_const[4] = 1.0 / parm.l_h * 1.0 / beta * (math.exp(-beta * parm.l_h) - 1) * parm.theta_e
+    :param matrix_temp: 各部温度計算結果 (5,1), degC
+    :param parm:        計算条件パラメータ群
+    :param calc_mode_h_cv:   対流熱伝達率の計算モード
+    :param calc_mode_h_rv:   放射熱伝達率の計算モード
+    :param h_out:       室外側総合熱伝達率, W/(m2・K)
+    :param h_in:        室内側総合熱伝達率, W/(m2・K)
+    :return: 　         各層の熱収支の各部温度による偏微分 (5,5), W/(m2・K)
+    """
+
+    return HeatBalanceCase(parm, calc_mode_h_cv, calc_mode_h_rv, h_out, h_in).get_heat_balance_jacobian(matrix_temp)
+
+
+def get_heat_balance_reduced(matrix_temp_core: np.zeros(3), parm: Parameters, calc_mode_h_cv: str, calc_mode_h_rv: str,
+                             h_out: float, h_in: float) -> np.zeros(3):
+    """
+    熱収支式を解く関数（縮約版）
+    外気側表面、室内側表面の熱収支式は温度に依存しない線形式のため、この2点の温度を消去し、
+    熱伝達率が温度に依存する面1、面2、通気層内空気の3点の熱収支のみを返す
+
+    :param matrix_temp_core: 面1、面2、通気層内空気の温度 (3,), degC
+    :param parm:        計算条件パラメータ群
+    :param calc_mode_h_cv:   対流熱伝達率の計算モード
+    :param calc_mode_h_rv:   放射熱伝達率の計算モード
+    :param h_out:       室外側総合熱伝達率, W/(m2・K)
+    :param h_in:        室内側総合熱伝達率, W/(m2・K)
+    :return: 　         面1、面2、通気層内空気の熱収支 (3,), W/m2
+    """
+
+    return HeatBalanceCase(parm, calc_mode_h_cv, calc_mode_h_rv, h_out, h_in).get_heat_balance_reduced(matrix_temp_core)
+
+
+def get_heat_balance_reduced_jacobian(matrix_temp_core: np.zeros(3), parm: Parameters, calc_mode_h_cv: str,
+                                      calc_mode_h_rv: str, h_out: float, h_in: float) -> np.zeros((3, 3)):
+    """
+    熱収支式（縮約版）のヤコビ行列を計算する関数（5点のヤコビ行列のシューア補元に相当する）
+
+    :param matrix_temp_core: 面1、面2、通気層内空気の温度 (3,), degC
+    :param parm:        計算条件パラメータ群
+    :param calc_mode_h_cv:   対流熱伝達率の計算モード
+    :param calc_mode_h_rv:   放射熱伝達率の計算モード
+    :param h_out:       室外側総合熱伝達率, W/(m2・K)
+    :param h_in:        室内側総合熱伝達率, W/(m2・K)
+    :return: 　         面1、面2、通気層内空気の熱収支の温度による偏微分 (3,3), W/(m2・K)
+    """
+
+    return HeatBalanceCase(parm, calc_mode_h_cv, calc_mode_h_rv, h_out, h_in).get_heat_balance_reduced_jacobian(matrix_temp_core)
+
+
+def solve_linear_heat_balance(matrix_temp: np.zeros(5), case: HeatBalanceCase, tolerance: float = 1.0e-10,
+                              max_iteration: int = 20) -> optimize.OptimizeResult:
+    """
+    熱伝達率が温度に依存しない計算モードの熱収支式を、連立一次方程式として直接解く関数
+    通気がない場合は1回の求解で解が得られる。通気がある場合はbetaが通気層内空気の密度を介して温度に依存するため、
+    通気層内空気の温度を更新しながら連立一次方程式の求解を繰り返す
+
+    :param matrix_temp: 各部温度の初期値 (5,), degC
+    :param case:        1ケース分の熱収支式
+    :param tolerance:   収束判定に用いる温度の変化量の許容値, K
+    :param max_iteration:   最大反復回数
+    :return: 　         計算結果（optimize.rootの戻り値と同じ形式）
+    """
+
+    is_converged = False
+    for iteration in range(1, max_iteration + 1):
+        case.update_heat_balance_matrix(matrix_temp)
+        matrix_temp_next = np.linalg.solve(case.matrix_coeff, case.matrix_const)
+        is_converged = case.parm.v_a <= 0.0 or np.max(np.abs(matrix_temp_next - matrix_temp)) < tolerance
+        matrix_temp = matrix_temp_next
+        if is_converged:
+            break
+
+    if is_converged:
+        message = "連立一次方程式の直接解が得られました"
     else:
-        matrix_coeff[4][1] = 0.5
-        matrix_coeff[4][2] = 0.5
-        matrix_const[4] = 0.0
+        message = "連立一次方程式の反復求解が最大反復回数までに収束しませんでした"
 
-    # 熱収支を計算
-    q_balance = np.matmul(matrix_coeff, matrix_temp) - matrix_const
+    return optimize.OptimizeResult(x=matrix_temp, success=is_converged, status=1 if is_converged else 0,
+                                   message=message, nfev=iteration)
 
-    return q_balance
+
+def get_initial_temperature(parm: Parameters, h_out: float = None, h_in: float = None,
+                            initial_guess: str = "linear") -> np.zeros(5):
+    """
+    収束計算に用いる各部温度の初期値を設定する
+
+    :param parm:        計算条件パラメータ群
+    :param h_out:       室外側総合熱伝達率, W/(m2・K)（"simplified_no_01"の場合のみ使用）
+    :param h_in:        室内側総合熱伝達率, W/(m2・K)（"simplified_no_01"の場合のみ使用）
+    :param initial_guess: 初期値の設定方法
+                          "linear": 外気温度と室内温度の線形補間
+                          "simplified_no_01": 簡易計算法案No.1の計算結果
+    :return: 　         各部温度の初期値 (5,), degC
+    """
+
+    if initial_guess == "linear":
+        # 通気層内の各点の温度の初期値を設定
+        matrix_temp = np.zeros(5)
+        matrix_temp[0] = parm.theta_e
+        matrix_temp[1] = parm.theta_e + (parm.theta_r - parm.theta_e) / (4 * 3)
+        matrix_temp[2] = parm.theta_e + (parm.theta_r - parm.theta_e) / (4 * 2)
+        matrix_temp[3] = parm.theta_e + (parm.theta_r - parm.theta_e) / (4 * 1)
+        matrix_temp[4] = (matrix_temp[1] + matrix_temp[2]) / 2
+    elif initial_guess == "simplified_no_01":
+        matrix_temp = get_initial_temperature_by_simplified_calculation_no_01(parm, h_out, h_in)
+    else:
+        raise ValueError("指定された初期値の設定方法は対象外です")
+
+    return matrix_temp
+
+
+def get_initial_temperature_by_simplified_calculation_no_01(parm: Parameters, h_out: float, h_in: float) -> np.zeros(5):
+    """
+    簡易計算法案No.1（面1、通気層内空気、面2の3点の連立一次方程式）の計算結果から、各部温度の初期値を設定する
+    外気側表面、室内側表面の温度は、外気側部材、室内側部材の熱コンダクタンスと総合熱伝達率の関係から求める
+
+    :param parm:        計算条件パラメータ群
+    :param h_out:       室外側総合熱伝達率, W/(m2・K)
+    :param h_in:        室内側総合熱伝達率, W/(m2・K)
+    :return: 　         各部温度の初期値 (5,), degC
+    """
+
+    # ventilation_wall_simplifiedは本モジュールをインポートしているため、関数内でインポートする
+    import ventilation_wall_simplified as vws
+
+    # 面1、通気層内空気、面2の温度を簡易計算法案No.1で計算
+    matrix_temp_simplified, _, _, _ = vws.get_vent_wall_temperature_by_simplified_calculation_no_01(parm, h_out)
+    theta_1, theta_as, theta_2 = matrix_temp_simplified
+
+    # 相当外気温度を計算
+    theta_SAT = parm.theta_e + (parm.a_surf * parm.J_surf) / h_out
+
+    matrix_temp = np.zeros(5)
+    matrix_temp[0] = (h_out * theta_SAT + parm.C_1 * theta_1) / (h_out + parm.C_1)
+    matrix_temp[1] = theta_1
+    matrix_temp[2] = theta_2
+    matrix_temp[3] = (parm.C_2 * theta_2 + h_in * parm.theta_r) / (h_in + parm.C_2)
+    matrix_temp[4] = theta_as
+
+    return matrix_temp
+
+
+def solve_heat_balance(matrix_temp: np.zeros(5), case: HeatBalanceCase, is_analytic_jacobian: bool,
+                       solver_mode: str) -> optimize.OptimizeResult:
+    """
+    指定された解法で熱収支式を解く
+
+    :param matrix_temp: 各部温度の初期値 (5,), degC
+    :param case:        1ケース分の熱収支式
+    :param is_analytic_jacobian: 収束計算にヤコビ行列の解析解を与えるかどうか（Falseの場合は差分近似）
+    :param solver_mode: 熱収支式の解法（get_wall_status_valuesを参照）
+    :return: 　         計算結果（optimize.rootの戻り値、解xは各部温度 (5,)）
+    """
+
+    # HeatBalanceCaseの熱収支の計算関数は作業用の配列をそのまま返すため、差分近似のヤコビ行列を用いる場合は
+    # 各評価点の熱収支が同じ配列とならないよう複写して渡す（ヤコビ行列の解析解を与える場合は複写しない）
+    if solver_mode == "full":
+        if is_analytic_jacobian:
+            fun, jacobian = case.get_heat_balance, case.get_heat_balance_jacobian
+        else:
+            fun, jacobian = (lambda x: case.get_heat_balance(x).copy()), None
+        optimize_result = optimize.root(fun=fun, x0=matrix_temp, method='lm', jac=jacobian)
+
+    elif solver_mode == "reduced":
+        if case.is_linear:
+            optimize_result = solve_linear_heat_balance(matrix_temp, case)
+        else:
+            if is_analytic_jacobian:
+                fun, jacobian = case.get_heat_balance_reduced, case.get_heat_balance_reduced_jacobian
+            else:
+                fun, jacobian = (lambda x: case.get_heat_balance_reduced(x).copy()), None
+            optimize_result = optimize.root(fun=fun, x0=matrix_temp[[1, 2, 4]], method='lm', jac=jacobian)
+            optimize_result.x = case.get_matrix_temp_from_core(optimize_result.x)
+
+    else:
+        raise ValueError("指定された解法は対象外です")
+
+    return optimize_result
 
 
 def get_wall_status_values(parm: Parameters, calc_mode_h_cv: str, calc_mode_h_rv: str,
-                           h_out: float, h_in: float) -> WallStatusValues:
+                           h_out: float, h_in: float, is_analytic_jacobian: bool = True,
+                           solver_mode: str = "full", matrix_temp_init: np.ndarray = None,
+                           initial_guess: str = "linear") -> WallStatusValues:
     """
     通気層の状態値を取得する
 
@@ -162,19 +617,60 @@ def get_wall_status_values(parm: Parameters, calc_mode_h_cv: str, calc_mode_h_rv
     :param calc_mode_h_rv:   放射熱伝達率の計算モード
     :param h_out: 室外側総合熱伝達率, W/(m2・K)
     :param h_in:  室内側総合熱伝達率, W/(m2・K)
+    :param is_analytic_jacobian: 収束計算にヤコビ行列の解析解を与えるかどうか（Falseの場合は差分近似）
+    :param solver_mode: 熱収支式の解法
+                        "full": 5点の熱収支式を収束計算で解く
+                        "reduced": 外気側表面、室内側表面の温度を消去した3点の熱収支式を収束計算で解く
+                                   （熱伝達率が温度に依存しない計算モードの組み合わせの場合は、連立一次方程式として直接解く）
+    :param matrix_temp_init: 各部温度の初期値 (5,), degC
+                             （Noneの場合はinitial_guessによる初期値とする。指定した初期値で収束しなかった場合は、
+                             initial_guessによる初期値で再計算する）
+    :param initial_guess: 初期値の設定方法（get_initial_temperatureを参照）
     :return: 通気層の状態値（通気層の各層の温度、各層の熱収支、対流熱伝達率、放射熱伝達率、最適化の終了ステータス、終了メッセージ）
     """
 
-    # 通気層内の各点の温度の初期値を設定
-    matrix_temp = np.zeros(5)
-    matrix_temp[0] = parm.theta_e
-    matrix_temp[1] = parm.theta_e + (parm.theta_r - parm.theta_e) / (4 * 3)
-    matrix_temp[2] = parm.theta_e + (parm.theta_r - parm.theta_e) / (4 * 2)
-    matrix_temp[3] = parm.theta_e + (parm.theta_r - parm.theta_e) / (4 * 1)
-    matrix_temp[4] = (matrix_temp[1] + matrix_temp[2]) / 2
+    # 計算結果のメモ、キャッシュを使用している場合は、同じ計算条件の計算結果があればそれを返す
+    # （初期値を指定した場合は、複数の解を持つケースで初期値により解が異なるため、メモ、キャッシュを使用しない）
+    memo = wall_status_cache.get_memo()
+    memo_key = None
+    if memo is not None and matrix_temp_init is None:
+        memo_key = (parm, calc_mode_h_cv, calc_mode_h_rv, h_out, h_in, is_analytic_jacobian, solver_mode, initial_guess,
+                    get_air_property_table())
+        status = memo.get(memo_key)
+        if status is not None:
+            return status
+
+    cache = wall_status_cache.get_wall_status_cache()
+    cache_key = None
+    if cache is not None and matrix_temp_init is None:
+        cache_key = wall_status_cache.get_cache_key(parm, calc_mode_h_cv, calc_mode_h_rv, h_out, h_in, cache.model_version,
+                                                    is_analytic_jacobian=is_analytic_jacobian, solver_mode=solver_mode,
+                                                    initial_guess=initial_guess)
+        cached_values = cache.get(cache_key)
+        if cached_values is not None:
+            status = WallStatusValues(**cached_values)
+            if memo_key is not None:
+                memo.put(memo_key, status)
+            return status
+
+    # 熱収支式を作成
+    case = HeatBalanceCase(parm, calc_mode_h_cv, calc_mode_h_rv, h_out, h_in)
 
     # 通気層内の各層の熱収支式の最適解を収束計算で求める
-    optimize_result = optimize.root(fun=get_heat_balance, x0=matrix_temp, args=(parm, calc_mode_h_cv, calc_mode_h_rv, h_out, h_in), method='lm')
+    if matrix_temp_init is None or not np.all(np.isfinite(matrix_temp_init)):
+        optimize_result = solve_heat_balance(get_initial_temperature(parm, h_out, h_in, initial_guess), case,
+                                             is_analytic_jacobian, solver_mode)
+    else:
+        optimize_result = solve_heat_balance(np.array(matrix_temp_init, dtype=float), case, is_analytic_jacobian, solver_mode)
+
+        # 指定された初期値で収束しなかった場合は、initial_guessによる初期値で再計算する（評価回数は合算する）
+        if not optimize_result.success:
+            nfev = optimize_result.nfev
+            njev = optimize_result.get('njev', 0)
+            optimize_result = solve_heat_balance(get_initial_temperature(parm, h_out, h_in, initial_guess), case,
+                                                 is_analytic_jacobian, solver_mode)
+            optimize_result.nfev += nfev
+            optimize_result.njev = optimize_result.get('njev', 0) + njev
 
     # 収束した場合は各層の状態値を設定、収束しなかった場合はすべて無効（Nan）とする
     if optimize_result.success:
@@ -183,16 +679,10 @@ def get_wall_status_values(parm: Parameters, calc_mode_h_cv: str, calc_mode_h_rv
         matrix_temp_fixed = optimize_result.x
 
         # 各層の熱収支を計算
-        heat_balance = get_heat_balance(matrix_temp_fixed, parm, calc_mode_h_cv, calc_mode_h_rv, h_out, h_in)
+        heat_balance = case.get_heat_balance(matrix_temp_fixed).copy()
 
-        # 対流熱伝達率の計算
-        h_cv = heat_transfer_coefficient.get_convective_heat_transfer_coefficient(calc_mode=calc_mode_h_cv, v_a=parm.v_a, theta_1=matrix_temp_fixed[1], theta_2=matrix_temp_fixed[2], angle=parm.angle, l_h=parm.l_h, l_d=parm.l_d)
-
-        # 有効放射率の計算
-        effective_emissivity = heat_transfer_coefficient.effective_emissivity_parallel(emissivity_1=parm.emissivity_1, emissivity_2=parm.emissivity_2)
-
-        # 放射熱伝達率の計算
-        h_rv = heat_transfer_coefficient.get_radiative_heat_transfer_coefficient(calc_mode=calc_mode_h_rv, theta_1=matrix_temp_fixed[1], theta_2=matrix_temp_fixed[2], effective_emissivity=effective_emissivity)
+        # 対流熱伝達率、放射熱伝達率の計算
+        h_cv, h_rv, _, _ = case.get_heat_balance_coefficients(matrix_temp_fixed[1], matrix_temp_fixed[2], matrix_temp_fixed[4])
 
     else:
         matrix_temp_fixed = np.full(5, np.nan)
@@ -200,10 +690,475 @@ def get_wall_status_values(parm: Parameters, calc_mode_h_cv: str, calc_mode_h_rv
         h_cv = np.nan
         h_rv = np.nan
 
-    return WallStatusValues(matrix_temp=matrix_temp_fixed, matrix_heat_balance=heat_balance, h_cv=h_cv, h_rv=h_rv,
-                            is_optimize_succeed=optimize_result.success, optimize_status=optimize_result.status,
-                            optimize_message=optimize_result.message
-                            )
+    status = WallStatusValues(matrix_temp=matrix_temp_fixed, matrix_heat_balance=heat_balance, h_cv=h_cv, h_rv=h_rv,
+                              is_optimize_succeed=optimize_result.success, optimize_status=optimize_result.status,
+                              optimize_message=optimize_result.message, optimize_nfev=optimize_result.nfev,
+                              optimize_njev=optimize_result.get('njev', 0)
+                              )
+
+    # 計算結果をメモ、キャッシュに保存
+    if memo_key is not None:
+        memo.put(memo_key, status)
+    if cache_key is not None:
+        cache.put(cache_key, status)
+
+    return status
+
+
+@dataclass
+class ParameterBatch:
+    """
+    計算条件パラメータ群（複数ケース分）
+    各項目はParametersと同じで、ケース数Nの連続したfloat64の配列 (N,) として保持する
+    （連続したfloat64の配列を与えた場合は複写せずにそのまま保持するため、pandasの列との変換で複写が生じない）
+    """
+
+    # 外気温度, degree C
+    theta_e: np.ndarray
+
+    # 室内温度,　degree C
+    theta_r: np.ndarray
+
+    # 外気側表面に入射する日射量, W/m2
+    J_surf: np.ndarray
+
+    # 外気側表面日射吸収率
+    a_surf: np.ndarray
+
+    # 外気側部材の熱コンダクタンス,W/(m2・K)
+    C_1: np.ndarray
+
+    # 室内側部材の熱コンダクタンス, W/(m2・K)
+    C_2: np.ndarray
+
+    # 通気層の長さ, m
+    l_h: np.ndarray
+
+    # 通気層の幅, m
+    l_w: np.ndarray
+
+    # 通気層の厚さ, m
+    l_d: np.ndarray
+
+    # 通気層の傾斜角, degree
+    angle: np.ndarray
+
+    # 通気層の平均風速, m/s
+    v_a: np.ndarray
+
+    # 通気胴縁または垂木の間隔, m
+    l_s: np.ndarray
+
+    # 通気層に面する面1の放射率, -
+    emissivity_1: np.ndarray
+
+    # 通気層に面する面2の放射率, -
+    emissivity_2: np.ndarray
+
+    def __post_init__(self):
+        for field in fields(self):
+            setattr(self, field.name, np.ascontiguousarray(getattr(self, field.name), dtype=float))
+
+
+@dataclass
+class WallStatusBatch:
+    """
+    通気層の状態値（複数ケース分）
+    最適化の終了メッセージ（文字列）は保持せず、終了ステータス（整数）のみを保持する
+    """
+
+    # 通気層内の各点の温度 (N,5), degree C
+    matrix_temp: np.ndarray
+
+    # 各層の熱収支 (N,5), W/m2
+    matrix_heat_balance: np.ndarray
+
+    # 対流熱伝達率 (N,), W/(m2・K)
+    h_cv: np.ndarray
+
+    # 放射熱伝達率 (N,), W/(m2・K)
+    h_rv: np.ndarray
+
+    # 収束計算が正常に終了したかどうか (N,)
+    is_optimize_succeed: np.ndarray
+
+    # 収束計算の反復回数 (N,)
+    # （1ケースずつの収束計算による計算結果は評価回数）
+    optimize_iteration: np.ndarray
+
+    # 収束計算の終了ステータス (N,), int8
+    # （WallStatusValuesのoptimize_statusと同じ。一括計算で収束した場合は1、収束しなかった場合は0）
+    optimize_status: np.ndarray = None
+
+    def __post_init__(self):
+        if self.optimize_status is None:
+            self.optimize_status = self.is_optimize_succeed.astype(np.int8)
+
+
+def get_parameter_batch(parm_list: list) -> ParameterBatch:
+    """
+    計算条件パラメータ群のリストから、複数ケース分の計算条件パラメータ群を作成する
+
+    :param parm_list:   計算条件パラメータ群（Parameters）のリスト
+    :return:            複数ケース分の計算条件パラメータ群
+    """
+    return ParameterBatch(**{field.name: np.array([getattr(parm, field.name) for parm in parm_list], dtype=float)
+                             for field in fields(Parameters)})
+
+
+def get_wall_status_batch(status_list: list) -> WallStatusBatch:
+    """
+    通気層の状態値のリストから、複数ケース分の通気層の状態値を作成する（反復回数は熱収支式の評価回数とする）
+
+    :param status_list: 通気層の状態値（WallStatusValues）のリスト
+    :return:            複数ケース分の通気層の状態値
+    """
+    n_case = len(status_list)
+    return WallStatusBatch(
+        matrix_temp=np.array([status.matrix_temp for status in status_list], dtype=float).reshape(n_case, 5),
+        matrix_heat_balance=np.array([status.matrix_heat_balance for status in status_list], dtype=float).reshape(n_case, 5),
+        h_cv=np.fromiter((status.h_cv for status in status_list), dtype=float, count=n_case),
+        h_rv=np.fromiter((status.h_rv for status in status_list), dtype=float, count=n_case),
+        is_optimize_succeed=np.fromiter((status.is_optimize_succeed for status in status_list), dtype=bool, count=n_case),
+        optimize_iteration=np.fromiter((status.optimize_nfev for status in status_list), dtype=int, count=n_case),
+        optimize_status=np.fromiter((status.optimize_status for status in status_list), dtype=np.int8, count=n_case))
+
+
+def get_parameters_from_batch(parm_batch: ParameterBatch, index: int) -> Parameters:
+    """
+    複数ケース分の計算条件パラメータ群から、指定したケースの計算条件パラメータ群を取り出す
+
+    :param parm_batch:  複数ケース分の計算条件パラメータ群
+    :param index:       ケースの番号
+    :return:            計算条件パラメータ群
+    """
+    return Parameters(**{field.name: float(getattr(parm_batch, field.name)[index]) for field in fields(Parameters)})
+
+
+def get_parameter_batch_subset(parm_batch: ParameterBatch, index: np.ndarray) -> ParameterBatch:
+    """
+    複数ケース分の計算条件パラメータ群から、指定したケースのみを抽出する
+
+    :param parm_batch:  複数ケース分の計算条件パラメータ群
+    :param index:       抽出するケースの番号またはブール配列
+    :return:            抽出したケースの計算条件パラメータ群
+    """
+    return ParameterBatch(**{field.name: getattr(parm_batch, field.name)[index] for field in fields(ParameterBatch)})
+
+
+def get_heat_balance_batch(matrix_temp: np.ndarray, parm_batch: ParameterBatch, calc_mode_h_cv: str,
+                           calc_mode_h_rv: str, h_out: float, h_in: float) -> np.ndarray:
+    """
+    熱収支式を解く関数（複数ケースを一括で計算する）
+
+    :param matrix_temp: 各部温度計算結果 (N,5), degC
+    :param parm_batch:  複数ケース分の計算条件パラメータ群
+    :param calc_mode_h_cv:   対流熱伝達率の計算モード
+    :param calc_mode_h_rv:   放射熱伝達率の計算モード
+    :param h_out:       室外側総合熱伝達率, W/(m2・K)
+    :param h_in:        室内側総合熱伝達率, W/(m2・K)
+    :return: 　         各層の熱収支 (N,5), W/m2
+    """
+
+    p = parm_batch
+
+    # 相当外気温度を計算
+    theta_SAT = p.theta_e + (p.a_surf * p.J_surf) / h_out
+
+    # 行列の初期化
+    matrix_coeff = np.zeros(shape=(len(p.theta_e), 5, 5))
+    matrix_const = np.zeros(shape=(len(p.theta_e), 5))
+
+    # 通気層内の表面温度を設定
+    theta_1 = matrix_temp[:, 1]
+    theta_2 = matrix_temp[:, 2]
+
+    # 対流熱伝達率の計算
+    h_cv = heat_transfer_coefficient.get_convective_heat_transfer_coefficient_array(calc_mode_h_cv, p.v_a, theta_1, theta_2, p.angle, p.l_h, p.l_d)
+
+    # 有効放射率の計算
+    effective_emissivity = heat_transfer_coefficient.effective_emissivity_parallel_array(p.emissivity_1, p.emissivity_2)
+
+    # 放射熱伝達率の計算
+    h_rv = heat_transfer_coefficient.get_radiative_heat_transfer_coefficient_array(calc_mode_h_rv, theta_1, theta_2, effective_emissivity)
+
+    # 通気風量の計算
+    v_vent = p.v_a * p.l_d * p.l_w
+
+    # 通気層の平均空気温度の計算用の値を設定（風速ゼロのケースは後で上書きするため、警告を抑制する）
+    is_ventilated = p.v_a > 0.0
+    rho_air, c_air = get_air_properties(matrix_temp[:, 4])[:2]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        beta = (2 * h_cv * p.l_w) / (c_air * rho_air * v_vent)
+        epc_s = 1.0 / p.l_h * 1.0 / beta * (np.exp(-beta * p.l_h) - 1)
+
+    # 行列に値を設定
+    matrix_coeff[:, 0, 0] = h_out + p.C_1
+    matrix_coeff[:, 0, 1] = -p.C_1
+    matrix_coeff[:, 1, 0] = p.C_1
+    matrix_coeff[:, 1, 1] = -(h_cv + h_rv + p.C_1)
+    matrix_coeff[:, 1, 2] = h_rv
+    matrix_coeff[:, 1, 4] = h_cv
+    matrix_coeff[:, 2, 1] = h_rv
+    matrix_coeff[:, 2, 2] = -(h_cv + h_rv + p.C_2)
+    matrix_coeff[:, 2, 3] = p.C_2
+    matrix_coeff[:, 2, 4] = h_cv
+    matrix_coeff[:, 3, 2] = p.C_2
+    matrix_coeff[:, 3, 3] = -(h_in + p.C_2)
+    matrix_coeff[:, 4, 4] = -1.0
+    matrix_const[:, 0] = h_out * theta_SAT
+    matrix_const[:, 3] = -h_in * p.theta_r
+
+    matrix_coeff[:, 4, 1] = np.where(is_ventilated, (1.0 + epc_s) / 2, 0.5)
+    matrix_coeff[:, 4, 2] = np.where(is_ventilated, (1.0 + epc_s) / 2, 0.5)
+    matrix_const[:, 4] = np.where(is_ventilated, epc_s * p.theta_e, 0.0)
+
+    # 熱収支を計算
+    q_balance = np.matmul(matrix_coeff, matrix_temp[:, :, np.newaxis])[:, :, 0] - matrix_const
+
+    return q_balance
+
+
+def get_initial_temperature_batch(parm_batch: ParameterBatch) -> np.ndarray:
+    """
+    通気層内の各点の温度の初期値を設定する（複数ケース分、get_wall_status_valuesと同じ初期値）
+
+    :param parm_batch:  複数ケース分の計算条件パラメータ群
+    :return:            各部温度の初期値 (N,5), degC
+    """
+    matrix_temp = np.zeros(shape=(len(parm_batch.theta_e), 5))
+    matrix_temp[:, 0] = parm_batch.theta_e
+    matrix_temp[:, 1] = parm_batch.theta_e + (parm_batch.theta_r - parm_batch.theta_e) / (4 * 3)
+    matrix_temp[:, 2] = parm_batch.theta_e + (parm_batch.theta_r - parm_batch.theta_e) / (4 * 2)
+    matrix_temp[:, 3] = parm_batch.theta_e + (parm_batch.theta_r - parm_batch.theta_e) / (4 * 1)
+    matrix_temp[:, 4] = (matrix_temp[:, 1] + matrix_temp[:, 2]) / 2
+    return matrix_temp
+
+
+def get_wall_status_values_batch(parm_batch: ParameterBatch, calc_mode_h_cv: str, calc_mode_h_rv: str,
+                                 h_out: float, h_in: float, tolerance: float = 1.0e-8, max_iteration: int = 50,
+                                 is_fallback_to_scalar: bool = True) -> WallStatusBatch:
+    """
+    通気層の状態値を取得する（複数ケースの熱収支式をニュートン法で一括して解く）
+
+    各ケースの5元の熱収支式を (N,5,5) のヤコビ行列として積み重ね、全ケースを同時に反復計算する。
+    ヤコビ行列は前進差分で求め、残差が増加する場合はステップ幅を半減させる。
+
+    :param parm_batch:  複数ケース分の計算条件パラメータ群
+    :param calc_mode_h_cv:   対流熱伝達率の計算モード
+    :param calc_mode_h_rv:   放射熱伝達率の計算モード
+    :param h_out:       室外側総合熱伝達率, W/(m2・K)
+    :param h_in:        室内側総合熱伝達率, W/(m2・K)
+    :param tolerance:   収束判定に用いる熱収支の残差の許容値, W/m2
+    :param max_iteration:   最大反復回数
+    :param is_fallback_to_scalar:   収束しなかったケースをget_wall_status_valuesで解き直すかどうか
+    :return: 通気層の状態値（通気層の各層の温度、各層の熱収支、対流熱伝達率、放射熱伝達率、収束したかどうか、反復回数）
+    """
+
+    args = (calc_mode_h_cv, calc_mode_h_rv, h_out, h_in)
+    n_case = len(parm_batch.theta_e)
+
+    # 通気層内の各点の温度の初期値を設定
+    matrix_temp = get_initial_temperature_batch(parm_batch)
+
+    is_converged = np.zeros(n_case, dtype=bool)
+    optimize_iteration = np.zeros(n_case, dtype=int)
+
+    # 未収束のケースの番号
+    active = np.arange(n_case)
+
+    for iteration in range(max_iteration):
+
+        parm_active = get_parameter_batch_subset(parm_batch, active)
+        temp_active = matrix_temp[active]
+        q_active = get_heat_balance_batch(temp_active, parm_active, *args)
+        norm_active = np.max(np.abs(q_active), axis=1)
+
+        # 収束したケースを反復計算の対象から外す
+        is_converged_active = norm_active <= tolerance
+        is_converged[active[is_converged_active]] = True
+        optimize_iteration[active] = iteration
+        keep = ~is_converged_active & np.isfinite(norm_active)
+        active = active[keep]
+        if len(active) == 0:
+            break
+        parm_active = get_parameter_batch_subset(parm_active, keep)
+        temp_active = temp_active[keep]
+        q_active = q_active[keep]
+        norm_active = norm_active[keep]
+
+        # ヤコビ行列を前進差分で計算
+        jacobian = np.zeros(shape=(len(active), 5, 5))
+        for k in range(5):
+            step = 1.0e-7 * np.maximum(1.0, np.abs(temp_active[:, k]))
+            temp_step = temp_active.copy()
+            temp_step[:, k] += step
+            jacobian[:, :, k] = (get_heat_balance_batch(temp_step, parm_active, *args) - q_active) / step[:, np.newaxis]
+
+        # ニュートン法の修正量を計算（特異なヤコビ行列を含む場合は、該当ケースを未収束として打ち切る）
+        try:
+            delta = np.linalg.solve(jacobian, -q_active[:, :, np.newaxis])[:, :, 0]
+        except np.linalg.LinAlgError:
+            delta = np.full(shape=(len(active), 5), fill_value=np.nan)
+            for i in range(len(active)):
+                try:
+                    delta[i] = np.linalg.solve(jacobian[i], -q_active[i])
+                except np.linalg.LinAlgError:
+                    pass
+
+        # 残差が減少するまでステップ幅を半減させる
+        step_ratio = np.ones(len(active))
+        temp_next = temp_active + delta
+        for _ in range(10):
+            norm_next = np.max(np.abs(get_heat_balance_batch(temp_next, parm_active, *args)), axis=1)
+            is_rejected = ~(norm_next < norm_active)
+            if not np.any(is_rejected):
+                break
+            step_ratio[is_rejected] /= 2.0
+            temp_next = temp_active + step_ratio[:, np.newaxis] * delta
+
+        matrix_temp[active] = temp_next
+
+    else:
+        # 最大反復回数に達した場合も、最後の温度で収束判定を行う
+        if len(active) > 0:
+            q_active = get_heat_balance_batch(matrix_temp[active], get_parameter_batch_subset(parm_batch, active), *args)
+            is_converged_active = np.max(np.abs(q_active), axis=1) <= tolerance
+            is_converged[active[is_converged_active]] = True
+            optimize_iteration[active] = max_iteration
+
+    # 各層の熱収支、対流熱伝達率、放射熱伝達率を計算
+    heat_balance = get_heat_balance_batch(matrix_temp, parm_batch, *args)
+    h_cv = heat_transfer_coefficient.get_convective_heat_transfer_coefficient_array(
+        calc_mode_h_cv, parm_batch.v_a, matrix_temp[:, 1], matrix_temp[:, 2], parm_batch.angle, parm_batch.l_h, parm_batch.l_d)
+    effective_emissivity = heat_transfer_coefficient.effective_emissivity_parallel_array(parm_batch.emissivity_1, parm_batch.emissivity_2)
+    h_rv = heat_transfer_coefficient.get_radiative_heat_transfer_coefficient_array(
+        calc_mode_h_rv, matrix_temp[:, 1], matrix_temp[:, 2], effective_emissivity)
+
+    # 収束しなかったケースはすべて無効（Nan）とする
+    matrix_temp[~is_converged] = np.nan
+    heat_balance[~is_converged] = np.nan
+    h_cv = np.where(is_converged, h_cv, np.nan)
+    h_rv = np.where(is_converged, h_rv, np.nan)
+
+    # 収束計算の終了ステータス（一括計算で収束した場合は1、収束しなかった場合は0）
+    optimize_status = is_converged.astype(np.int8)
+
+    # 収束しなかったケースは、1ケースずつの収束計算で解き直す
+    if is_fallback_to_scalar:
+        for i in np.flatnonzero(~is_converged):
+            status = get_wall_status_values(get_parameters_from_batch(parm_batch, i), *args)
+            matrix_temp[i] = status.matrix_temp
+            heat_balance[i] = status.matrix_heat_balance
+            h_cv[i] = status.h_cv
+            h_rv[i] = status.h_rv
+            is_converged[i] = status.is_optimize_succeed
+            # 終了ステータスは一括計算と同じく収束した場合は1、収束しなかった場合は0とし、反復回数は評価回数とする
+            optimize_status[i] = int(status.is_optimize_succeed)
+            optimize_iteration[i] = status.optimize_nfev
+
+    return WallStatusBatch(matrix_temp=matrix_temp, matrix_heat_balance=heat_balance, h_cv=h_cv, h_rv=h_rv,
+                           is_optimize_succeed=is_converged, optimize_iteration=optimize_iteration,
+                           optimize_status=optimize_status)
+
+
+def iter_wall_status_time_series(parm: Parameters, theta_e: np.ndarray, theta_r: np.ndarray, j_surf: np.ndarray,
+                                 v_a: np.ndarray, calc_mode_h_cv: str, calc_mode_h_rv: str, h_out: float, h_in: float,
+                                 chunk_size: int = 744, is_warm_start: bool = True, is_skip_unchanged: bool = True,
+                                 **kwargs):
+    """
+    時系列（毎時など）の外気温度、室内温度、日射量、通気層の平均風速に対して、各時刻の通気層の状態値（定常解）を順に求め、
+    指定した時刻数ごとにまとめて返すジェネレータ
+
+    各時刻は、直前の時刻で収束した各部温度を収束計算の初期値とする（直前の時刻で収束しなかった場合は、initial_guessによる初期値とする）。
+    境界条件（外気温度、室内温度、日射量、通気層の平均風速）が直前の時刻と同じ場合は、収束計算を行わず直前の時刻の状態値とする
+    （反復回数はゼロとする）。
+
+    :param parm:            壁体の計算条件パラメータ群（外気温度、室内温度、日射量、通気層の平均風速は時系列の値に置き換える）
+    :param theta_e:         外気温度 (T,), degC
+    :param theta_r:         室内温度 (T,), degC
+    :param j_surf:          外気側表面に入射する日射量 (T,), W/m2
+    :param v_a:             通気層の平均風速 (T,), m/s（スカラーの場合は全時刻で同じ値）
+    :param calc_mode_h_cv:  対流熱伝達率の計算モード
+    :param calc_mode_h_rv:  放射熱伝達率の計算モード
+    :param h_out:           室外側総合熱伝達率, W/(m2・K)
+    :param h_in:            室内側総合熱伝達率, W/(m2・K)
+    :param chunk_size:      まとめて返す時刻数
+    :param is_warm_start:   直前の時刻の各部温度を収束計算の初期値とするかどうか
+    :param is_skip_unchanged:   境界条件が直前の時刻と同じ場合に収束計算を省略するかどうか
+    :param kwargs:          get_wall_status_valuesに渡すその他の引数
+    :return:                通気層の状態値（chunk_size時刻分のWallStatusBatch。最後のみ残りの時刻数）を時刻順に返すジェネレータ
+    """
+
+    theta_e, theta_r, j_surf, v_a = np.broadcast_arrays(*(np.asarray(values, dtype=float)
+                                                           for values in (theta_e, theta_r, j_surf, v_a)))
+    n_step = len(theta_e)
+
+    status = None
+    boundary_condition_previous = None
+    for start in range(0, n_step, chunk_size):
+        n_chunk = min(chunk_size, n_step - start)
+        matrix_temp = np.empty(shape=(n_chunk, 5))
+        heat_balance = np.empty(shape=(n_chunk, 5))
+        h_cv = np.empty(n_chunk)
+        h_rv = np.empty(n_chunk)
+        is_optimize_succeed = np.empty(n_chunk, dtype=bool)
+        optimize_iteration = np.zeros(n_chunk, dtype=int)
+        optimize_status = np.empty(n_chunk, dtype=np.int8)
+
+        for k, (theta_e_t, theta_r_t, j_surf_t, v_a_t) in enumerate(zip(theta_e[start:start + n_chunk].tolist(),
+                                                                         theta_r[start:start + n_chunk].tolist(),
+                                                                         j_surf[start:start + n_chunk].tolist(),
+                                                                         v_a[start:start + n_chunk].tolist())):
+
+            # 境界条件が直前の時刻と異なる場合のみ、直前の時刻の各部温度を初期値として収束計算を行う
+            boundary_condition = (theta_e_t, theta_r_t, j_surf_t, v_a_t)
+            if not (is_skip_unchanged and boundary_condition == boundary_condition_previous):
+                matrix_temp_init = status.matrix_temp if is_warm_start and status is not None \
+                    and status.is_optimize_succeed else None
+                status = get_wall_status_values(replace(parm, theta_e=theta_e_t, theta_r=theta_r_t, J_surf=j_surf_t,
+                                                        v_a=v_a_t),
+                                                calc_mode_h_cv, calc_mode_h_rv, h_out, h_in,
+                                                matrix_temp_init=matrix_temp_init, **kwargs)
+                optimize_iteration[k] = status.optimize_nfev
+                boundary_condition_previous = boundary_condition
+
+            matrix_temp[k] = status.matrix_temp
+            heat_balance[k] = status.matrix_heat_balance
+            h_cv[k] = status.h_cv
+            h_rv[k] = status.h_rv
+            is_optimize_succeed[k] = status.is_optimize_succeed
+            optimize_status[k] = status.optimize_status
+
+        yield WallStatusBatch(matrix_temp=matrix_temp, matrix_heat_balance=heat_balance, h_cv=h_cv, h_rv=h_rv,
+                              is_optimize_succeed=is_optimize_succeed, optimize_iteration=optimize_iteration,
+                              optimize_status=optimize_status)
+
+
+def get_wall_status_time_series(parm: Parameters, theta_e: np.ndarray, theta_r: np.ndarray, j_surf: np.ndarray,
+                                v_a: np.ndarray, calc_mode_h_cv: str, calc_mode_h_rv: str, h_out: float, h_in: float,
+                                **kwargs) -> WallStatusBatch:
+    """
+    時系列の境界条件に対する各時刻の通気層の状態値を求め、全時刻分をまとめて返す（iter_wall_status_time_seriesを参照）
+
+    :param parm:            壁体の計算条件パラメータ群（外気温度、室内温度、日射量、通気層の平均風速は時系列の値に置き換える）
+    :param theta_e:         外気温度 (T,), degC
+    :param theta_r:         室内温度 (T,), degC
+    :param j_surf:          外気側表面に入射する日射量 (T,), W/m2
+    :param v_a:             通気層の平均風速 (T,), m/s
+    :param calc_mode_h_cv:  対流熱伝達率の計算モード
+    :param calc_mode_h_rv:  放射熱伝達率の計算モード
+    :param h_out:           室外側総合熱伝達率, W/(m2・K)
+    :param h_in:            室内側総合熱伝達率, W/(m2・K)
+    :param kwargs:          iter_wall_status_time_seriesに渡すその他の引数
+    :return:                通気層の状態値（T時刻分）
+    """
+
+    chunks = list(iter_wall_status_time_series(parm, theta_e, theta_r, j_surf, v_a, calc_mode_h_cv, calc_mode_h_rv,
+                                               h_out, h_in, **kwargs))
+
+    return WallStatusBatch(**{field.name: np.concatenate([getattr(chunk, field.name) for chunk in chunks])
+                              for field in fields(WallStatusBatch)})
 
 
 def get_heat_flow_0(matrix_temp: np.ndarray, param: Parameters, h_out: float) -> float:
@@ -250,13 +1205,14 @@ def get_heat_flow_exhaust(matrix_temp: np.ndarray, param: Parameters, theta_as_i
         # 通気風量の計算
         v_vent = param.v_a * param.l_d * param.l_w
 
-        ec = math.exp(- 2.0 * h_cv * param.l_w * param.l_h / (get_c_air(matrix_temp[4]) * get_rho_air(matrix_temp[4]) * v_vent))
+        rho_air, c_air = get_air_properties(matrix_temp[4])[:2]
+        ec = math.exp(- 2.0 * h_cv * param.l_w * param.l_h / (c_air * rho_air * v_vent))
 
         # 出口温度の計算
         theta_out = (1.0 - ec) * (matrix_temp[1] + matrix_temp[2]) / 2.0 + ec * theta_as_in
 
         # 通気層の排気熱量
-        return get_c_air(matrix_temp[4]) * get_rho_air(matrix_temp[4]) * v_vent * (theta_out - theta_as_in) / (param.l_w * param.l_h)
+        return c_air * rho_air * v_vent * (theta_out - theta_as_in) / (param.l_w * param.l_h)
 
     else:
         return 0.0
@@ -314,6 +1270,92 @@ def get_heat_flow_4(matrix_temp: np.ndarray, param: Parameters, h_in: float) ->
     return h_in * (matrix_temp[3] - param.theta_r)
 
 
+@dataclass
+class HeatFlowBatch:
+    """
+    各部の熱流（複数ケース分）
+    各項目はケース数Nの配列 (N,) として保持する
+    """
+
+    # 屋外側表面熱流, W/m2
+    q_0: np.ndarray
+
+    # 外装材伝導熱量, W/m2
+    q_1: np.ndarray
+
+    # 通気層の対流による熱伝達量（面1から面2）, W/m2
+    q_2_cv: np.ndarray
+
+    # 通気層の放射による熱伝達量（面1から面2）, W/m2
+    q_2_rv: np.ndarray
+
+    # 断熱材+内装材伝導熱量, W/m2
+    q_3: np.ndarray
+
+    # 室内表面熱流, W/m2
+    q_4: np.ndarray
+
+    # 通気層内表面から通気層空気への対流熱量, W/m2
+    q_convect: np.ndarray
+
+    # 通気層からの排気熱量, W/m2
+    q_exhaust: np.ndarray
+
+    # 壁体全体の熱収支の誤差（屋外側表面熱流 - 排気熱量 - 室内表面熱流）, W/m2
+    closure_error: np.ndarray
+
+    # 熱収支の誤差の絶対値が許容値を超えるかどうか（各部温度が無効（Nan）の場合もTrue）
+    is_closure_exceeded: np.ndarray
+
+
+def get_heat_flow_batch(matrix_temp: np.ndarray, parm_batch: ParameterBatch, h_cv: np.ndarray, h_rv: np.ndarray,
+                        h_out: float, h_in: float, tolerance: float = 1.0e-6) -> HeatFlowBatch:
+    """
+    各部温度から各部の熱流と壁体全体の熱収支の誤差を計算する（複数ケースを一括で計算する）
+    各熱流はget_heat_flow_0～4、get_heat_flow_exhaust（通気層への流入温度は外気温度）、get_heat_flow_convect_vent_layerと
+    同じ式で計算する（指数関数の丸め誤差の差を除き同じ値となる）
+
+    :param matrix_temp: 各部温度計算結果 (N,5), degC
+    :param parm_batch:  複数ケース分の計算条件パラメータ群
+    :param h_cv:        通気層の対流熱伝達率 (N,), W/(m2・K)
+    :param h_rv:        通気層の放射熱伝達率 (N,), W/(m2・K)
+    :param h_out:       室外側総合熱伝達率, W/(m2・K)
+    :param h_in:        室内側総合熱伝達率, W/(m2・K)
+    :param tolerance:   熱収支の誤差の許容値, W/m2
+    :return:            各部の熱流、熱収支の誤差、誤差が許容値を超えるかどうか
+    """
+
+    p = parm_batch
+    theta_0, theta_1, theta_2, theta_3, theta_as = matrix_temp.T
+
+    # 相当外気温度を計算
+    theta_sat = p.theta_e + (p.a_surf * p.J_surf) / h_out
+
+    q_0 = h_out * (theta_sat - theta_0)
+    q_1 = p.C_1 * (theta_0 - theta_1)
+    q_2_cv = h_cv * (theta_1 - theta_2)
+    q_2_rv = h_rv * (theta_1 - theta_2)
+    q_3 = p.C_2 * (theta_2 - theta_3)
+    q_4 = h_in * (theta_3 - p.theta_r)
+    q_convect = 2.0 * h_cv * ((theta_1 + theta_2) / 2.0 - theta_as)
+
+    # 通気層からの排気熱量（風速ゼロのケースはゼロとするため、警告を抑制する）
+    v_vent = p.v_a * p.l_d * p.l_w
+    rho_air, c_air = get_air_properties(theta_as)[:2]
+    c_rho = c_air * rho_air
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        ec = np.exp(- 2.0 * h_cv * p.l_w * p.l_h / (c_rho * v_vent))
+        theta_out = (1.0 - ec) * (theta_1 + theta_2) / 2.0 + ec * p.theta_e
+        q_exhaust = np.where(p.v_a > 0.0, c_rho * v_vent * (theta_out - p.theta_e) / (p.l_w * p.l_h), 0.0)
+
+    # 壁体全体の熱収支の誤差
+    closure_error = q_0 - q_exhaust - q_4
+    is_closure_exceeded = ~(np.abs(closure_error) <= tolerance)
+
+    return HeatFlowBatch(q_0=q_0, q_1=q_1, q_2_cv=q_2_cv, q_2_rv=q_2_rv, q_3=q_3, q_4=q_4, q_convect=q_convect,
+                         q_exhaust=q_exhaust, closure_error=closure_error, is_closure_exceeded=is_closure_exceeded)
+
+
 # デバッグ用
 # parm_1: Parameters = Parameters(-20, 20, 500, 1.0, 50.25, 2.55, 3.0, 0.05, 0.05, 45.0, 0.5, 0.45, 0.9, 0.9)
 # status = get_wall_status_values(parm_1, h_out=25.0, h_in=9.0)
@@ -1,4 +1,9 @@
+import dataclasses
+import functools
 import itertools
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
 import global_number
@@ -6,6 +11,8 @@ import ventilation_wall as vw
 import ventilation_wall_simplified as vws
 import envelope_performance_factors as epf
 import heat_transfer_coefficient as htc
+import wall_status_data_store as wsds
+import wall_status_cache as wsc
 
 
 class Log:
@@ -18,11 +25,11 @@ class Log:
         print("LOG: %s" % msg)
 
 
-def get_parameter_list() -> object:
+def get_parameter_values() -> list:
     """
-    複数のパラメータの総当たりの組み合わせ（直積）のリストを作成する
+    総当たりの組み合わせを作成する各パラメータの値のリストを作成する
     :param なし
-    :return: 総当たりのパラメータリスト
+    :return: パラメータごとの値のリスト（get_parameter_listの直積の順）
     """
 
     # 外気温度は、冬期条件（-10.0～10.0degC）、夏期条件（25.0～35.0degC）をそれぞれ与える
@@ -43,50 +50,451 @@ def get_parameter_list() -> object:
     emissivity_1 = [0.9]                                                            # 通気層に面する面1の放射率, -
     emissivity_2 = np.array([0.1, np.median([0.1, 0.9]), 0.9], dtype=float)         # 通気層に面する面2の放射率, -
 
-    parameter_list = list(itertools.product(theta_e, theta_r, j_surf, a_surf, C_1, C_2, l_h, l_w, l_d, angle,
-                                            v_a, l_s, emissivity_1, emissivity_2))
+    return [theta_e, theta_r, j_surf, a_surf, C_1, C_2, l_h, l_w, l_d, angle, v_a, l_s, emissivity_1, emissivity_2]
+
+
+def get_parameter_list(parameter_values: list = None) -> object:
+    """
+    複数のパラメータの総当たりの組み合わせ（直積）のリストを作成する
+    :param parameter_values: パラメータごとの値のリスト（Noneの場合はget_parameter_valuesの値）
+    :return: 総当たりのパラメータリスト
+    """
+
+    if parameter_values is None:
+        parameter_values = get_parameter_values()
+
+    parameter_list = list(itertools.product(*parameter_values))
 
     return parameter_list
 
 
-def get_wall_status_data_by_detailed_calculation(calc_mode_h_cv: str, calc_mode_h_rv: str) -> pd.DataFrame:
+class ParameterGrid:
+    """
+    総当たりのパラメータの組み合わせ（直積）を、リストを作成せずに通し番号で参照する
+    通し番号は混合基数（各パラメータの値の数）の数として各パラメータの値のインデックスに分解する（get_parameter_listと同じ順）
+    スライスは指定範囲の通し番号を持つParameterGridを返し、DataFrameはget_data_frameで必要な範囲のみ作成する
+    """
+
+    def __init__(self, parameter_values: list = None, parameter_name: list = None, start: int = 0, stop: int = None):
+        """
+        :param parameter_values:    パラメータごとの値のリスト（Noneの場合はget_parameter_valuesの値）
+        :param parameter_name:      パラメータ名のリスト（Noneの場合は総当たりのパラメータのDataFrameの列名）
+        :param start:               参照する範囲の最初の通し番号
+        :param stop:                参照する範囲の最後の通し番号の次の番号（Noneの場合は全ケース数）
+        """
+
+        if parameter_values is None:
+            parameter_values = get_parameter_values()
+        if parameter_name is None:
+            parameter_name = ['theta_e', 'theta_r', 'j_surf', 'a_surf', 'C_1', 'C_2', 'l_h', 'l_w', 'l_d', 'angle',
+                              'v_a', 'l_s', 'emissivity_1', 'emissivity_2']
+
+        self.parameter_values = [np.asarray(values, dtype=float) for values in parameter_values]
+        self.parameter_name = list(parameter_name)
+        self.shape = tuple(len(values) for values in self.parameter_values)
+        self.n_case_all = int(np.prod(self.shape))
+        self.start = start
+        self.stop = self.n_case_all if stop is None else stop
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, key):
+        """
+        :param key: 通し番号（参照する範囲の先頭からの番号、負の値は末尾から）またはスライス（刻みは1のみ）
+        :return:    通し番号の場合はパラメータのタプル、スライスの場合はParameterGrid
+        """
+
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                raise ValueError("スライスの刻みは1のみ指定できます")
+            return ParameterGrid(self.parameter_values, self.parameter_name, self.start + start, self.start + max(stop, start))
+
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("通し番号が範囲外です")
+
+        return self.get_parameters(self.start + key)
+
+    def __iter__(self):
+        for chunk in self.iter_chunks():
+            yield from map(tuple, chunk.get_parameter_array().tolist())
+
+    def get_parameters(self, index: int) -> tuple:
+        """
+        :param index:   通し番号（全ケースに対する番号）
+        :return:        パラメータのタプル
+        """
+
+        digits = np.unravel_index(index, self.shape)
+
+        return tuple(float(values[digit]) for values, digit in zip(self.parameter_values, digits))
+
+    def get_parameter_array(self) -> np.ndarray:
+        """
+        :return: 参照する範囲の全ケースのパラメータ (ケース数, パラメータ数)
+        """
+
+        digits = np.unravel_index(np.arange(self.start, self.stop), self.shape)
+
+        return np.column_stack([values[digit] for values, digit in zip(self.parameter_values, digits)])
+
+    def get_data_frame(self) -> pd.DataFrame:
+        """
+        :return: 参照する範囲の全ケースのパラメータのDataFrame（インデックスは通し番号）
+        """
+
+        # パラメータごとに連続した配列 (パラメータ数, ケース数) を作成し、複写せずにDataFrameの列とする
+        digits = np.unravel_index(np.arange(self.start, self.stop), self.shape)
+        columns = np.stack([values[digit] for values, digit in zip(self.parameter_values, digits)])
+
+        return pd.DataFrame(columns.T, columns=self.parameter_name, index=pd.RangeIndex(self.start, self.stop), copy=False)
+
+    def iter_chunks(self, chunk_size: int = 100000):
+        """
+        :param chunk_size:  1ブロックのケース数
+        :return:            参照する範囲を分割したParameterGridを順に返すジェネレータ
+        """
+
+        for start in range(0, len(self), chunk_size):
+            yield self[start:start + chunk_size]
+
+
+def get_snake_order(shape: tuple) -> np.ndarray:
+    """
+    総当たりのパラメータリストを、隣り合うケースのパラメータの違いが1つのパラメータの1段階のみとなる順
+    （各パラメータの走査方向を上位のパラメータが変わるごとに反転させる、混合基数の反射グレイコード順）に並べる
+
+    :param shape:   パラメータごとの値の数（直積の順）
+    :return:        並べ替えたケースの、総当たりのパラメータリストにおけるインデックス
+    """
+
+    n_case = int(np.prod(shape))
+    index = np.arange(n_case)
+
+    # 直積の順のインデックスを各パラメータの値のインデックスに分解する
+    digits = np.array(np.unravel_index(index, shape))
+
+    # 上位のパラメータの値の組み合わせの通し番号が奇数の場合は、そのパラメータの走査方向を反転させる
+    for i, n_value in enumerate(shape):
+        prefix_count = index // int(np.prod(shape[i:]))
+        digits[i] = np.where(prefix_count % 2 == 1, n_value - 1 - digits[i], digits[i])
+
+    return np.ravel_multi_index(tuple(digits), shape)
+
+
+def get_wall_status_list_by_warm_start(parameter_list: list, shape: tuple, calc_mode_h_cv: str, calc_mode_h_rv: str,
+                                       h_out: float, h_in: float, **kwargs) -> list:
+    """
+    総当たりのパラメータリストの各ケースを、パラメータの違いが最小となる順に計算し、
+    直前に計算したケース（隣接するケース）の各部温度を初期値として通気層の状態値を取得する
+    （直前のケースが収束しなかった場合、初期値で収束しなかった場合は、線形補間の初期値で計算する）
+
+    :param parameter_list:  総当たりのパラメータリスト
+    :param shape:           パラメータごとの値の数（直積の順）
+    :param calc_mode_h_cv:  対流熱伝達率の計算モード
+    :param calc_mode_h_rv:  放射熱伝達率の計算モード
+    :param h_out:           室外側総合熱伝達率, W/(m2・K)
+    :param h_in:            室内側総合熱伝達率, W/(m2・K)
+    :param kwargs:          get_wall_status_valuesに渡すその他の引数
+    :return: 通気層の状態値のリスト（総当たりのパラメータリストの順）
+    """
+
+    status_list = [None] * len(parameter_list)
+
+    matrix_temp_init = None
+    for i in get_snake_order(shape):
+        status = vw.get_wall_status_values(vw.Parameters(*parameter_list[i]), calc_mode_h_cv, calc_mode_h_rv,
+                                           h_out, h_in, matrix_temp_init=matrix_temp_init, **kwargs)
+        status_list[i] = status
+        matrix_temp_init = status.matrix_temp if status.is_optimize_succeed else None
+
+    return status_list
+
+
+def get_wall_status_data_by_parallel_calculation(chunk_function, cases, max_workers: int = 1,
+                                                  chunk_size: int = None, **kwargs) -> pd.DataFrame:
+    """
+    計算条件パラメータを複数のブロックに分割し、ブロックごとの計算をプロセスプールで並列に実行して、
+    計算結果を元の行の順に結合する（結果は逐次計算と同一となる）
+
+    :param chunk_function:  ブロックごとの計算を行う関数（第1引数にDataFrameを受け取り、計算結果を追加したDataFrameを返す）
+    :param cases:           計算条件パラメータのDataFrameまたはParameterGrid
+                            （ParameterGridの場合は、各ブロックのDataFrameを計算するプロセス内で作成する）
+    :param max_workers:     並列計算のプロセス数（1の場合は逐次計算、Noneの場合はCPUのコア数）
+    :param chunk_size:      1ブロックのケース数（Noneの場合は、逐次計算では全ケース、並列計算ではプロセス数の4倍のブロック数となるケース数）
+    :param kwargs:          chunk_functionに渡すその他の引数
+    :return: DataFrame
+    """
+
+    # ブロックの分割
+    n_case = len(cases)
+    if chunk_size is None:
+        if max_workers == 1:
+            chunk_size = max(n_case, 1)
+        else:
+            chunk_size = max(math.ceil(n_case / (4 * (max_workers or os.cpu_count()))), 1)
+    if isinstance(cases, ParameterGrid):
+        chunks = list(cases.iter_chunks(chunk_size))
+    else:
+        chunks = [cases.iloc[start:start + chunk_size] for start in range(0, n_case, chunk_size)]
+
+    # 計算結果のキャッシュを使用している場合は、未書き込みの計算結果をプロセスの作成前に書き込んでおく
+    cache = wsc.get_wall_status_cache()
+    if cache is not None:
+        cache.flush()
+
+    # ブロックごとの計算（executor.mapは入力の順に計算結果を返す）
+    function = functools.partial(_get_wall_status_data_chunk, chunk_function, **kwargs)
+    if max_workers == 1:
+        results = [function(chunk) for chunk in chunks]
+    else:
+        # キャッシュ、メモ、空気の物性値表の設定は、各プロセスの起動時に設定し直す
+        # （fork以外の起動方法（spawn、forkserver）ではモジュールの設定が子プロセスに引き継がれないため）
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_initialize_worker,
+                                 initargs=_get_worker_settings()) as executor:
+            results = list(executor.map(function, chunks))
+
+    return pd.concat(results)
+
+
+def _get_worker_settings() -> tuple:
+    """
+    並列計算の各プロセスに引き継ぐ、計算結果のキャッシュ、メモ、空気の物性値表の設定を取得する
+
+    :return: キャッシュの設定(path, max_entries)、メモの容量、物性値表の設定(t_min, t_max, resolution)（使用していない場合はそれぞれNone）
+    """
+
+    cache = wsc.get_wall_status_cache()
+    cache_settings = None if cache is None else (cache.path, cache.max_entries)
+
+    memo = wsc.get_memo()
+    memo_capacity = None if memo is None else memo.capacity
+
+    table = global_number.get_air_property_table()
+    table_settings = None if table is None else (table.t_min, table.t_max, table.resolution)
+
+    return cache_settings, memo_capacity, table_settings
+
+
+def _initialize_worker(cache_settings: tuple, memo_capacity: int, table_settings: tuple):
+    """
+    並列計算の各プロセスの起動時に、親プロセスと同じキャッシュ、メモ、空気の物性値表の設定を行う
+
+    :param cache_settings:  キャッシュの設定(path, max_entries)（Noneの場合はキャッシュを使用しない）
+    :param memo_capacity:   メモの容量（Noneの場合はメモを使用しない）
+    :param table_settings:  物性値表の設定(t_min, t_max, resolution)（Noneの場合は物性値表を使用しない）
+    :return: なし
+    """
+
+    if cache_settings is None:
+        wsc.clear_wall_status_cache()
+    else:
+        wsc.set_wall_status_cache(*cache_settings)
+
+    if memo_capacity is None:
+        wsc.clear_memo()
+    else:
+        wsc.set_memo(memo_capacity)
+
+    if table_settings is None:
+        global_number.clear_air_property_table()
+    else:
+        global_number.set_air_property_table(*table_settings)
+
+
+def _get_wall_status_data_chunk(chunk_function, chunk, **kwargs) -> pd.DataFrame:
+    """
+    1ブロックの計算を行う（ParameterGridの場合はDataFrameを作成してから計算する）
+
+    :param chunk_function:  ブロックごとの計算を行う関数
+    :param chunk:           計算条件パラメータのDataFrameまたはParameterGrid
+    :param kwargs:          chunk_functionに渡すその他の引数
+    :return: DataFrame
+    """
+
+    if isinstance(chunk, ParameterGrid):
+        chunk = chunk.get_data_frame()
+
+    df = chunk_function(chunk, **kwargs)
+
+    # 計算結果のキャッシュを使用している場合は、ブロックの計算結果をデータベースに書き込む
+    # （並列計算のプロセスは終了時の処理を行わないため、ブロックごとに書き込む）
+    cache = wsc.get_wall_status_cache()
+    if cache is not None:
+        cache.flush()
+
+    return df
+
+
+def get_unique_case_index(df: pd.DataFrame, calc_mode_h_cv: str) -> tuple:
+    """
+    詳細計算の計算結果に影響するパラメータ（実効的な入力）のみからなるキーにより、総当たりパラメータの重複ケースを判定する
+    以下のパラメータはキーから除外する
+      - 通気層の幅（betaの分子と通気風量の両方に含まれ、相殺される）
+      - 日射吸収率と日射量（相当外気温度の計算に積としてのみ用いるため、積をキーとする）
+      - 通気胴縁または垂木の間隔（有効放射率を無限平行面として計算するため、使用しない）
+      - 通気層の傾斜角（対流熱伝達率が表面温度に依存しない計算モードの場合は、使用しない）
+
+    :param df:              計算条件パラメータのDataFrame
+    :param calc_mode_h_cv:  対流熱伝達率の計算モード
+    :return: 重複を除いたケース（キーごとに最初に現れるケース）の行番号（昇順）,
+             各ケースに対応する、重複を除いたケースの通し番号（前者の配列のインデックス）
+    """
+
+    key_name = ['theta_e', 'theta_r', 'C_1', 'C_2', 'l_h', 'l_d', 'angle', 'v_a', 'emissivity_1', 'emissivity_2']
+    if not htc.is_temperature_dependent_calc_mode(calc_mode_h_cv):
+        key_name.remove('angle')
+
+    key = np.column_stack([df['a_surf'].to_numpy() * df['j_surf'].to_numpy()] + [df[name].to_numpy() for name in key_name])
+
+    # np.uniqueはキーの昇順に並べるため、最初に現れる行番号の昇順に並べ直す
+    _, index_first, index_inverse = np.unique(key, axis=0, return_index=True, return_inverse=True)
+    order = np.argsort(index_first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+
+    return index_first[order], rank[index_inverse.ravel()]
+
+
+def get_wall_status_data_by_detailed_calculation(calc_mode_h_cv: str, calc_mode_h_rv: str,
+                                                  is_warm_start: bool = False, max_workers: int = 1,
+                                                  chunk_size: int = None, is_deduplicate: bool = False,
+                                                  grid: ParameterGrid = None) -> pd.DataFrame:
     """
     通気層を有する壁体の総当たりパラメータを取得し、各ケースの計算結果を保有するDataFrameを作成する
 
     :param calc_mode_h_cv: 対流熱伝達率の計算モード
     :param calc_mode_h_rv: 放射熱伝達率の計算モード
+    :param is_warm_start: パラメータの違いが最小となる順に計算し、隣接するケースの計算結果を収束計算の初期値とするかどうか
+                          （並列計算の場合、初期値の引き継ぎは分割した各ブロック内で行う）
+    :param max_workers: 並列計算のプロセス数（get_wall_status_data_by_parallel_calculationを参照）
+    :param chunk_size:  並列計算で1プロセスに渡すケース数（get_wall_status_data_by_parallel_calculationを参照）
+    :param is_deduplicate: 計算結果に影響しないパラメータのみが異なるケースを1回だけ計算し、計算結果を各ケースに複写するかどうか
+                           （get_unique_case_indexを参照。通気層の幅の相殺による丸め誤差程度の差が生じる）
+    :param grid:        総当たりのパラメータの組み合わせ（Noneの場合はget_parameter_valuesの値による組み合わせ）
     :return: DataFrame
     """
 
-    # パラメータの総当たりリストを作成する
-    parameter_name = ['theta_e', 'theta_r', 'j_surf', 'a_surf', 'C_1', 'C_2', 'l_h', 'l_w', 'l_d', 'angle',
-                      'v_a', 'l_s', 'emissivity_1', 'emissivity_2']
-    df = pd.DataFrame(get_parameter_list(), columns=parameter_name)
+    # パラメータの総当たりの組み合わせ
+    if grid is None:
+        grid = ParameterGrid()
+
+    # 重複の除去、計算順の並べ替えを行わない場合は、各ケースのパラメータを計算時に作成する
+    if not (is_deduplicate or is_warm_start):
+        return get_wall_status_data_by_parallel_calculation(
+            get_wall_status_data_chunk_by_detailed_calculation, grid, max_workers=max_workers, chunk_size=chunk_size,
+            calc_mode_h_cv=calc_mode_h_cv, calc_mode_h_rv=calc_mode_h_rv)
+
+    df = grid.get_data_frame()
+
+    # 重複を除いたケースのみを計算する
+    df_calc = df
+    if is_deduplicate:
+        index_unique, index_inverse = get_unique_case_index(df, calc_mode_h_cv)
+        df_calc = df.iloc[index_unique]
+
+    # 隣接するケースの計算結果を初期値とする場合は、パラメータの違いが最小となる順に並べ替えて計算する
+    if is_warm_start:
+        snake_rank = np.empty(len(df), dtype=int)
+        snake_rank[get_snake_order(grid.shape)] = np.arange(len(df))
+        df_calc = df_calc.iloc[np.argsort(snake_rank[df_calc.index.to_numpy()], kind='stable')]
+
+    df_calc = get_wall_status_data_by_parallel_calculation(
+        get_wall_status_data_chunk_by_detailed_calculation, df_calc, max_workers=max_workers, chunk_size=chunk_size,
+        calc_mode_h_cv=calc_mode_h_cv, calc_mode_h_rv=calc_mode_h_rv, is_warm_start=is_warm_start)
+
+    # 総当たりのパラメータリストの順に戻す
+    if is_warm_start:
+        df_calc = df_calc.sort_index()
+
+    # 重複を除いたケースの計算結果を、総当たりの各ケースに複写する
+    if is_deduplicate:
+        df = df.copy()
+        for name in df_calc.columns.drop(grid.parameter_name):
+            df[name] = df_calc[name].to_numpy()[index_inverse]
+        df_calc = df
+
+    return df_calc
+
+
+def get_wall_status_data_by_detailed_calculation_multi_mode(calc_modes: list, max_workers: int = 1,
+                                                             chunk_size: int = None, grid: ParameterGrid = None,
+                                                             is_seed_from_detailed: bool = True) -> dict:
+    """
+    複数の計算モードの組み合わせについて、総当たりパラメータを1回だけ走査して詳細計算の計算結果を作成する
+    各ケースでは、対流熱伝達率、放射熱伝達率ともに詳細計算とする計算モードで最初に解き、その解を他の計算モードの収束計算の初期値とする
+    計算モードごとに、計算結果に影響しないパラメータのみが異なるケースは1回だけ計算する（get_unique_case_indexを参照）
+    なお、熱収支式の解が複数存在するケース（放射熱伝達率ゼロの一部のケースなど）では、初期値によって得られる解が異なる
+
+    :param calc_modes:  計算モードの組み合わせ（対流熱伝達率の計算モード, 放射熱伝達率の計算モード）のリスト
+    :param max_workers: 並列計算のプロセス数（get_wall_status_data_by_parallel_calculationを参照）
+    :param chunk_size:  並列計算で1プロセスに渡すケース数（get_wall_status_data_by_parallel_calculationを参照）
+    :param grid:        総当たりのパラメータの組み合わせ（Noneの場合はget_parameter_valuesの値による組み合わせ）
+    :param is_seed_from_detailed: 詳細計算の解を他の計算モードの初期値とするかどうか
+                                  （Falseの場合は線形補間の初期値とし、計算モードごとに計算した場合と同じ結果となる）
+    :return: 計算モードの組み合わせをキーとする、計算結果のDataFrame（get_wall_status_data_by_detailed_calculationと同じ列）の辞書
+    """
+
+    # パラメータの総当たりの組み合わせ
+    if grid is None:
+        grid = ParameterGrid()
+    df = grid.get_data_frame()
+
+    # 初期値の計算に用いる詳細計算のモードを先頭とする
+    calc_modes_solve = [("detailed", "detailed")] + [calc_mode for calc_mode in calc_modes if calc_mode != ("detailed", "detailed")]
+
+    # 計算モードごとの重複を除いたケース（いずれも、対流熱伝達率を詳細計算とする場合の重複を除いたケースに含まれる）
+    index_unique = {}
+    index_inverse = {}
+    for calc_mode_h_cv, calc_mode_h_rv in calc_modes_solve:
+        index_unique[(calc_mode_h_cv, calc_mode_h_rv)], index_inverse[(calc_mode_h_cv, calc_mode_h_rv)] \
+            = get_unique_case_index(df, calc_mode_h_cv)
+
+    # 計算するケースと、ケースごとに計算する計算モード（列名"is_solve_[計算モードの番号]"）を設定
+    index_calc = index_unique[("detailed", "detailed")]
+    df_calc = df.iloc[index_calc].copy()
+    for k, calc_mode in enumerate(calc_modes_solve):
+        df_calc['is_solve_%d' % k] = np.isin(index_calc, index_unique[calc_mode])
+
+    df_calc = get_wall_status_data_by_parallel_calculation(
+        get_wall_status_data_chunk_by_detailed_calculation_multi_mode, df_calc, max_workers=max_workers,
+        chunk_size=chunk_size, calc_modes=calc_modes_solve, is_seed_from_detailed=is_seed_from_detailed)
+
+    # 計算モードごとに、重複を除いたケースの計算結果を総当たりの各ケースに複写する
+    result = {}
+    for k, calc_mode in enumerate(calc_modes_solve):
+        if calc_mode not in calc_modes:
+            continue
+        df_mode = df_calc[df_calc['calc_mode_index'] == k].drop(columns='calc_mode_index').sort_index()
+        df_result = df.copy()
+        for name in df_mode.columns.drop(grid.parameter_name):
+            df_result[name] = df_mode[name].to_numpy()[index_inverse[calc_mode]]
+        result[calc_mode] = df_result
+
+    return result
+
+
+def get_wall_status_data_chunk_by_detailed_calculation_multi_mode(df: pd.DataFrame, calc_modes: list,
+                                                                   is_seed_from_detailed: bool = True) -> pd.DataFrame:
+    """
+    総当たりパラメータの一部（DataFrameの各行）について、複数の計算モードの組み合わせの詳細計算の計算結果を作成する
+
+    :param df:          計算条件パラメータと、計算モードごとに計算するかどうか（列名"is_solve_[計算モードの番号]"）のDataFrame
+    :param calc_modes:  計算モードの組み合わせのリスト（先頭は対流熱伝達率、放射熱伝達率ともに詳細計算とする計算モード）
+    :param is_seed_from_detailed: 詳細計算の解を他の計算モードの初期値とするかどうか
+    :return: 計算モードごとの計算結果のDataFrame（get_wall_status_data_from_status_listの戻り値）を縦に結合し、
+             計算モードの番号（列名"calc_mode_index"）を追加したDataFrame
+    """
 
     # 固定値の設定
     h_out = global_number.get_h_out()
     h_in = global_number.get_h_in()
 
     # 計算結果格納用配列を用意
-    theta_sat = []          # 相当外気温度[℃]
-    theta_out_surf = []     # 外気側表面温度[℃]
-    theta_1_surf = []       # 通気層に面する面1の表面温度[℃]
-    theta_2_surf = []       # 通気層に面する面1の表面温度[℃]
-    theta_in_surf = []      # 室内側表面温度[℃]
-    theta_as_ave = []       # 通気層の平均温度[℃]
-    effective_emissivity = []    # 有効放射率[-]
-    h_cv = []               # 通気層の対流熱伝達率[W/(m2・K)]
-    h_rv = []               # 通気層の放射熱伝達率[W/(m2・K)]
-    theta_as_e = []         # 通気層の等価温度[℃]
-    q_room_side = []        # 室内表面熱流[W/m2]
-    k_e = []                # 通気層を有する壁体の相当熱貫流率を求めるための補正係数[-]
-    heat_balance_0 = []     # 外気側表面の熱収支収支[W/m2]
-    heat_balance_1 = []     # 通気層に面する面1の熱収支[W/m2]
-    heat_balance_2 = []     # 通気層に面する面2の熱収支[W/m2]
-    heat_balance_3 = []     # 室内側表面の熱収支[W/m2]
-    heat_balance_4 = []     # 通気層内空気の熱収支[W/m2]
-    is_optimize_succeed = []    # 最適化が正常に終了したかどうか
-    optimize_message = []   # 最適化の終了メッセージ
+    status_lists = [[] for _ in calc_modes]     # 計算モードごとの通気層の状態値
 
     # エラーログ出力用の設定
     log = Log()
@@ -96,108 +504,50 @@ def get_wall_status_data_by_detailed_calculation(calc_mode_h_cv: str, calc_mode_
         for row in df.itertuples():
             print(row[0])
             # パラメータを設定
-            parms = (vw.Parameters(theta_e=row.theta_e,
-                                   theta_r=row.theta_r,
-                                   J_surf=row.j_surf,
-                                   a_surf=row.a_surf,
-                                   C_1=row.C_1,
-                                   C_2=row.C_2,
-                                   l_h=row.l_h,
-                                   l_w=row.l_w,
-                                   l_d=row.l_d,
-                                   angle=row.angle,
-                                   v_a=row.v_a,
-                                   l_s=row.l_s,
-                                   emissivity_1=row.emissivity_1,
-                                   emissivity_2=row.emissivity_2))
+            parms = get_parameters_from_row(row)
 
-            # 通気層の状態値を取得
-            status = vw.get_wall_status_values(parms, calc_mode_h_cv, calc_mode_h_rv, h_out, h_in)
-            theta_out_surf.append(status.matrix_temp[0])
-            theta_1_surf.append(status.matrix_temp[1])
-            theta_2_surf.append(status.matrix_temp[2])
-            theta_in_surf.append(status.matrix_temp[3])
-            theta_as_ave.append(status.matrix_temp[4])
-            effective_emissivity.append(htc.effective_emissivity_parallel(emissivity_1=row.emissivity_1, emissivity_2=row.emissivity_2))
-            h_cv.append(status.h_cv)
-            h_rv.append(status.h_rv)
-
-            # 通気層の等価温度を取得
-            theta_as_e_buf = epf.get_theata_as_e(status.matrix_temp[4], status.matrix_temp[1],
-                                                  status.h_cv, status.h_rv)
-            theta_as_e.append(theta_as_e_buf)
-
-            # 相当外気温度を計算
-            theta_sat_buf = epf.get_theta_SAT(row.theta_e, row.a_surf, row.j_surf, h_out)
-            theta_sat.append(theta_sat_buf)
-
-            # 通気層を有する壁体の相当熱貫流率を求めるための補正係数を取得
-            k_e.append(epf.get_k_e(theta_as_e_buf, row.theta_r, theta_sat_buf))
-
-            # 室内側表面熱流を計算
-            r_i_buf = epf.get_r_i(C_2=row.C_2)
-            q_room_side.append(epf.get_heat_flow_room_side_by_vent_layer_heat_resistance(r_i=r_i_buf, theta_2=status.matrix_temp[2], theta_r=row.theta_r))
-
-            # 各層の熱収支収支を取得
-            heat_balance_0.append(status.matrix_heat_balance[0])
-            heat_balance_1.append(status.matrix_heat_balance[1])
-            heat_balance_2.append(status.matrix_heat_balance[2])
-            heat_balance_3.append(status.matrix_heat_balance[3])
-            heat_balance_4.append(status.matrix_heat_balance[4])
-
-            # 最適化に関する情報を取得
-            is_optimize_succeed.append(status.is_optimize_succeed)
-            optimize_message.append(status.optimize_message)
+            # 詳細計算の通気層の状態値を取得し、その解を他の計算モードの初期値とする
+            status = vw.get_wall_status_values(parms, *calc_modes[0], h_out, h_in)
+            status_lists[0].append(status)
+            matrix_temp_init = status.matrix_temp if status.is_optimize_succeed and is_seed_from_detailed else None
 
-    # 計算結果をDataFrameに追加
-    df['theta_sat'] = theta_sat
-    df['theta_out_surf'] = theta_out_surf
-    df['theta_1_surf'] = theta_1_surf
-    df['theta_2_surf'] = theta_2_surf
-    df['theta_in_surf'] = theta_in_surf
-    df['theta_as_ave'] = theta_as_ave
-    df['effective_emissivity'] = effective_emissivity
-    df['h_cv'] = h_cv
-    df['h_rv'] = h_rv
-    df['theta_as_e'] = theta_as_e
-    df['k_e'] = k_e
-    df['q_room_side'] = q_room_side
-    df['heat_balance_0'] = heat_balance_0
-    df['heat_balance_1'] = heat_balance_1
-    df['heat_balance_2'] = heat_balance_2
-    df['heat_balance_3'] = heat_balance_3
-    df['heat_balance_4'] = heat_balance_4
-    df['is_optimize_succeed'] = is_optimize_succeed
-    df['optimize_message'] = optimize_message
+            for k in range(1, len(calc_modes)):
+                if getattr(row, 'is_solve_%d' % k):
+                    status_lists[k].append(vw.get_wall_status_values(parms, *calc_modes[k], h_out, h_in,
+                                                                     matrix_temp_init=matrix_temp_init))
 
-    return df
+        parameter_name = [name for name in df.columns if not name.startswith('is_solve_')]
+        df_modes = []
+        for k in range(len(calc_modes)):
+            df_mode = get_wall_status_data_from_status_list(df.loc[df['is_solve_%d' % k], parameter_name],
+                                                            status_lists[k], h_out)
+            df_mode['calc_mode_index'] = k
+            df_modes.append(df_mode)
 
+    return pd.concat(df_modes)
 
-def get_wall_status_data_by_simplified_calculation_no_01() -> pd.DataFrame:
+
+def get_wall_status_data_chunk_by_detailed_calculation(df: pd.DataFrame, calc_mode_h_cv: str, calc_mode_h_rv: str,
+                                                       is_warm_start: bool = False) -> pd.DataFrame:
     """
-    通気層を有する壁体の総当たりパラメータを取得し、簡易計算法案No.1（簡易版の行列式）による計算結果を保有するDataFrameを作成する
+    総当たりパラメータの一部（DataFrameの各行）について、各ケースの詳細計算の計算結果を追加したDataFrameを作成する
 
-    :param: なし
+    :param df:             計算条件パラメータのDataFrame
+    :param calc_mode_h_cv: 対流熱伝達率の計算モード
+    :param calc_mode_h_rv: 放射熱伝達率の計算モード
+    :param is_warm_start: 直前の行の計算結果を収束計算の初期値とするかどうか
     :return: DataFrame
     """
 
-    # パラメータの総当たりリストを作成する
-    parameter_name = ['theta_e', 'theta_r', 'j_surf', 'a_surf', 'C_1', 'C_2', 'l_h', 'l_w', 'l_d', 'angle',
-                      'v_a', 'l_s', 'emissivity_1', 'emissivity_2']
-    df = pd.DataFrame(get_parameter_list(), columns=parameter_name)
-
     # 固定値の設定
     h_out = global_number.get_h_out()
+    h_in = global_number.get_h_in()
 
     # 計算結果格納用配列を用意
-    theta_sat = []          # 相当外気温度[℃]
-    theta_1_surf = []       # 通気層に面する面1の表面温度[℃]
-    theta_2_surf = []       # 通気層に面する面1の表面温度[℃]]
-    theta_as_ave = []       # 通気層の平均温度[℃]
-    effective_emissivity = []    # 有効放射率[-]
-    h_cv = []               # 通気層の対流熱伝達率[W/(m2・K)]
-    h_rv = []               # 通気層の放射熱伝達率[W/(m2・K)]
-    q_room_side = []        # 室内表面熱流[W/m2]
+    status_list = []        # 通気層の状態値
+
+    # 収束計算の初期値（Noneの場合は線形補間）
+    matrix_temp_init = None
 
     # エラーログ出力用の設定
     log = Log()
@@ -207,354 +557,501 @@ def get_wall_status_data_by_simplified_calculation_no_01() -> pd.DataFrame:
         for row in df.itertuples():
             print(row[0])
             # パラメータを設定
-            parms = (vw.Parameters(theta_e=row.theta_e,
-                                   theta_r=row.theta_r,
-                                   J_surf=row.j_surf,
-                                   a_surf=row.a_surf,
-                                   C_1=row.C_1,
-                                   C_2=row.C_2,
-                                   l_h=row.l_h,
-                                   l_w=row.l_w,
-                                   l_d=row.l_d,
-                                   angle=row.angle,
-                                   v_a=row.v_a,
-                                   l_s=row.l_s,
-                                   emissivity_1=row.emissivity_1,
-                                   emissivity_2=row.emissivity_2))
+            parms = get_parameters_from_row(row)
 
             # 通気層の状態値を取得
-            temps, h_cv_buf, h_rv_buf, r_i_buf = vws.get_vent_wall_temperature_by_simplified_calculation_no_01(parm=parms, h_out=h_out)
-            theta_1_surf.append(temps[0])
-            theta_2_surf.append(temps[2])
-            theta_as_ave.append(temps[1])
-            effective_emissivity.append(htc.effective_emissivity_parallel(emissivity_1=row.emissivity_1, emissivity_2=row.emissivity_2))
-            h_cv.append(h_cv_buf)
-            h_rv.append(h_rv_buf)
+            status = vw.get_wall_status_values(parms, calc_mode_h_cv, calc_mode_h_rv, h_out, h_in,
+                                               matrix_temp_init=matrix_temp_init)
+            if is_warm_start:
+                matrix_temp_init = status.matrix_temp if status.is_optimize_succeed else None
+            status_list.append(status)
 
-            # 相当外気温度を計算
-            theta_sat_buf = epf.get_theta_SAT(theta_e=row.theta_e, a_surf=row.a_surf, j_surf=row.j_surf, h_out=h_out)
-            theta_sat.append(theta_sat_buf)
+        return get_wall_status_data_from_status_list(df, status_list, h_out)
 
-            # 室内側表面熱流を計算
-            q_room_side.append(epf.get_heat_flow_room_side_by_vent_layer_heat_resistance(r_i=r_i_buf, theta_2=temps[2], theta_r=row.theta_r))
+
+def get_parameters_from_row(row) -> vw.Parameters:
+    """
+    総当たりパラメータのDataFrameの行（itertuplesの要素）から、計算条件パラメータ群を作成する
+
+    :param row: 総当たりパラメータのDataFrameの行
+    :return:    計算条件パラメータ群
+    """
+
+    return vw.Parameters(theta_e=row.theta_e,
+                         theta_r=row.theta_r,
+                         J_surf=row.j_surf,
+                         a_surf=row.a_surf,
+                         C_1=row.C_1,
+                         C_2=row.C_2,
+                         l_h=row.l_h,
+                         l_w=row.l_w,
+                         l_d=row.l_d,
+                         angle=row.angle,
+                         v_a=row.v_a,
+                         l_s=row.l_s,
+                         emissivity_1=row.emissivity_1,
+                         emissivity_2=row.emissivity_2)
+
+
+def get_parameter_batch_from_data_frame(df: pd.DataFrame) -> vw.ParameterBatch:
+    """
+    総当たりパラメータのDataFrameから、複数ケース分の計算条件パラメータ群を作成する
+
+    :param df:  計算条件パラメータのDataFrame
+    :return:    計算条件パラメータ群（複数ケース分）
+    """
+
+    return vw.ParameterBatch(theta_e=df['theta_e'].to_numpy(),
+                             theta_r=df['theta_r'].to_numpy(),
+                             J_surf=df['j_surf'].to_numpy(),
+                             a_surf=df['a_surf'].to_numpy(),
+                             C_1=df['C_1'].to_numpy(),
+                             C_2=df['C_2'].to_numpy(),
+                             l_h=df['l_h'].to_numpy(),
+                             l_w=df['l_w'].to_numpy(),
+                             l_d=df['l_d'].to_numpy(),
+                             angle=df['angle'].to_numpy(),
+                             v_a=df['v_a'].to_numpy(),
+                             l_s=df['l_s'].to_numpy(),
+                             emissivity_1=df['emissivity_1'].to_numpy(),
+                             emissivity_2=df['emissivity_2'].to_numpy())
+
+
+def get_data_frame_from_parameter_batch(parm_batch: vw.ParameterBatch, index=None) -> pd.DataFrame:
+    """
+    複数ケース分の計算条件パラメータ群から、総当たりパラメータのDataFrameを作成する（各列は配列を複写せずに参照する）
+
+    :param parm_batch:  計算条件パラメータ群（複数ケース分）
+    :param index:       DataFrameのインデックス（Noneの場合は0からの通し番号）
+    :return:            計算条件パラメータのDataFrame（列名は総当たりパラメータのDataFrameと同じ）
+    """
+
+    return pd.DataFrame({'theta_e': parm_batch.theta_e,
+                         'theta_r': parm_batch.theta_r,
+                         'j_surf': parm_batch.J_surf,
+                         'a_surf': parm_batch.a_surf,
+                         'C_1': parm_batch.C_1,
+                         'C_2': parm_batch.C_2,
+                         'l_h': parm_batch.l_h,
+                         'l_w': parm_batch.l_w,
+                         'l_d': parm_batch.l_d,
+                         'angle': parm_batch.angle,
+                         'v_a': parm_batch.v_a,
+                         'l_s': parm_batch.l_s,
+                         'emissivity_1': parm_batch.emissivity_1,
+                         'emissivity_2': parm_batch.emissivity_2}, index=index, copy=False)
+
+
+def get_data_frame_from_wall_status_batch(status_batch: vw.WallStatusBatch, index=None) -> pd.DataFrame:
+    """
+    複数ケース分の通気層の状態値から、詳細計算の計算結果の列（各部温度、熱伝達率、各層の熱収支、終了ステータス等）の
+    DataFrameを作成する（各列は配列を複写せずに参照する。各部温度、各層の熱収支は (N,5) の配列の列を参照する）
+
+    :param status_batch:    通気層の状態値（複数ケース分）
+    :param index:           DataFrameのインデックス（Noneの場合は0からの通し番号）
+    :return:                計算結果のDataFrame
+    """
+
+    columns = {}
+    for k, name in enumerate(['theta_out_surf', 'theta_1_surf', 'theta_2_surf', 'theta_in_surf', 'theta_as_ave']):
+        columns[name] = status_batch.matrix_temp[:, k]
+    columns['h_cv'] = status_batch.h_cv
+    columns['h_rv'] = status_batch.h_rv
+    for k in range(5):
+        columns['heat_balance_%d' % k] = status_batch.matrix_heat_balance[:, k]
+    columns['is_optimize_succeed'] = status_batch.is_optimize_succeed
+    columns['optimize_status'] = status_batch.optimize_status
+    columns['optimize_iteration'] = status_batch.optimize_iteration
+
+    return pd.DataFrame(columns, index=index, copy=False)
+
+
+def get_wall_status_batch_from_data_frame(df: pd.DataFrame) -> vw.WallStatusBatch:
+    """
+    詳細計算の計算結果のDataFrameから、複数ケース分の通気層の状態値を作成する
+    （熱伝達率等の列は複写せずに参照する。各部温度、各層の熱収支は (N,5) の配列にまとめるため複写する）
+
+    :param df:  計算結果のDataFrame（get_data_frame_from_wall_status_batchまたは詳細計算の各計算関数の戻り値）
+    :return:    通気層の状態値（複数ケース分。終了ステータス、反復回数の列がない場合は、それぞれ収束したかどうか、ゼロとする）
+    """
+
+    is_optimize_succeed = df['is_optimize_succeed'].to_numpy(dtype=bool)
+    optimize_status = df['optimize_status'].to_numpy(dtype=np.int8) if 'optimize_status' in df.columns \
+        else is_optimize_succeed.astype(np.int8)
+    optimize_iteration = df['optimize_iteration'].to_numpy() if 'optimize_iteration' in df.columns \
+        else np.zeros(len(df), dtype=int)
+
+    return vw.WallStatusBatch(
+        matrix_temp=df[['theta_out_surf', 'theta_1_surf', 'theta_2_surf', 'theta_in_surf', 'theta_as_ave']].to_numpy(dtype=float),
+        matrix_heat_balance=df[['heat_balance_%d' % k for k in range(5)]].to_numpy(dtype=float),
+        h_cv=df['h_cv'].to_numpy(dtype=float),
+        h_rv=df['h_rv'].to_numpy(dtype=float),
+        is_optimize_succeed=is_optimize_succeed,
+        optimize_iteration=optimize_iteration,
+        optimize_status=optimize_status)
+
+
+def get_heat_flow_data(df: pd.DataFrame, tolerance: float = 1.0e-6) -> pd.DataFrame:
+    """
+    詳細計算の計算結果のDataFrameから、各部の熱流と壁体全体の熱収支の誤差を一括で計算したDataFrameを作成する
+    （ventilation_wall.get_heat_flow_batchを参照）
+
+    :param df:          詳細計算の計算結果のDataFrame（計算条件パラメータの列を含む）
+    :param tolerance:   熱収支の誤差の許容値, W/m2
+    :return:            各部の熱流、熱収支の誤差、誤差が許容値を超えるかどうかのDataFrame（インデックスはdfと同じ）
+    """
+
+    # 固定値の設定
+    h_out = global_number.get_h_out()
+    h_in = global_number.get_h_in()
+
+    parms = get_parameter_batch_from_data_frame(df)
+    status = get_wall_status_batch_from_data_frame(df)
+    heat_flow = vw.get_heat_flow_batch(status.matrix_temp, parms, status.h_cv, status.h_rv, h_out, h_in, tolerance)
+
+    return pd.DataFrame({field.name: getattr(heat_flow, field.name) for field in dataclasses.fields(heat_flow)},
+                        index=df.index, copy=False)
+
+
+def get_wall_status_data_from_status_list(df: pd.DataFrame, status_list: list, h_out: float) -> pd.DataFrame:
+    """
+    総当たりパラメータの各行の通気層の状態値から、詳細計算の計算結果の列を追加したDataFrameを作成する
+    （状態値をWallStatusBatchの配列にまとめ、各列を配列演算で計算する）
+
+    :param df:          計算条件パラメータのDataFrame
+    :param status_list: 各行の通気層の状態値のリスト
+    :param h_out:       室外側総合熱伝達率, W/(m2・K)
+    :return: DataFrame
+    """
+
+    df = df.copy()
+
+    # パラメータと通気層の状態値を配列にまとめる
+    parms = get_parameter_batch_from_data_frame(df)
+    status = vw.get_wall_status_batch(status_list)
+    theta_1 = status.matrix_temp[:, 1]
+    theta_as = status.matrix_temp[:, 4]
+
+    # 相当外気温度[℃]
+    theta_sat = epf.get_theta_SAT(theta_e=parms.theta_e, a_surf=parms.a_surf, j_surf=parms.J_surf, h_out=h_out)
+
+    # 通気層の等価温度[℃]、通気層を有する壁体の相当熱貫流率を求めるための補正係数[-]
+    # （epf.get_theata_as_e、epf.get_k_eと同じ。分母がゼロに近い場合はNanとする）
+    with np.errstate(divide='ignore', invalid='ignore'):
+        theta_as_e = np.where(np.abs(status.h_rv + status.h_cv) < 0.001, np.nan,
+                              (theta_as * status.h_cv + theta_1 * status.h_rv) / (status.h_cv + status.h_rv))
+        k_e = np.where(np.abs(theta_sat - parms.theta_r) < 0.001, np.nan,
+                       (theta_as_e - parms.theta_r) / (theta_sat - parms.theta_r))
+
+    # 室内表面熱流[W/m2]
+    r_i = epf.get_r_i(C_2=parms.C_2)
+    q_room_side = epf.get_heat_flow_room_side_by_vent_layer_heat_resistance(r_i=r_i, theta_2=status.matrix_temp[:, 2],
+                                                                            theta_r=parms.theta_r)
 
     # 計算結果をDataFrameに追加
     df['theta_sat'] = theta_sat
-    df['theta_1_surf'] = theta_1_surf
-    df['theta_2_surf'] = theta_2_surf
-    df['theta_as_ave'] = theta_as_ave
-    df['effective_emissivity'] = effective_emissivity
-    df['h_cv'] = h_cv
-    df['h_rv'] = h_rv
+    df['theta_out_surf'] = status.matrix_temp[:, 0]
+    df['theta_1_surf'] = theta_1
+    df['theta_2_surf'] = status.matrix_temp[:, 2]
+    df['theta_in_surf'] = status.matrix_temp[:, 3]
+    df['theta_as_ave'] = theta_as
+    df['effective_emissivity'] = htc.effective_emissivity_parallel_array(emissivity_1=parms.emissivity_1,
+                                                                         emissivity_2=parms.emissivity_2)
+    df['h_cv'] = status.h_cv
+    df['h_rv'] = status.h_rv
+    df['theta_as_e'] = theta_as_e
+    df['k_e'] = k_e
     df['q_room_side'] = q_room_side
+    for k in range(5):
+        df['heat_balance_%d' % k] = status.matrix_heat_balance[:, k]
+    df['is_optimize_succeed'] = status.is_optimize_succeed
+    df['optimize_message'] = [status_values.optimize_message for status_values in status_list]
 
     return df
 
 
-def get_wall_status_data_by_simplified_calculation_no_02() -> pd.DataFrame:
+def get_wall_status_data_by_simplified_calculation_no_01(max_workers: int = 1, chunk_size: int = None) -> pd.DataFrame:
+    """
+    通気層を有する壁体の総当たりパラメータを取得し、簡易計算法案No.1（簡易版の行列式）による計算結果を保有するDataFrameを作成する
+
+    :param max_workers: 並列計算のプロセス数（get_wall_status_data_by_parallel_calculationを参照）
+    :param chunk_size:  並列計算で1プロセスに渡すケース数（get_wall_status_data_by_parallel_calculationを参照）
+    :return: DataFrame
     """
-    通気層を有する壁体の総当たりパラメータを取得し、簡易計算法案No.2（簡易式）による計算結果を保有するDataFrameを作成する
 
-    :param: なし
+    # パラメータの総当たりの組み合わせ（各ケースのパラメータは計算時に作成する）
+    grid = ParameterGrid()
+
+    return get_wall_status_data_by_parallel_calculation(
+        get_wall_status_data_chunk_by_simplified_calculation_no_01, grid, max_workers=max_workers, chunk_size=chunk_size)
+
+
+def get_wall_status_data_chunk_by_simplified_calculation_no_01(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    総当たりパラメータの一部（DataFrameの各行）について、簡易計算法案No.1による計算結果を追加したDataFrameを作成する
+
+    :param df:  計算条件パラメータのDataFrame
     :return: DataFrame
     """
 
-    # パラメータの総当たりリストを作成する
-    parameter_name = ['theta_e', 'theta_r', 'j_surf', 'a_surf', 'C_1', 'C_2', 'l_h', 'l_w', 'l_d', 'angle',
-                      'v_a', 'l_s', 'emissivity_1', 'emissivity_2']
-    df = pd.DataFrame(get_parameter_list(), columns=parameter_name)
+    df = df.copy()
 
     # 固定値の設定
     h_out = global_number.get_h_out()
-    h_in = global_number.get_h_in()
 
-    # 計算結果格納用配列を用意
-    theta_sat = []          # 相当外気温度[℃]
-    theta_as_ave = []       # 通気層の平均温度[℃]
-    effective_emissivity = []    # 有効放射率[-]
-    h_cv = []               # 通気層の対流熱伝達率[W/(m2・K)]
-    h_rv = []               # 通気層の放射熱伝達率[W/(m2・K)]
-    u_o = []                # 室外側から通気層までの熱貫流率[W/(m2・K)]
-    u_i = []                # 室内側から通気層までの熱貫流率[W/(m2・K)]
-    q_room_side = []        # 室内表面熱流[W/m2]
+    # パラメータを設定
+    parms = get_parameter_batch_from_data_frame(df)
 
     # エラーログ出力用の設定
     log = Log()
     saved_handler = np.seterrcall(log)
 
     with np.errstate(all='log'):  # withスコープ内でエラーが出た場合、Logを出力する
-        for row in df.itertuples():
-            print(row[0])
-            # パラメータを設定
-            parms = (vw.Parameters(theta_e=row.theta_e,
-                                   theta_r=row.theta_r,
-                                   J_surf=row.j_surf,
-                                   a_surf=row.a_surf,
-                                   C_1=row.C_1,
-                                   C_2=row.C_2,
-                                   l_h=row.l_h,
-                                   l_w=row.l_w,
-                                   l_d=row.l_d,
-                                   angle=row.angle,
-                                   v_a=row.v_a,
-                                   l_s=row.l_s,
-                                   emissivity_1=row.emissivity_1,
-                                   emissivity_2=row.emissivity_2))
-
-            # 対流熱伝達率、放射熱伝達率を計算
-            effective_emissivity_buf = htc.effective_emissivity_parallel(emissivity_1=row.emissivity_1, emissivity_2=row.emissivity_2)
-            if parms.theta_r == 20.0:
-                h_cv_buf = htc.convective_heat_transfer_coefficient_simplified_winter(v_a=row.v_a)
-                h_rv_buf = htc.radiative_heat_transfer_coefficient_simplified_winter(
-                    effective_emissivity=effective_emissivity_buf)
-            else:
-                h_cv_buf = htc.convective_heat_transfer_coefficient_simplified_summer(v_a=row.v_a)
-                h_rv_buf = htc.radiative_heat_transfer_coefficient_simplified_summer(
-                    effective_emissivity=effective_emissivity_buf)
-
-            effective_emissivity.append(effective_emissivity_buf)
-            h_cv.append(h_cv_buf)
-            h_rv.append(h_rv_buf)
-
-            # 通気層平均温度を取得
-            theta_as_ave_buf, u_o_buf, u_i_buf = vws.get_vent_wall_temperature_by_simplified_calculation_no_02(parm=parms, h_out=h_out)
-            theta_as_ave.append(theta_as_ave_buf)
-
-            # 相当外気温度を計算
-            theta_sat.append(epf.get_theta_SAT(row.theta_e, row.a_surf, row.j_surf, h_out))
-
-            # 室外側から通気層までの熱貫流率、室内側から通気層までの熱貫流率
-            u_o.append(u_o_buf)
-            u_i.append(u_i_buf)
-
-            # 室内側表面熱流を計算
-            q_room_side.append(epf.get_heat_flow_room_side_by_vent_layer_heat_transfer_coeff(u_i=u_i_buf, theta_as_ave=theta_as_ave_buf, theta_r=row.theta_r))
-
-    # 計算結果をDataFrameに追加
-    df['theta_sat'] = theta_sat
-    df['theta_as_ave'] = theta_as_ave
-    df['effective_emissivity'] = effective_emissivity
-    df['h_cv'] = h_cv
-    df['h_rv'] = h_rv
-    df['u_o'] = u_o
-    df['u_i'] = u_i
-    df['q_room_side'] = q_room_side
+        # 通気層の状態値を取得
+        temps, h_cv, h_rv, r_i = vws.get_vent_wall_temperature_by_simplified_calculation_no_01_array(parm=parms, h_out=h_out)
+
+        # 計算結果をDataFrameに追加
+        df['theta_sat'] = epf.get_theta_SAT(theta_e=parms.theta_e, a_surf=parms.a_surf, j_surf=parms.J_surf, h_out=h_out)
+        df['theta_1_surf'] = temps[:, 0]
+        df['theta_2_surf'] = temps[:, 2]
+        df['theta_as_ave'] = temps[:, 1]
+        df['effective_emissivity'] = htc.effective_emissivity_parallel_array(emissivity_1=parms.emissivity_1, emissivity_2=parms.emissivity_2)
+        df['h_cv'] = h_cv
+        df['h_rv'] = h_rv
+        df['q_room_side'] = epf.get_heat_flow_room_side_by_vent_layer_heat_resistance(r_i=r_i, theta_2=temps[:, 2], theta_r=parms.theta_r)
 
     return df
 
 
-def get_wall_status_data_by_simplified_calculation_no_03() -> pd.DataFrame:
+def get_wall_status_data_by_simplified_calculation_no_02(max_workers: int = 1, chunk_size: int = None) -> pd.DataFrame:
     """
-    通気層を有する壁体の総当たりパラメータを取得し、簡易計算法案No.3（通気層を有する壁体の修正熱貫流率、修正日射熱取得率から
-    室内表面熱流を求める）による計算結果を保有するDataFrameを作成する
+    通気層を有する壁体の総当たりパラメータを取得し、簡易計算法案No.2（簡易式）による計算結果を保有するDataFrameを作成する
+
+    :param max_workers: 並列計算のプロセス数（get_wall_status_data_by_parallel_calculationを参照）
+    :param chunk_size:  並列計算で1プロセスに渡すケース数（get_wall_status_data_by_parallel_calculationを参照）
+    :return: DataFrame
+    """
+
+    # パラメータの総当たりの組み合わせ（各ケースのパラメータは計算時に作成する）
+    grid = ParameterGrid()
+
+    return get_wall_status_data_by_parallel_calculation(
+        get_wall_status_data_chunk_by_simplified_calculation_no_02, grid, max_workers=max_workers, chunk_size=chunk_size)
+
+
+def get_wall_status_data_chunk_by_simplified_calculation_no_02(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    総当たりパラメータの一部（DataFrameの各行）について、簡易計算法案No.2による計算結果を追加したDataFrameを作成する
 
-    :param: なし
+    :param df:  計算条件パラメータのDataFrame
     :return: DataFrame
     """
 
-    # パラメータの総当たりリストを作成する
-    parameter_name = ['theta_e', 'theta_r', 'j_surf', 'a_surf', 'C_1', 'C_2', 'l_h', 'l_w', 'l_d', 'angle',
-                      'v_a', 'l_s', 'emissivity_1', 'emissivity_2']
-    df = pd.DataFrame(get_parameter_list(), columns=parameter_name)
+    df = df.copy()
 
     # 固定値の設定
     h_out = global_number.get_h_out()
 
-    # 計算結果格納用配列を用意
-    theta_sat = []          # 相当外気温度[℃]
-    h_cv = []               # 通気層の対流熱伝達率[W/(m2・K)]
-    h_rv = []               # 通気層の放射熱伝達率[W/(m2・K)]
-    u_dash = []             # 修正熱貫流率[W/(m2・K)]
-    eta_dash = []           # 修正日射熱取得率[-]
-    q_room_side = []        # 室内表面熱流[W/m2]
+    # パラメータを設定
+    parms = get_parameter_batch_from_data_frame(df)
 
     # エラーログ出力用の設定
     log = Log()
     saved_handler = np.seterrcall(log)
 
     with np.errstate(all='log'):  # withスコープ内でエラーが出た場合、Logを出力する
-        for row in df.itertuples():
-            print(row[0])
-            # パラメータを設定
-            parms = (vw.Parameters(theta_e=row.theta_e,
-                                   theta_r=row.theta_r,
-                                   J_surf=row.j_surf,
-                                   a_surf=row.a_surf,
-                                   C_1=row.C_1,
-                                   C_2=row.C_2,
-                                   l_h=row.l_h,
-                                   l_w=row.l_w,
-                                   l_d=row.l_d,
-                                   angle=row.angle,
-                                   v_a=row.v_a,
-                                   l_s=row.l_s,
-                                   emissivity_1=row.emissivity_1,
-                                   emissivity_2=row.emissivity_2))
-
-            # 相当外気温度を計算
-            theta_sat.append(epf.get_theta_SAT(row.theta_e, row.a_surf, row.j_surf, h_out))
-
-            # 対流熱伝達率、放射熱伝達率、修正熱貫流率、修正日射熱取得率、室内側表面熱流を計算
-            h_cv_buf, h_rv_buf, u_dash_buf, eta_dash_buf, q_room_side_buf \
-                = vws.get_vent_wall_performance_factor_by_simplified_calculation_no_03(parm=parms, h_out=h_out)
-
-            # 配列に格納
-            h_cv.append(h_cv_buf)
-            h_rv.append(h_rv_buf)
-            u_dash.append(u_dash_buf)
-            eta_dash.append(eta_dash_buf)
-            q_room_side.append(q_room_side_buf)
-
-    # 計算結果をDataFrameに追加
-    df['theta_sat'] = theta_sat
-    df['h_cv'] = h_cv
-    df['h_rv'] = h_rv
-    df['u_dash'] = u_dash
-    df['eta_dash'] = eta_dash
-    df['q_room_side'] = q_room_side
+        # 対流熱伝達率、放射熱伝達率を計算
+        h_cv, h_rv = vws.get_simplified_heat_transfer_coefficient_array(parms)
+
+        # 通気層平均温度、室外側から通気層までの熱貫流率、室内側から通気層までの熱貫流率を取得
+        theta_as_ave, u_o, u_i = vws.get_vent_wall_temperature_by_simplified_calculation_no_02_array(parm=parms, h_out=h_out)
+
+        # 計算結果をDataFrameに追加
+        df['theta_sat'] = epf.get_theta_SAT(parms.theta_e, parms.a_surf, parms.J_surf, h_out)
+        df['theta_as_ave'] = theta_as_ave
+        df['effective_emissivity'] = htc.effective_emissivity_parallel_array(emissivity_1=parms.emissivity_1, emissivity_2=parms.emissivity_2)
+        df['h_cv'] = h_cv
+        df['h_rv'] = h_rv
+        df['u_o'] = u_o
+        df['u_i'] = u_i
+        df['q_room_side'] = epf.get_heat_flow_room_side_by_vent_layer_heat_transfer_coeff(u_i=u_i, theta_as_ave=theta_as_ave, theta_r=parms.theta_r)
 
     return df
 
 
-def get_wall_status_data_by_simplified_calculation_no_04() -> pd.DataFrame:
+def get_wall_status_data_by_simplified_calculation_no_03(max_workers: int = 1, chunk_size: int = None) -> pd.DataFrame:
     """
-    通気層を有する壁体の総当たりパラメータを取得し、簡易計算法案No.4（簡易計算法案No.3をさらに簡略化）による計算結果を保有するDataFrameを作成する
+    通気層を有する壁体の総当たりパラメータを取得し、簡易計算法案No.3（通気層を有する壁体の修正熱貫流率、修正日射熱取得率から
+    室内表面熱流を求める）による計算結果を保有するDataFrameを作成する
+
+    :param max_workers: 並列計算のプロセス数（get_wall_status_data_by_parallel_calculationを参照）
+    :param chunk_size:  並列計算で1プロセスに渡すケース数（get_wall_status_data_by_parallel_calculationを参照）
+    :return: DataFrame
+    """
+
+    # パラメータの総当たりの組み合わせ（各ケースのパラメータは計算時に作成する）
+    grid = ParameterGrid()
 
-    :param: なし
+    return get_wall_status_data_by_parallel_calculation(
+        get_wall_status_data_chunk_by_simplified_calculation_no_03, grid, max_workers=max_workers, chunk_size=chunk_size)
+
+
+def get_wall_status_data_chunk_by_simplified_calculation_no_03(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    総当たりパラメータの一部（DataFrameの各行）について、簡易計算法案No.3による計算結果を追加したDataFrameを作成する
+
+    :param df:  計算条件パラメータのDataFrame
     :return: DataFrame
     """
 
-    # パラメータの総当たりリストを作成する
-    parameter_name = ['theta_e', 'theta_r', 'j_surf', 'a_surf', 'C_1', 'C_2', 'l_h', 'l_w', 'l_d', 'angle',
-                      'v_a', 'l_s', 'emissivity_1', 'emissivity_2']
-    df = pd.DataFrame(get_parameter_list(), columns=parameter_name)
+    df = df.copy()
 
     # 固定値の設定
     h_out = global_number.get_h_out()
 
-    # 計算結果格納用配列を用意
-    theta_sat = []          # 相当外気温度[℃]
-    h_cv = []               # 通気層の対流熱伝達率[W/(m2・K)]
-    h_rv = []               # 通気層の放射熱伝達率[W/(m2・K)]
-    u_dash = []             # 修正熱貫流率[W/(m2・K)]
-    eta_dash = []           # 修正日射熱取得率[-]
-    q_room_side = []        # 室内表面熱流[W/m2]
+    # パラメータを設定
+    parms = get_parameter_batch_from_data_frame(df)
 
     # エラーログ出力用の設定
     log = Log()
     saved_handler = np.seterrcall(log)
 
     with np.errstate(all='log'):  # withスコープ内でエラーが出た場合、Logを出力する
-        for row in df.itertuples():
-            print(row[0])
-            # パラメータを設定
-            parms = (vw.Parameters(theta_e=row.theta_e,
-                                   theta_r=row.theta_r,
-                                   J_surf=row.j_surf,
-                                   a_surf=row.a_surf,
-                                   C_1=row.C_1,
-                                   C_2=row.C_2,
-                                   l_h=row.l_h,
-                                   l_w=row.l_w,
-                                   l_d=row.l_d,
-                                   angle=row.angle,
-                                   v_a=row.v_a,
-                                   l_s=row.l_s,
-                                   emissivity_1=row.emissivity_1,
-                                   emissivity_2=row.emissivity_2))
-
-            # 相当外気温度を計算
-            theta_sat.append(epf.get_theta_SAT(row.theta_e, row.a_surf, row.j_surf, h_out))
-
-            # 対流熱伝達率、放射熱伝達率、修正熱貫流率、修正日射熱取得率、室内側表面熱流を計算
-            h_cv_buf, h_rv_buf, u_dash_buf, eta_dash_buf, q_room_side_buf \
-                = vws.get_vent_wall_performance_factor_by_simplified_calculation_no_04(parm=parms, h_out=h_out)
-
-            # 配列に格納
-            h_cv.append(h_cv_buf)
-            h_rv.append(h_rv_buf)
-            u_dash.append(u_dash_buf)
-            eta_dash.append(eta_dash_buf)
-            q_room_side.append(q_room_side_buf)
-
-    # 計算結果をDataFrameに追加
-    df['theta_sat'] = theta_sat
-    df['h_cv'] = h_cv
-    df['h_rv'] = h_rv
-    df['u_dash'] = u_dash
-    df['eta_dash'] = eta_dash
-    df['q_room_side'] = q_room_side
+        # 対流熱伝達率、放射熱伝達率、修正熱貫流率、修正日射熱取得率、室内側表面熱流を計算
+        h_cv, h_rv, u_dash, eta_dash, q_room_side \
+            = vws.get_vent_wall_performance_factor_by_simplified_calculation_no_03_array(parm=parms, h_out=h_out)
+
+        # 計算結果をDataFrameに追加
+        df['theta_sat'] = epf.get_theta_SAT(parms.theta_e, parms.a_surf, parms.J_surf, h_out)
+        df['h_cv'] = h_cv
+        df['h_rv'] = h_rv
+        df['u_dash'] = u_dash
+        df['eta_dash'] = eta_dash
+        df['q_room_side'] = q_room_side
 
     return df
 
 
-def dump_csv_all_case_result():
-    # 総当たりのパラメータと計算結果を取得し、CSVに出力
+def get_wall_status_data_by_simplified_calculation_no_04(max_workers: int = 1, chunk_size: int = None) -> pd.DataFrame:
+    """
+    通気層を有する壁体の総当たりパラメータを取得し、簡易計算法案No.4（簡易計算法案No.3をさらに簡略化）による計算結果を保有するDataFrameを作成する
+
+    :param max_workers: 並列計算のプロセス数（get_wall_status_data_by_parallel_calculationを参照）
+    :param chunk_size:  並列計算で1プロセスに渡すケース数（get_wall_status_data_by_parallel_calculationを参照）
+    :return: DataFrame
+    """
+
+    # パラメータの総当たりの組み合わせ（各ケースのパラメータは計算時に作成する）
+    grid = ParameterGrid()
+
+    return get_wall_status_data_by_parallel_calculation(
+        get_wall_status_data_chunk_by_simplified_calculation_no_04, grid, max_workers=max_workers, chunk_size=chunk_size)
+
 
-    # 詳細計算
-    print("Detailed Calculation")
-    df = pd.DataFrame(get_wall_status_data_by_detailed_calculation("detailed", "detailed"))
-    df.to_csv("wall_status_data_frame_detailed.csv")
+def get_wall_status_data_chunk_by_simplified_calculation_no_04(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    総当たりパラメータの一部（DataFrameの各行）について、簡易計算法案No.4による計算結果を追加したDataFrameを作成する
 
-    # 放射熱伝達率の検証： 冬期条件の簡易計算
-    print("Simplified Calculation: h_rv_winter")
-    df = pd.DataFrame(get_wall_status_data_by_detailed_calculation(calc_mode_h_cv="detailed", calc_mode_h_rv="simplified_winter"))
-    df.to_csv("wall_status_data_frame_h_rv_simplified_winter.csv")
+    :param df:  計算条件パラメータのDataFrame
+    :return: DataFrame
+    """
 
-    # 放射熱伝達率の検証： 夏期条件の簡易計算
-    print("Simplified Calculation: h_rv_summer")
-    df = pd.DataFrame(get_wall_status_data_by_detailed_calculation(calc_mode_h_cv="detailed", calc_mode_h_rv="simplified_summer"))
-    df.to_csv("wall_status_data_frame_h_rv_simplified_summer.csv")
+    df = df.copy()
 
-    # 放射熱伝達率の検証： 放射熱伝達率ゼロ
-    print("Simplified Calculation: h_rv_zero")
-    df = pd.DataFrame(get_wall_status_data_by_detailed_calculation(calc_mode_h_cv="detailed", calc_mode_h_rv="simplified_zero"))
-    df.to_csv("wall_status_data_frame_h_rv_simplified_zero.csv")
+    # 固定値の設定
+    h_out = global_number.get_h_out()
 
-    # 放射熱伝達率の検証：　通年の簡易計算
-    print("Simplified Calculation: h_rv_all_season")
-    df = pd.DataFrame(get_wall_status_data_by_detailed_calculation(calc_mode_h_cv="detailed", calc_mode_h_rv="simplified_all_season"))
-    df.to_csv("wall_status_data_frame_h_rv_simplified_all_season.csv")
+    # パラメータを設定
+    parms = get_parameter_batch_from_data_frame(df)
 
-    # 対流熱伝達率の検証： 冬期条件の簡易計算
-    print("Simplified Calculation: h_cv_winter")
-    df = pd.DataFrame(get_wall_status_data_by_detailed_calculation(calc_mode_h_cv="simplified_winter", calc_mode_h_rv="detailed"))
-    df.to_csv("wall_status_data_frame_h_cv_simplified_winter.csv")
+    # エラーログ出力用の設定
+    log = Log()
+    saved_handler = np.seterrcall(log)
 
-    # 対流熱伝達率の検証： 夏期条件の簡易計算
-    print("Simplified Calculation: h_cv_summer")
-    df = pd.DataFrame(get_wall_status_data_by_detailed_calculation(calc_mode_h_cv="simplified_summer", calc_mode_h_rv="detailed"))
-    df.to_csv("wall_status_data_frame_h_cv_simplified_summer.csv")
+    with np.errstate(all='log'):  # withスコープ内でエラーが出た場合、Logを出力する
+        # 対流熱伝達率、放射熱伝達率、修正熱貫流率、修正日射熱取得率、室内側表面熱流を計算
+        h_cv, h_rv, u_dash, eta_dash, q_room_side \
+            = vws.get_vent_wall_performance_factor_by_simplified_calculation_no_04_array(parm=parms, h_out=h_out)
+
+        # 計算結果をDataFrameに追加
+        df['theta_sat'] = epf.get_theta_SAT(parms.theta_e, parms.a_surf, parms.J_surf, h_out)
+        df['h_cv'] = h_cv
+        df['h_rv'] = h_rv
+        df['u_dash'] = u_dash
+        df['eta_dash'] = eta_dash
+        df['q_room_side'] = q_room_side
 
-    # 対流熱伝達率の検証：　通年の簡易計算
-    print("Simplified Calculation: h_cv_all_season")
-    df = pd.DataFrame(get_wall_status_data_by_detailed_calculation(calc_mode_h_cv="simplified_all_season", calc_mode_h_rv="detailed"))
-    df.to_csv("wall_status_data_frame_h_cv_simplified_all_season.csv")
+    return df
 
-    # 簡易計算法案No.1（簡易版の行列式）による計算
-    print("Simplified Calculation No.1")
-    df = pd.DataFrame(get_wall_status_data_by_simplified_calculation_no_01())
-    df.to_csv("wall_status_data_frame_simplified_calculation_no01.csv")
 
-    # 簡易計算法案No.2（簡易式）による計算
-    print("Simplified Calculation No.2")
-    df = pd.DataFrame(get_wall_status_data_by_simplified_calculation_no_02())
-    df.to_csv("wall_status_data_frame_simplified_calculation_no02.csv")
+def dump_csv_all_case_result(max_workers: int = 1, chunk_size: int = None, file_format: str = "csv",
+                             directory: str = "."):
+    """
+    総当たりのパラメータと計算結果を取得し、CSVに出力（file_formatを指定した場合は列単位のバイナリ形式で保存）
 
-    # 簡易計算法案No.3（通気層を有する壁体の修正熱貫流率、修正日射熱取得率から室内表面熱流を求める）による計算
-    print("Simplified Calculation No.3")
-    df = pd.DataFrame(get_wall_status_data_by_simplified_calculation_no_03())
-    df.to_csv("wall_status_data_frame_simplified_calculation_no03.csv")
+    :param max_workers: 並列計算のプロセス数（get_wall_status_data_by_parallel_calculationを参照）
+    :param chunk_size:  並列計算で1プロセスに渡すケース数（get_wall_status_data_by_parallel_calculationを参照）
+    :param file_format: 保存形式（wall_status_data_store.dump_wall_status_dataを参照）
+    :param directory:   保存先のディレクトリ
+    :return: なし
+    """
 
-    # 簡易計算法案No.4（簡易計算法案No.3をさらに簡略化）による計算
-    print("Simplified Calculation No.4")
-    df = pd.DataFrame(get_wall_status_data_by_simplified_calculation_no_04())
-    df.to_csv("wall_status_data_frame_simplified_calculation_no04.csv")
+    # 詳細計算、放射熱伝達率・対流熱伝達率の検証（簡易計算）の各計算モードは、総当たりパラメータを1回だけ走査して計算する
+    # 計算結果の名称（CSVファイル名の"wall_status_data_frame_"に続く部分）、対流熱伝達率の計算モード、放射熱伝達率の計算モード
+    detailed_cases = [
+        # 詳細計算
+        ("Detailed Calculation", "detailed", "detailed", "detailed"),
+        # 放射熱伝達率の検証： 冬期条件の簡易計算
+        ("Simplified Calculation: h_rv_winter", "h_rv_simplified_winter", "detailed", "simplified_winter"),
+        # 放射熱伝達率の検証： 夏期条件の簡易計算
+        ("Simplified Calculation: h_rv_summer", "h_rv_simplified_summer", "detailed", "simplified_summer"),
+        # 放射熱伝達率の検証： 放射熱伝達率ゼロ
+        ("Simplified Calculation: h_rv_zero", "h_rv_simplified_zero", "detailed", "simplified_zero"),
+        # 放射熱伝達率の検証：　通年の簡易計算
+        ("Simplified Calculation: h_rv_all_season", "h_rv_simplified_all_season", "detailed", "simplified_all_season"),
+        # 対流熱伝達率の検証： 冬期条件の簡易計算
+        ("Simplified Calculation: h_cv_winter", "h_cv_simplified_winter", "simplified_winter", "detailed"),
+        # 対流熱伝達率の検証： 夏期条件の簡易計算
+        ("Simplified Calculation: h_cv_summer", "h_cv_simplified_summer", "simplified_summer", "detailed"),
+        # 対流熱伝達率の検証：　通年の簡易計算
+        ("Simplified Calculation: h_cv_all_season", "h_cv_simplified_all_season", "simplified_all_season", "detailed"),
+    ]
+
+    # 解が複数存在するケースで計算モードごとの計算結果と異なる解とならないよう、各計算モードの初期値は線形補間とする
+    print("Detailed Calculation: all calculation modes")
+    results = get_wall_status_data_by_detailed_calculation_multi_mode(
+        [(calc_mode_h_cv, calc_mode_h_rv) for _, _, calc_mode_h_cv, calc_mode_h_rv in detailed_cases],
+        max_workers=max_workers, chunk_size=chunk_size, is_seed_from_detailed=False)
+
+    for message, name, calc_mode_h_cv, calc_mode_h_rv in detailed_cases:
+        print(message)
+        wsds.dump_wall_status_data(results[(calc_mode_h_cv, calc_mode_h_rv)], name, directory=directory,
+                                   file_format=file_format)
+
+    # 計算結果の名称（CSVファイル名の"wall_status_data_frame_"に続く部分）、計算関数
+    cases = [
+        # 簡易計算法案No.1（簡易版の行列式）による計算
+        ("Simplified Calculation No.1", "simplified_calculation_no01",
+         lambda: get_wall_status_data_by_simplified_calculation_no_01(max_workers=max_workers, chunk_size=chunk_size)),
+        # 簡易計算法案No.2（簡易式）による計算
+        ("Simplified Calculation No.2", "simplified_calculation_no02",
+         lambda: get_wall_status_data_by_simplified_calculation_no_02(max_workers=max_workers, chunk_size=chunk_size)),
+        # 簡易計算法案No.3（通気層を有する壁体の修正熱貫流率、修正日射熱取得率から室内表面熱流を求める）による計算
+        ("Simplified Calculation No.3", "simplified_calculation_no03",
+         lambda: get_wall_status_data_by_simplified_calculation_no_03(max_workers=max_workers, chunk_size=chunk_size)),
+        # 簡易計算法案No.4（簡易計算法案No.3をさらに簡略化）による計算
+        ("Simplified Calculation No.4", "simplified_calculation_no04",
+         lambda: get_wall_status_data_by_simplified_calculation_no_04(max_workers=max_workers, chunk_size=chunk_size)),
+    ]
+
+    for message, name, get_wall_status_data in cases:
+        print(message)
+        wsds.dump_wall_status_data(get_wall_status_data(), name, directory=directory, file_format=file_format)
 
 
 if __name__ == '__main__':
 
-    dump_csv_all_case_result()
+    dump_csv_all_case_result(max_workers=None)
 
 
 # デバッグ用
@@ -1,11 +1,15 @@
 import math
+import functools
 import numpy as np
+from dataclasses import dataclass, replace
 import heat_transfer_coefficient as htc
 import ventilation_wall as vw
 import envelope_performance_factors as epf
+import wall_status_cache
 from global_number import get_c_air, get_rho_air
 
 
+@wall_status_cache.memoize
 def get_vent_wall_temperature_by_simplified_calculation_no_01(parm: vw.Parameters, h_out: float) -> np.zeros(3):
     """
     簡易計算法案No.1：簡易版の行列式により各部位の温度を求める関数
@@ -72,6 +76,7 @@ def get_vent_wall_temperature_by_simplified_calculation_no_01(parm: vw.Parameter
     return matrix_temp, h_cv, h_rv, R_i
 
 
+@wall_status_cache.memoize
 def get_vent_wall_temperature_by_simplified_calculation_no_02(parm: vw.Parameters, h_out: float):
     """
     簡易計算法案No.2：簡易式により通気層の平均温度を求める関数
@@ -122,6 +127,7 @@ def get_vent_wall_temperature_by_simplified_calculation_no_02(parm: vw.Parameter
     return theta_as_ave, u_o, u_i
 
 
+@wall_status_cache.memoize
 def get_vent_wall_performance_factor_by_simplified_calculation_no_03(parm: vw.Parameters, h_out: float):
     """
     簡易計算法案No.3：通気層を有する壁体の修正熱貫流率、修正日射熱取得率、室内表面熱流を求める関数
@@ -182,6 +188,7 @@ def get_vent_wall_performance_factor_by_simplified_calculation_no_03(parm: vw.Pa
     return h_cv, h_rv, u_dash, eta_dash, q_room_side
 
 
+@wall_status_cache.memoize
 def get_vent_wall_performance_factor_by_simplified_calculation_no_04(parm: vw.Parameters, h_out: float):
     """
     簡易計算法案No.4：簡易計算法案No.3をさらに簡略化
@@ -234,6 +241,384 @@ def get_vent_wall_performance_factor_by_simplified_calculation_no_04(parm: vw.Pa
     return h_cv, h_rv, u_dash, eta_dash, q_room_side
 
 
+def get_simplified_heat_transfer_coefficient_array(parm: vw.ParameterBatch) -> tuple:
+    """
+    簡易計算法案No.1～4で用いる対流熱伝達率、放射熱伝達率を計算する（複数ケース分）
+    室内温度が20.0degCのケースは冬期条件、それ以外のケースは夏期条件の簡易計算とする
+
+    :param parm:    計算条件パラメータ群（複数ケース分）
+    :return:        対流熱伝達率 (N,)[W/(m2・K)], 放射熱伝達率 (N,)[W/(m2・K)]
+    """
+
+    # 有効放射率の計算
+    effective_emissivity = htc.effective_emissivity_parallel_array(parm.emissivity_1, parm.emissivity_2)
+
+    # 対流熱伝達率、放射熱伝達率の計算
+    is_winter = parm.theta_r == 20.0
+    h_cv = np.where(is_winter,
+                    htc.convective_heat_transfer_coefficient_simplified_winter(v_a=parm.v_a),
+                    htc.convective_heat_transfer_coefficient_simplified_summer(v_a=parm.v_a))
+    h_rv = np.where(is_winter,
+                    htc.radiative_heat_transfer_coefficient_simplified_winter(effective_emissivity=effective_emissivity),
+                    htc.radiative_heat_transfer_coefficient_simplified_summer(effective_emissivity=effective_emissivity))
+
+    return h_cv, h_rv
+
+
+def get_epc_s_array(parm: vw.ParameterBatch, h_cv: np.ndarray) -> tuple:
+    """
+    簡易計算法案No.1、No.3、No.4で用いる通気層の平均空気温度の計算用の値を計算する（複数ケース分）
+
+    :param parm:    計算条件パラメータ群（複数ケース分）
+    :param h_cv:    対流熱伝達率 (N,)[W/(m2・K)]
+    :return:        通気があるかどうか (N,), 通気層の平均空気温度の計算用の値 (N,)（通気がない場合はゼロ）
+    """
+
+    # 通気がない場合は、ゼロ除算を避けるため通気風量を仮の値とする
+    is_vent = parm.v_a > 0.0
+    v_vent = np.where(is_vent, parm.v_a * parm.l_d * parm.l_w, 1.0)
+
+    beta = (2 * h_cv * parm.l_w) / (get_c_air(parm.theta_e) * get_rho_air(parm.theta_e) * v_vent)
+    epc_s = np.where(is_vent, 1.0 / parm.l_h * 1.0 / beta * (np.exp(-beta * parm.l_h) - 1), 0.0)
+
+    return is_vent, epc_s
+
+
+def get_vent_wall_temperature_by_simplified_calculation_no_01_array(parm: vw.ParameterBatch, h_out: float) -> tuple:
+    """
+    簡易計算法案No.1：簡易版の行列式により各部位の温度を求める関数（複数ケース分）
+    各ケースの3×3の連立一次方程式をまとめて解く
+
+    :param parm:    計算条件パラメータ群（複数ケース分）
+    :param h_out:   室外側総合熱伝達率[W/(m2・K)]
+    :return:        各部位の温度 (N,3)[degC], 対流熱伝達率 (N,)[W/(m2・K)], 放射熱伝達率 (N,)[W/(m2・K)], 室内側から通気層表面までの熱抵抗 (N,)[(m2・K)/W]
+    """
+
+    # 相当外気温度を計算
+    theta_SAT = epf.get_theta_SAT(theta_e=parm.theta_e, a_surf=parm.a_surf, j_surf=parm.J_surf, h_out=h_out)
+
+    # 対流熱伝達率、放射熱伝達率の計算
+    h_cv, h_rv = get_simplified_heat_transfer_coefficient_array(parm)
+
+    # 通気層の平均空気温度の計算用の値を設定
+    _, epc_s = get_epc_s_array(parm, h_cv)
+
+    # 熱抵抗を設定
+    R_o = epf.get_r_o(parm.C_1)
+    R_i = epf.get_r_i(parm.C_2)
+
+    # 行列に値を設定
+    n_case = len(parm.theta_e)
+    matrix_coeff = np.zeros(shape=(n_case, 3, 3))
+    matrix_const = np.zeros(shape=(n_case, 3))
+    matrix_coeff[:, 0, 0] = 1.0/R_o + h_cv + h_rv
+    matrix_coeff[:, 0, 1] = -h_cv
+    matrix_coeff[:, 0, 2] = -h_rv
+    matrix_coeff[:, 1, 0] = (1.0 + epc_s)/2.0
+    matrix_coeff[:, 1, 1] = -1.0
+    matrix_coeff[:, 1, 2] = (1.0 + epc_s)/2.0
+    matrix_coeff[:, 2, 0] = -h_rv
+    matrix_coeff[:, 2, 1] = -h_cv
+    matrix_coeff[:, 2, 2] = 1.0/R_i + h_cv + h_rv
+
+    matrix_const[:, 0] = (1.0/R_o) * theta_SAT
+    matrix_const[:, 1] = epc_s * parm.theta_e
+    matrix_const[:, 2] = (1.0/R_i) * parm.theta_r
+
+    # 各部位の温度を計算
+    matrix_temp = np.linalg.solve(matrix_coeff, matrix_const[:, :, np.newaxis])[:, :, 0]
+
+    return matrix_temp, h_cv, h_rv, R_i
+
+
+def get_vent_wall_temperature_by_simplified_calculation_no_02_array(parm: vw.ParameterBatch, h_out: float) -> tuple:
+    """
+    簡易計算法案No.2：簡易式により通気層の平均温度を求める関数（複数ケース分）
+
+    :param parm:    計算条件パラメータ群（複数ケース分）
+    :param h_out:   室外側総合熱伝達率[W/(m2・K)]
+    :return:        通気層の平均温度 (N,)[degC], 室外側から通気層までの熱貫流率 (N,)[W/(m2・K)], 室内側から通気層までの熱貫流率 (N,)[W/(m2・K)]
+    """
+
+    # 相当外気温度を計算
+    theta_sat = epf.get_theta_SAT(theta_e=parm.theta_e, a_surf=parm.a_surf, j_surf=parm.J_surf, h_out=h_out)
+
+    # 対流熱伝達率、放射熱伝達率の計算
+    h_cv, h_rv = get_simplified_heat_transfer_coefficient_array(parm)
+
+    # 室外側から通気層までの熱貫流率、室内側から通気層までの熱貫流率を計算
+    u_o = epf.get_u_o(parm.C_1, h_cv, h_rv)
+    u_i = epf.get_u_i(parm.C_2, h_cv, h_rv)
+
+    # theta_weを計算
+    theta_we = (u_o * theta_sat + u_i * parm.theta_r) / (u_o + u_i)
+
+    # 通気風量の計算（通気がない場合は、ゼロ除算を避けるため仮の値とする）
+    is_vent = parm.v_a > 0.0
+    v_vent = np.where(is_vent, parm.v_a * parm.l_d * parm.l_w, 1.0)
+
+    # 通気層の平均空気温度の計算用の値を設定
+    w_h = (u_o + u_i) / (get_c_air(parm.theta_e) * get_rho_air(parm.theta_e) * v_vent)
+    epc = 1.0 - np.exp(-w_h * parm.l_h)
+    x = np.where(is_vent, 1.0 - epc / (w_h * parm.l_h), 1.0)
+
+    theta_as_ave = (1.0 - x) * parm.theta_e + x * theta_we
+
+    return theta_as_ave, u_o, u_i
+
+
+def get_vent_wall_performance_factor_by_simplified_calculation_no_03_array(parm: vw.ParameterBatch, h_out: float) -> tuple:
+    """
+    簡易計算法案No.3：通気層を有する壁体の修正熱貫流率、修正日射熱取得率、室内表面熱流を求める関数（複数ケース分）
+
+    :param parm:    計算条件パラメータ群（複数ケース分）
+    :param h_out:   室外側総合熱伝達率[W/(m2・K)]
+    :return:        対流熱伝達率 (N,)[W/(m2・K)], 放射熱伝達率 (N,)[W/(m2・K)], 修正熱貫流率 (N,)[W/(m2・K)], 修正日射熱取得率 (N,)[-], 室内表面熱流 (N,)[W/m2]
+    """
+
+    # 対流熱伝達率、放射熱伝達率の計算
+    h_cv, h_rv = get_simplified_heat_transfer_coefficient_array(parm)
+
+    # 熱伝達率の計算
+    h_v = 2.0 * h_rv + h_cv
+
+    # 通気層の熱抵抗の値を設定（通気がない場合の値は使用しない）
+    is_vent, epc_s = get_epc_s_array(parm, h_cv)
+    epc_s = np.where(is_vent, epc_s, -0.5)
+    epc_s_dash = - ((2.0 * h_cv) * epc_s) / (1.0 + epc_s)
+    h_v_dash = np.where(is_vent, h_v + 1.0 / ((1.0 / epc_s_dash) + h_rv / (h_v * h_cv)), h_v)
+
+    # 熱抵抗を設定
+    u_o_s = 1.0 / epf.get_r_o(parm.C_1)
+    u_i_s = 1.0 / epf.get_r_i(parm.C_2)
+
+    # 修正U値を計算
+    buf_x = h_v_dash - (h_v ** 2 / (u_o_s + h_v))
+    u_dash = 1.0 / (1.0 / buf_x + 1.0 / h_v + 1.0 / u_i_s)
+
+    # 修正η値を計算
+    r_l = 1.0 / u_o_s + 1.0 / h_v
+    r_r1 = 1.0 / u_i_s + 1.0 / h_v
+    r_r2 = 1.0 / epc_s_dash + h_rv / (h_v * h_cv)
+    eta_dash = np.where(is_vent,
+                        r_r2 / (r_l * r_r1 + r_l * r_r2 + r_r1 * r_r2) * (parm.a_surf / h_out),
+                        1.0 / (r_l + r_r1) * (parm.a_surf / h_out))
+
+    # 室内表面熱流を計算
+    q_room_side = u_dash * (parm.theta_e - parm.theta_r) + eta_dash * parm.J_surf
+
+    return h_cv, h_rv, u_dash, eta_dash, q_room_side
+
+
+def get_vent_wall_performance_factor_by_simplified_calculation_no_04_array(parm: vw.ParameterBatch, h_out: float) -> tuple:
+    """
+    簡易計算法案No.4：簡易計算法案No.3をさらに簡略化（複数ケース分）
+
+    :param parm:    計算条件パラメータ群（複数ケース分）
+    :param h_out:   室外側総合熱伝達率[W/(m2・K)]
+    :return:        対流熱伝達率 (N,)[W/(m2・K)], 放射熱伝達率 (N,)[W/(m2・K)], 修正熱貫流率 (N,)[W/(m2・K)], 修正日射熱取得率 (N,)[-], 室内表面熱流 (N,)[W/m2]
+    """
+
+    # 対流熱伝達率、放射熱伝達率の計算
+    h_cv, h_rv = get_simplified_heat_transfer_coefficient_array(parm)
+
+    # 熱抵抗を設定
+    u_o_s = 1.0 / epf.get_r_o(parm.C_1)
+    u_i_s = 1.0 / epf.get_r_i(parm.C_2)
+
+    # 通気層の平均空気温度の計算用の値を設定（通気がない場合の値は使用しない）
+    is_vent, epc_s = get_epc_s_array(parm, h_cv)
+    epc_s = np.where(is_vent, epc_s, -0.5)
+    epc_s_dash = - ((2.0 * h_cv) * epc_s) / (1 + epc_s)
+    r_u = np.where(is_vent,
+                   1.0 / ((1.0 / (1.0 / u_o_s + 1.0 / h_rv)) + (1.0 / (1.0 / epc_s_dash + 1.0 / h_cv))) + 1.0 / u_i_s,
+                   1.0 / ((1.0 / (1.0 / u_o_s + 1.0 / h_rv)) + (1.0 / (1.0 / h_cv))) + 1.0 / u_i_s)
+    r_eta = np.where(is_vent,
+                     1.0 / ((1.0 / (1.0 / u_i_s + 1.0 / h_rv)) + (1.0 / (1.0 / epc_s_dash + 1.0 / h_cv))) + 1.0 / u_o_s,
+                     1.0 / ((1.0 / (1.0 / u_i_s + 1.0 / h_rv)) + (1.0 / (1.0 / h_cv))) + 1.0 / u_o_s)
+
+    # 修正U値を計算
+    u_dash = 1.0 / r_u
+
+    # 修正η値を計算
+    eta_dash = 1.0 / r_eta
+
+    # 室内表面熱流を計算
+    q_room_side = u_dash * (parm.theta_e - parm.theta_r) + eta_dash * parm.J_surf
+
+    return h_cv, h_rv, u_dash, eta_dash, q_room_side
+
+
+@dataclass(frozen=True)
+class WallResponse:
+    """
+    通気層を有する壁体の応答係数（季節、通気層の平均風速の区分ごとの修正熱貫流率、修正日射熱取得率）
+    室内表面熱流は q_room_side = U'・(θe - θr) + η'・J で求める（get_room_side_heat_flow_by_wall_response）
+    """
+
+    # 通気層の平均風速の区分の代表値 (B,), m/s（昇順）
+    v_a_values: np.ndarray
+
+    # 対流熱伝達率 (2,B), W/(m2・K)（1次元目は季節。0：冬期、1：夏期）
+    h_cv: np.ndarray
+
+    # 放射熱伝達率 (2,B), W/(m2・K)
+    h_rv: np.ndarray
+
+    # 修正熱貫流率 (2,B), W/(m2・K)
+    u_dash: np.ndarray
+
+    # 修正日射熱取得率 (2,B), -
+    eta_dash: np.ndarray
+
+    def __post_init__(self):
+        # キャッシュしたインスタンスの配列が書き換えられないようにする
+        for name in ('v_a_values', 'h_cv', 'h_rv', 'u_dash', 'eta_dash'):
+            values = np.array(getattr(self, name), dtype=float)
+            values.flags.writeable = False
+            object.__setattr__(self, name, values)
+
+
+def get_wall_response(parm: vw.Parameters, h_out: float, v_a_values: tuple = None,
+                      calc_method: str = "no_03") -> WallResponse:
+    """
+    壁体の構成ごとに、季節、通気層の平均風速の区分ごとの修正熱貫流率、修正日射熱取得率を求める
+    同じ壁体の構成、室外側総合熱伝達率、区分、計算方法に対する計算結果はキャッシュする
+
+    修正熱貫流率、修正日射熱取得率は空気の密度を通して外気温度にも依存するが、parmの外気温度（基準値）で代表させる。
+    parmの室内温度、日射量、通気層の平均風速は使用しない。
+
+    :param parm:        壁体の計算条件パラメータ群（外気温度は空気の密度の計算に用いる基準値）
+    :param h_out:       室外側総合熱伝達率, W/(m2・K)
+    :param v_a_values:  通気層の平均風速の区分の代表値, m/s（Noneの場合はparmの通気層の平均風速のみ）
+    :param calc_method: 計算方法
+                        "no_03": 簡易計算法案No.3
+                        "no_04": 簡易計算法案No.4
+    :return:            壁体の応答係数
+    """
+
+    if v_a_values is None:
+        v_a_values = (parm.v_a,)
+
+    # 季節、通気層の平均風速の区分によらない値に揃えてキャッシュを参照する
+    parm_construction = replace(parm, theta_r=20.0, J_surf=0.0, v_a=0.0)
+
+    return _get_wall_response(parm_construction, float(h_out), tuple(sorted(float(v_a) for v_a in v_a_values)),
+                              calc_method)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_wall_response(parm: vw.Parameters, h_out: float, v_a_values: tuple, calc_method: str) -> WallResponse:
+    """
+    壁体の応答係数を求める（get_wall_responseのキャッシュ用）
+
+    :param parm:        壁体の計算条件パラメータ群（室内温度、日射量、通気層の平均風速は使用しない）
+    :param h_out:       室外側総合熱伝達率, W/(m2・K)
+    :param v_a_values:  通気層の平均風速の区分の代表値, m/s（昇順）
+    :param calc_method: 計算方法（get_wall_responseを参照）
+    :return:            壁体の応答係数
+    """
+
+    if calc_method == "no_03":
+        calc_function = get_vent_wall_performance_factor_by_simplified_calculation_no_03_array
+    elif calc_method == "no_04":
+        calc_function = get_vent_wall_performance_factor_by_simplified_calculation_no_04_array
+    else:
+        raise ValueError("指定された計算方法は対象外です")
+
+    # 季節（冬期、夏期）と通気層の平均風速の区分の全組み合わせをまとめて計算する
+    parm_batch = vw.get_parameter_batch([replace(parm, theta_r=theta_r, v_a=v_a)
+                                         for theta_r in (20.0, 27.0) for v_a in v_a_values])
+    h_cv, h_rv, u_dash, eta_dash, _ = calc_function(parm_batch, h_out)
+
+    shape = (2, len(v_a_values))
+    return WallResponse(v_a_values=np.array(v_a_values), h_cv=h_cv.reshape(shape), h_rv=h_rv.reshape(shape),
+                        u_dash=u_dash.reshape(shape), eta_dash=eta_dash.reshape(shape))
+
+
+def get_wall_response_index(response: WallResponse, theta_r: np.ndarray, v_a: np.ndarray) -> tuple:
+    """
+    各時刻の季節、通気層の平均風速の区分の番号を求める
+    室内温度が20.0degCの時刻は冬期、それ以外の時刻は夏期とし、通気層の平均風速は代表値が最も近い区分とする
+
+    :param response:    壁体の応答係数
+    :param theta_r:     室内温度 (T,), degC
+    :param v_a:         通気層の平均風速 (T,), m/s
+    :return:            季節の番号 (T,), 通気層の平均風速の区分の番号 (T,)
+    """
+
+    theta_r, v_a = np.broadcast_arrays(np.asarray(theta_r, dtype=float), np.asarray(v_a, dtype=float))
+
+    index_season = np.where(theta_r == 20.0, 0, 1)
+    index_v_a = np.searchsorted((response.v_a_values[1:] + response.v_a_values[:-1]) / 2.0, v_a)
+
+    return index_season, index_v_a
+
+
+def get_room_side_heat_flow_by_wall_response(response: WallResponse, theta_e: np.ndarray, theta_r: np.ndarray,
+                                             j_surf: np.ndarray, v_a: np.ndarray) -> np.ndarray:
+    """
+    壁体の応答係数から、時系列の室内表面熱流を一括で求める
+
+    :param response:    壁体の応答係数
+    :param theta_e:     外気温度 (T,), degC
+    :param theta_r:     室内温度 (T,), degC
+    :param j_surf:      外気側表面に入射する日射量 (T,), W/m2
+    :param v_a:         通気層の平均風速 (T,), m/s
+    :return:            室内表面熱流 (T,), W/m2
+    """
+
+    index_season, index_v_a = get_wall_response_index(response, theta_r, v_a)
+
+    return response.u_dash[index_season, index_v_a] * (np.asarray(theta_e) - np.asarray(theta_r)) \
+        + response.eta_dash[index_season, index_v_a] * np.asarray(j_surf)
+
+
+def get_wall_response_error(response: WallResponse, parm: vw.Parameters, theta_e: np.ndarray, theta_r: np.ndarray,
+                            j_surf: np.ndarray, v_a: np.ndarray, calc_mode_h_cv: str, calc_mode_h_rv: str,
+                            h_out: float, h_in: float, n_sample: int = 100, seed: int = 0) -> tuple:
+    """
+    壁体の応答係数による室内表面熱流を、抽出した時刻について詳細計算（収束計算）の室内表面熱流と比較する
+
+    :param response:        壁体の応答係数
+    :param parm:            壁体の計算条件パラメータ群（外気温度、室内温度、日射量、通気層の平均風速は時系列の値に置き換える）
+    :param theta_e:         外気温度 (T,), degC
+    :param theta_r:         室内温度 (T,), degC
+    :param j_surf:          外気側表面に入射する日射量 (T,), W/m2
+    :param v_a:             通気層の平均風速 (T,), m/s
+    :param calc_mode_h_cv:  詳細計算の対流熱伝達率の計算モード
+    :param calc_mode_h_rv:  詳細計算の放射熱伝達率の計算モード
+    :param h_out:           室外側総合熱伝達率, W/(m2・K)
+    :param h_in:            室内側総合熱伝達率, W/(m2・K)
+    :param n_sample:        抽出する時刻数（時刻数以上の場合は全時刻）
+    :param seed:            抽出に用いる乱数のシード
+    :return:                抽出した時刻の番号 (S,), 応答係数による室内表面熱流 (S,)[W/m2],
+                            詳細計算の室内表面熱流 (S,)[W/m2], 詳細計算が収束したかどうか (S,)
+    """
+
+    theta_e, theta_r, j_surf, v_a = np.broadcast_arrays(*(np.asarray(values, dtype=float)
+                                                           for values in (theta_e, theta_r, j_surf, v_a)))
+
+    # 時刻を抽出
+    n_step = len(theta_e)
+    if n_sample >= n_step:
+        index = np.arange(n_step)
+    else:
+        index = np.sort(np.random.default_rng(seed).choice(n_step, size=n_sample, replace=False))
+
+    # 応答係数による室内表面熱流
+    q_response = get_room_side_heat_flow_by_wall_response(response, theta_e[index], theta_r[index], j_surf[index],
+                                                          v_a[index])
+
+    # 詳細計算の室内表面熱流
+    parm_batch = vw.get_parameter_batch([replace(parm, theta_e=theta_e[i], theta_r=theta_r[i], J_surf=j_surf[i],
+                                                 v_a=v_a[i]) for i in index.tolist()])
+    status = vw.get_wall_status_values_batch(parm_batch, calc_mode_h_cv, calc_mode_h_rv, h_out, h_in)
+    heat_flow = vw.get_heat_flow_batch(status.matrix_temp, parm_batch, status.h_cv, status.h_rv, h_out, h_in)
+
+    return index, q_response, heat_flow.q_4, status.is_optimize_succeed
+
+
 # デバッグ用
 # parm_1: vw.Parameters = vw.Parameters(10, 20, 500, 1.0, 50.25, 2.55, 3.0, 0.05, 0.05, 45.0, 0.5, 0.45, 0.9, 0.9)
 # temps = get_vent_wall_temperature(parm_1, h_out=25.0, h_in=9.0)
@@ -0,0 +1,510 @@
+import os
+import atexit
+import time
+import hashlib
+import sqlite3
+import functools
+import collections
+import numpy as np
+import global_number
+
+
+# 計算結果に影響するモジュール（ソースコードが変更された場合は、キャッシュした計算結果を無効とする）
+_MODEL_MODULE_FILES = ['ventilation_wall.py', 'heat_transfer_coefficient.py', 'global_number.py',
+                       'ventilation_wall_simplified.py']
+
+# キャッシュするget_wall_status_valuesの戻り値の項目名（WallStatusValuesと同じ順）
+_STATUS_NAMES = ['matrix_temp', 'matrix_heat_balance', 'h_cv', 'h_rv', 'is_optimize_succeed', 'optimize_status',
+                 'optimize_message', 'optimize_nfev', 'optimize_njev']
+
+
+@functools.lru_cache(maxsize=None)
+def get_model_version() -> str:
+    """
+    計算モデルのバージョン（計算結果に影響するモジュールのソースコードのハッシュ値）を取得する
+    ソースコードを変更した場合はバージョンが変わるため、変更前にキャッシュした計算結果は参照されない
+
+    :return: 計算モデルのバージョン（16進数の文字列）
+    """
+
+    directory = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha256()
+    for file_name in _MODEL_MODULE_FILES:
+        with open(os.path.join(directory, file_name), 'rb') as f:
+            digest.update(file_name.encode())
+            digest.update(f.read())
+
+    return digest.hexdigest()[:16]
+
+
+def get_cache_key(parm, calc_mode_h_cv: str, calc_mode_h_rv: str, h_out: float, h_in: float,
+                  model_version: str, **kwargs) -> str:
+    """
+    計算条件パラメータ群、計算モード、総合熱伝達率、計算モデルのバージョン、その他の計算条件から、キャッシュのキーを作成する
+    数値は16進数表記（float.hex）で丸めずに連結するため、値が1ビットでも異なる場合は別のキーとなる
+    空気の物性値表を使用している場合は、物性値表の範囲と刻み幅もキーに含める
+
+    :param parm:            計算条件パラメータ群（ventilation_wall.Parameters）
+    :param calc_mode_h_cv:  対流熱伝達率の計算モード
+    :param calc_mode_h_rv:  放射熱伝達率の計算モード
+    :param h_out:           室外側総合熱伝達率, W/(m2・K)
+    :param h_in:            室内側総合熱伝達率, W/(m2・K)
+    :param model_version:   計算モデルのバージョン
+    :param kwargs:          get_wall_status_valuesに渡すその他の計算条件（解法、初期値の設定方法など）
+    :return:                キャッシュのキー（SHA-256の16進数の文字列）
+    """
+
+    air_property_table = global_number.get_air_property_table()
+    if air_property_table is None:
+        air_property = "exact"
+    else:
+        air_property = ",".join(float(value).hex() for value in
+                                (air_property_table.t_min, air_property_table.t_max, air_property_table.resolution))
+
+    items = [model_version, calc_mode_h_cv, calc_mode_h_rv, float(h_out).hex(), float(h_in).hex(), air_property]
+    items += [float(value).hex() for value in vars(parm).values()]
+    items += ["%s=%r" % (name, kwargs[name]) for name in sorted(kwargs)]
+
+    return hashlib.sha256("|".join(items).encode()).hexdigest()
+
+
+class WallStatusCache:
+    """
+    get_wall_status_valuesの計算結果をSQLiteのデータベースファイルに保存し、同じ計算条件の再計算を省略するためのキャッシュ
+
+    キーは計算条件と計算モデルのバージョン（get_model_version）のハッシュ値とする。
+    保存、参照時刻の更新はメモリ上に溜めておき、一定件数ごと（またはflush、close）にまとめてデータベースに書き込む。
+    保存件数が上限を超えた場合は、最後に参照された時刻が古い順に削除する。
+    並列計算の各プロセスでは、データベースへの接続をプロセスごとに作成し直す（参照回数等はプロセスごとに集計する）。
+    """
+
+    def __init__(self, path: str = "wall_status_cache.sqlite", max_entries: int = 1000000, model_version: str = None,
+                 commit_interval: int = 1000):
+        """
+        :param path:            データベースファイルのパス
+        :param max_entries:     保存件数の上限（Noneの場合は上限なし）
+        :param model_version:   計算モデルのバージョン（Noneの場合はget_model_versionの値）
+        :param commit_interval: データベースにまとめて書き込む件数
+        """
+
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("保存件数の上限は1以上を指定してください")
+
+        self.path = path
+        self.max_entries = max_entries
+        self.model_version = get_model_version() if model_version is None else model_version
+        self.commit_interval = commit_interval
+
+        # 参照回数等の集計値
+        self.n_hit = 0
+        self.n_miss = 0
+        self.n_eviction = 0
+
+        # データベースに未書き込みの計算結果（キーごとの行）と、参照時刻
+        self._pending_rows = {}
+        self._pending_access = {}
+
+        self._connection = None
+        self._pid = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        データベースへの接続を取得する（未接続の場合、別のプロセスで作成した接続の場合は接続し直す）
+
+        :return: データベースへの接続
+        """
+
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=60.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("CREATE TABLE IF NOT EXISTS wall_status ("
+                               "key TEXT PRIMARY KEY, model_version TEXT, last_access REAL, "
+                               "matrix_temp BLOB, matrix_heat_balance BLOB, h_cv REAL, h_rv REAL, "
+                               "is_optimize_succeed INTEGER, optimize_status INTEGER, optimize_message TEXT, "
+                               "optimize_nfev INTEGER, optimize_njev INTEGER)")
+            connection.execute("CREATE INDEX IF NOT EXISTS wall_status_last_access ON wall_status (last_access)")
+            self._connection = connection
+            self._pid = os.getpid()
+
+        return self._connection
+
+    def get(self, key: str) -> dict:
+        """
+        キャッシュした計算結果を取得する
+
+        :param key: キャッシュのキー（get_cache_keyの戻り値）
+        :return:    計算結果（WallStatusValuesの項目名をキーとする辞書。キャッシュにない場合はNone）
+        """
+
+        row = self._pending_rows.get(key)
+        if row is None:
+            row = self._get_connection().execute("SELECT " + ", ".join(_STATUS_NAMES) + " FROM wall_status WHERE key = ?",
+                                                 (key,)).fetchone()
+            if row is None:
+                self.n_miss += 1
+                return None
+            self._pending_access[key] = time.time()
+            self._flush_if_needed()
+
+        self.n_hit += 1
+
+        # SQLiteはNaNをNULLとして保存するため、NaNに戻す
+        values = dict(zip(_STATUS_NAMES, row))
+        values['matrix_temp'] = np.frombuffer(values['matrix_temp'], dtype=float).copy()
+        values['matrix_heat_balance'] = np.frombuffer(values['matrix_heat_balance'], dtype=float).copy()
+        values['h_cv'] = np.nan if values['h_cv'] is None or np.isnan(values['h_cv']) else values['h_cv']
+        values['h_rv'] = np.nan if values['h_rv'] is None or np.isnan(values['h_rv']) else values['h_rv']
+        values['is_optimize_succeed'] = bool(values['is_optimize_succeed'])
+
+        return values
+
+    def put(self, key: str, status):
+        """
+        計算結果をキャッシュに保存する
+
+        :param key:     キャッシュのキー（get_cache_keyの戻り値）
+        :param status:  通気層の状態値（ventilation_wall.WallStatusValues）
+        :return: なし
+        """
+
+        self._pending_rows[key] = (np.asarray(status.matrix_temp, dtype=float).tobytes(),
+                                   np.asarray(status.matrix_heat_balance, dtype=float).tobytes(),
+                                   float(status.h_cv), float(status.h_rv), int(status.is_optimize_succeed),
+                                   int(status.optimize_status), str(status.optimize_message),
+                                   int(status.optimize_nfev), int(status.optimize_njev))
+        self._flush_if_needed()
+
+    def _flush_if_needed(self):
+        """
+        未書き込みの件数がcommit_intervalに達した場合に、データベースに書き込む
+
+        :return: なし
+        """
+
+        if len(self._pending_rows) + len(self._pending_access) >= self.commit_interval:
+            self.flush()
+
+    def flush(self):
+        """
+        未書き込みの計算結果、参照時刻をデータベースに書き込む
+        保存件数が上限を超えた場合は、最後に参照された時刻が古いものから削除する
+
+        :return: なし
+        """
+
+        if len(self._pending_rows) == 0 and len(self._pending_access) == 0:
+            return
+
+        connection = self._get_connection()
+        now = time.time()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany("INSERT OR REPLACE INTO wall_status VALUES (?, ?, ?" + ", ?" * len(_STATUS_NAMES) + ")",
+                                   [(key, self.model_version, now) + row for key, row in self._pending_rows.items()])
+            connection.executemany("UPDATE wall_status SET last_access = ? WHERE key = ?",
+                                   [(last_access, key) for key, last_access in self._pending_access.items()])
+            if self.max_entries is not None:
+                n_delete = connection.execute("SELECT COUNT(*) FROM wall_status").fetchone()[0] - self.max_entries
+                if n_delete > 0:
+                    connection.execute("DELETE FROM wall_status WHERE key IN "
+                                       "(SELECT key FROM wall_status ORDER BY last_access LIMIT ?)", (n_delete,))
+                    self.n_eviction += n_delete
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+        self._pending_rows.clear()
+        self._pending_access.clear()
+
+    def invalidate(self, is_all: bool = False) -> int:
+        """
+        キャッシュした計算結果を削除する
+
+        :param is_all:  すべての計算結果を削除するかどうか（Falseの場合は、計算モデルのバージョンが現在と異なる計算結果のみを削除する）
+        :return:        削除した件数
+        """
+
+        self.flush()
+        connection = self._get_connection()
+        if is_all:
+            cursor = connection.execute("DELETE FROM wall_status")
+        else:
+            cursor = connection.execute("DELETE FROM wall_status WHERE model_version != ?", (self.model_version,))
+
+        return cursor.rowcount
+
+    def get_statistics(self) -> dict:
+        """
+        キャッシュの参照回数等の集計値を取得する（未書き込みの計算結果はデータベースに書き込む）
+
+        :return: 参照して見つかった回数、見つからなかった回数、見つかった割合、上限超過により削除した件数、保存件数、ファイルサイズ（WALファイルを含む）, byte
+        """
+
+        self.flush()
+        n_entry = self._get_connection().execute("SELECT COUNT(*) FROM wall_status").fetchone()[0]
+        n_lookup = self.n_hit + self.n_miss
+
+        return {
+            'n_hit': self.n_hit,
+            'n_miss': self.n_miss,
+            'hit_ratio': self.n_hit / n_lookup if n_lookup > 0 else 0.0,
+            'n_eviction': self.n_eviction,
+            'n_entry': n_entry,
+            'file_size': sum(os.path.getsize(path) for path in (self.path, self.path + "-wal") if os.path.exists(path))
+        }
+
+    def reset_statistics(self):
+        """
+        キャッシュの参照回数等の集計値をゼロに戻す
+
+        :return: なし
+        """
+
+        self.n_hit = 0
+        self.n_miss = 0
+        self.n_eviction = 0
+
+    def close(self):
+        """
+        未書き込みの計算結果をデータベースに書き込み、データベースへの接続を閉じる
+
+        :return: なし
+        """
+
+        self.flush()
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+        self._pid = None
+
+
+# get_wall_status_valuesで使用するキャッシュ（Noneの場合はキャッシュを使用しない）
+_wall_status_cache = None
+
+
+def set_wall_status_cache(path: str = "wall_status_cache.sqlite", max_entries: int = 1000000) -> WallStatusCache:
+    """
+    計算結果のキャッシュを作成し、get_wall_status_valuesでキャッシュを使用するように設定する
+    総当たりパラメータの詳細計算（ventilation_wall_parametersの各計算関数）も、get_wall_status_valuesを介してキャッシュを使用する
+
+    :param path:        データベースファイルのパス
+    :param max_entries: 保存件数の上限（Noneの場合は上限なし）
+    :return:            作成したキャッシュ
+    """
+
+    global _wall_status_cache
+    if _wall_status_cache is not None:
+        _wall_status_cache.close()
+    _wall_status_cache = WallStatusCache(path, max_entries)
+
+    return _wall_status_cache
+
+
+def clear_wall_status_cache():
+    """
+    計算結果のキャッシュの使用を解除する（データベースファイルは削除しない）
+
+    :return: なし
+    """
+
+    global _wall_status_cache
+    if _wall_status_cache is not None:
+        _wall_status_cache.close()
+    _wall_status_cache = None
+
+
+def get_wall_status_cache() -> WallStatusCache:
+    """
+    get_wall_status_valuesで使用している計算結果のキャッシュを取得する
+
+    :return: キャッシュ（使用していない場合はNone）
+    """
+
+    return _wall_status_cache
+
+
+@atexit.register
+def _close_wall_status_cache():
+    """
+    終了時に、使用している計算結果のキャッシュの未書き込みの計算結果をデータベースに書き込む
+    （キャッシュを設定し直しても終了時の処理は1つのみとなるよう、モジュールの読み込み時に登録する）
+
+    :return: なし
+    """
+
+    if _wall_status_cache is not None:
+        _wall_status_cache.close()
+
+
+class LruMemo:
+    """
+    計算結果をメモリ上に保持する、件数上限付きのメモ（上限を超えた場合は、最後に参照されたのが最も古いものから削除する）
+    """
+
+    def __init__(self, capacity: int = 100000):
+        """
+        :param capacity:    保持する件数の上限
+        """
+
+        if capacity < 1:
+            raise ValueError("保持する件数の上限は1以上を指定してください")
+
+        self.capacity = capacity
+        self.n_hit = 0
+        self.n_miss = 0
+        self.n_eviction = 0
+        self._values = collections.OrderedDict()
+
+    def get(self, key):
+        """
+        保持している計算結果を取得する
+
+        :param key: キー（ハッシュ可能な値）
+        :return:    計算結果（保持していない場合はNone）
+        """
+
+        value = self._values.get(key)
+        if value is None:
+            self.n_miss += 1
+        else:
+            self.n_hit += 1
+            self._values.move_to_end(key)
+
+        return value
+
+    def put(self, key, value):
+        """
+        計算結果を保持する（件数が上限を超えた場合は、最後に参照されたのが最も古いものを削除する）
+
+        :param key:     キー（ハッシュ可能な値）
+        :param value:   計算結果（変更できない値とすること）
+        :return: なし
+        """
+
+        self._values[key] = value
+        self._values.move_to_end(key)
+        if len(self._values) > self.capacity:
+            self._values.popitem(last=False)
+            self.n_eviction += 1
+
+    def get_statistics(self) -> dict:
+        """
+        参照回数等の集計値を取得する
+
+        :return: 参照して見つかった回数、見つからなかった回数、見つかった割合、上限超過により削除した件数、保持件数、保持件数の上限
+        """
+
+        n_lookup = self.n_hit + self.n_miss
+
+        return {
+            'n_hit': self.n_hit,
+            'n_miss': self.n_miss,
+            'hit_ratio': self.n_hit / n_lookup if n_lookup > 0 else 0.0,
+            'n_eviction': self.n_eviction,
+            'n_entry': len(self._values),
+            'capacity': self.capacity
+        }
+
+    def clear(self):
+        """
+        保持している計算結果と集計値を消去する
+
+        :return: なし
+        """
+
+        self._values.clear()
+        self.n_hit = 0
+        self.n_miss = 0
+        self.n_eviction = 0
+
+
+# メモを使用する関数名（get_wall_status_valuesと、memoizeを適用した関数）
+_memo_function_names = ['get_wall_status_values']
+
+# 関数名ごとのメモ（Noneの場合はメモを使用しない）
+_memos = None
+
+
+def memoize(function):
+    """
+    関数の計算結果をメモに保持するデコレータ（set_memoでメモの使用を設定した場合のみ使用する）
+    引数は計算条件パラメータ群（frozenのParameters）などのハッシュ可能な値とする（ハッシュできない場合はメモを使用しない）
+    戻り値に含まれる配列は、メモに保持した値が変更されないよう読み取り専用とする
+
+    :param function:    計算結果をメモに保持する関数
+    :return:            メモを参照する関数
+    """
+
+    name = function.__name__
+    _memo_function_names.append(name)
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if _memos is None:
+            return function(*args, **kwargs)
+
+        memo = _memos[name]
+        try:
+            key = (args, tuple(sorted(kwargs.items())))
+            value = memo.get(key)
+        except TypeError:
+            return function(*args, **kwargs)
+
+        if value is None:
+            value = function(*args, **kwargs)
+            for item in (value if isinstance(value, tuple) else (value,)):
+                if isinstance(item, np.ndarray):
+                    item.flags.writeable = False
+            memo.put(key, value)
+
+        return value
+
+    return wrapper
+
+
+def set_memo(capacity: int = 100000) -> dict:
+    """
+    get_wall_status_valuesと、memoizeを適用した関数（簡易計算法案No.1～4）で、計算結果のメモを使用するように設定する
+
+    :param capacity:    関数ごとに保持する件数の上限
+    :return:            関数名ごとのメモ
+    """
+
+    global _memos
+    _memos = {name: LruMemo(capacity) for name in _memo_function_names}
+
+    return _memos
+
+
+def clear_memo():
+    """
+    計算結果のメモの使用を解除し、保持している計算結果を消去する
+
+    :return: なし
+    """
+
+    global _memos
+    _memos = None
+
+
+def get_memo(name: str = 'get_wall_status_values') -> LruMemo:
+    """
+    関数の計算結果のメモを取得する
+
+    :param name:    関数名
+    :return:        メモ（使用していない場合はNone）
+    """
+
+    return None if _memos is None else _memos[name]
+
+
+def get_memo_statistics() -> dict:
+    """
+    関数ごとの計算結果のメモの参照回数等の集計値を取得する
+
+    :return: 関数名ごとの集計値（LruMemo.get_statisticsを参照。メモを使用していない場合は空の辞書）
+    """
+
+    return {} if _memos is None else {name: memo.get_statistics() for name, memo in _memos.items()}
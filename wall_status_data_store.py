@@ -0,0 +1,130 @@
+import os
+import glob
+import numpy as np
+import pandas as pd
+
+
+# 保存形式
+_FILE_FORMATS = ("npz", "npy", "parquet", "csv")
+
+# 元の行番号、列名の一覧の保存に用いるキー（計算結果の列名と重複しない名称とする）
+_INDEX_KEY = "__index__"
+_COLUMN_NAMES_KEY = "__column_names__"
+
+
+def get_partition_directory(directory: str, name: str, theta_r: float) -> str:
+    """
+    計算結果の区分（計算モード、室内温度）ごとの保存先のディレクトリ名を取得する
+
+    :param directory:   保存先のディレクトリ
+    :param name:        計算結果の名称（計算モード。CSVファイル名の"wall_status_data_frame_"に続く部分）
+    :param theta_r:     室内温度, degC（冬期条件は20.0、夏期条件は27.0）
+    :return:            ディレクトリ名
+    """
+
+    return os.path.join(directory, "name=" + name, "theta_r=" + repr(float(theta_r)))
+
+
+def dump_wall_status_data(df: pd.DataFrame, name: str, directory: str = ".",
+                          file_format: str = "npz"):
+    """
+    総当たりパラメータの計算結果を、計算モード、室内温度（季節）の区分ごとに列単位のバイナリ形式で保存する
+
+    :param df:          計算結果のDataFrame（ventilation_wall_parametersの各計算関数の戻り値）
+    :param name:        計算結果の名称（計算モード。CSVファイル名の"wall_status_data_frame_"に続く部分）
+    :param directory:   保存先のディレクトリ
+    :param file_format: 保存形式
+                        "npz": 列ごとの配列を圧縮して1ファイルに保存（列単位で読み込み可能）
+                        "npy": 列ごとに1ファイルで保存（圧縮なし、読み書きが最も速い）
+                        "parquet": Parquet形式で保存（pyarrowが必要）
+                        "csv": 従来どおり1つのCSVファイルに保存（区分しない）
+    :return: なし
+    """
+
+    if file_format not in _FILE_FORMATS:
+        raise ValueError("指定された保存形式は対象外です")
+
+    if file_format == "csv":
+        os.makedirs(directory, exist_ok=True)
+        df.to_csv(os.path.join(directory, "wall_status_data_frame_" + name + ".csv"))
+        return
+
+    if _INDEX_KEY in df.columns or _COLUMN_NAMES_KEY in df.columns:
+        raise ValueError("列名 " + _INDEX_KEY + "、" + _COLUMN_NAMES_KEY + " は保存に使用するため指定できません")
+
+    for theta_r, df_partition in df.groupby('theta_r', sort=True):
+
+        partition_directory = get_partition_directory(directory, name, theta_r)
+        os.makedirs(partition_directory, exist_ok=True)
+
+        # 元の行番号と各列の配列（文字列はUnicodeの固定長配列）を用意
+        columns = {_INDEX_KEY: df_partition.index.to_numpy()}
+        for column_name in df_partition.columns:
+            values = df_partition[column_name].to_numpy()
+            if values.dtype == object:
+                values = values.astype(str)
+            columns[column_name] = values
+
+        if file_format == "npz":
+            np.savez_compressed(os.path.join(partition_directory, "columns.npz"), **columns)
+        elif file_format == "npy":
+            np.save(os.path.join(partition_directory, _COLUMN_NAMES_KEY + ".npy"), np.array(list(columns.keys())))
+            for column_name, values in columns.items():
+                np.save(os.path.join(partition_directory, column_name + ".npy"), values)
+        else:
+            df_partition.to_parquet(os.path.join(partition_directory, "columns.parquet"), compression="zstd")
+
+
+def load_wall_status_data(name: str, columns: list = None, theta_r: list = None, directory: str = ".",
+                          file_format: str = "npz") -> pd.DataFrame:
+    """
+    dump_wall_status_dataで保存した計算結果を、指定した列、区分のみ読み込む
+
+    :param name:        計算結果の名称（計算モード。CSVファイル名の"wall_status_data_frame_"に続く部分）
+    :param columns:     読み込む列名のリスト（Noneの場合は全列）
+    :param theta_r:     読み込む室内温度のリスト, degC（Noneの場合は全区分）
+    :param directory:   保存先のディレクトリ
+    :param file_format: 保存形式（dump_wall_status_dataを参照）
+    :return:            計算結果のDataFrame（インデックスは保存時の行番号）
+    """
+
+    if file_format not in _FILE_FORMATS:
+        raise ValueError("指定された保存形式は対象外です")
+
+    if file_format == "csv":
+        df = pd.read_csv(os.path.join(directory, "wall_status_data_frame_" + name + ".csv"), index_col=0)
+        if theta_r is not None:
+            df = df[df['theta_r'].isin(theta_r)]
+        return df if columns is None else df[columns]
+
+    if theta_r is None:
+        partition_directories = sorted(glob.glob(os.path.join(directory, "name=" + name, "theta_r=*")))
+    else:
+        partition_directories = [get_partition_directory(directory, name, value) for value in theta_r]
+    if len(partition_directories) == 0:
+        raise FileNotFoundError("計算結果が保存されていません: " + name)
+
+    df_partitions = []
+    for partition_directory in partition_directories:
+
+        if file_format == "npz":
+            # npzファイルは、参照した列のみを展開する
+            with np.load(os.path.join(partition_directory, "columns.npz")) as npz:
+                column_names = [column_name for column_name in npz.files if column_name != _INDEX_KEY] \
+                    if columns is None else columns
+                df_partition = pd.DataFrame({column_name: npz[column_name] for column_name in column_names},
+                                            index=npz[_INDEX_KEY])
+        elif file_format == "npy":
+            column_names = columns
+            if column_names is None:
+                column_names = np.load(os.path.join(partition_directory, _COLUMN_NAMES_KEY + ".npy")).tolist()
+                column_names.remove(_INDEX_KEY)
+            df_partition = pd.DataFrame({column_name: np.load(os.path.join(partition_directory, column_name + ".npy"))
+                                         for column_name in column_names},
+                                        index=np.load(os.path.join(partition_directory, _INDEX_KEY + ".npy")))
+        else:
+            df_partition = pd.read_parquet(os.path.join(partition_directory, "columns.parquet"), columns=columns)
+
+        df_partitions.append(df_partition)
+
+    return pd.concat(df_partitions).sort_index()